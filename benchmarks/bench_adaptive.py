@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Fixed versus adaptive concurrency against an overloadable mock portal.
+
+Usage:
+    python benchmarks/bench_adaptive.py --actions 600 --capacity 8 --slowdown 0.08
+
+The mock portal answers 429 beyond `--capacity` concurrent requests and adds
+`--load-latency` per request in flight. After `--slowdown-after` seconds its
+base latency is raised to `--slowdown` to show how the window reacts.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from erfassinator.action_processor import ActionProcessor  # noqa: E402
+from erfassinator.backend import FWPortalBackend  # noqa: E402
+from erfassinator.concurrency import AdaptiveLimiter  # noqa: E402
+from erfassinator.mock_portal import MockPortalConfig, MockPortalServer  # noqa: E402
+from erfassinator.transport import TransportConfig  # noqa: E402
+
+
+def run(mode: str, args: argparse.Namespace) -> None:
+    config = MockPortalConfig(
+        entries=args.actions,
+        latency=args.latency,
+        latency_jitter=args.latency / 4,
+        capacity=args.capacity,
+        load_latency=args.load_latency,
+    )
+    kind, _, count = mode.partition("-")
+    with MockPortalServer(config) as server:
+        limiter = None
+        if kind == "adaptive":
+            limiter = AdaptiveLimiter(initial=2, maximum=args.max_workers)
+            workers = args.max_workers
+        else:
+            workers = int(count)
+        backend = FWPortalBackend(url=server.url, transport=TransportConfig.for_workers(workers))
+        assert backend.login("admin", "admin"), "login failed"
+        entry_ids = [entry.id for page in backend.fetch_pages() for entry in page]
+
+        processor = ActionProcessor(backend, max_workers=workers, limiter=limiter)
+        slowdown = threading.Timer(
+            args.slowdown_after, server.portal.configure, kwargs={"latency": args.slowdown}
+        )
+        slowdown.start()
+        windows: list[int] = []
+        start = time.perf_counter()
+        results = processor.process_all(
+            entry_ids,
+            progress_callback=lambda current, total: limiter and windows.append(limiter.limit),
+        )
+        elapsed = time.perf_counter() - start
+        slowdown.cancel()
+
+    ok = sum(1 for success, _ in results.values() if success)
+    throttled = sum(1 for _, message in results.values() if "429" in message)
+    line = f"{mode:<12} {elapsed:7.2f}s {ok:>6} {throttled:>6} {len(results) / elapsed:8.1f}"
+    if limiter is not None:
+        line += f"  Fenster Ø {sum(windows) / len(windows):.1f}, Ende {limiter.limit}"
+    print(line)
+    if limiter is not None and args.verbose:
+        for decision in limiter.decisions():
+            print(f"{'':<12} {decision.previous:>3} -> {decision.limit:<3} {decision.reason}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, default=600, help="zu erfassende Berichte")
+    parser.add_argument("--latency", type=float, default=0.01, help="Sekunden pro Anfrage")
+    parser.add_argument("--load-latency", type=float, default=0.002)
+    parser.add_argument("--capacity", type=int, default=8, help="gleichzeitig bediente Anfragen")
+    parser.add_argument("--slowdown", type=float, default=0.08, help="Latenz nach der Verlangsamung")
+    parser.add_argument("--slowdown-after", type=float, default=1.0, help="Sekunden bis zur Verlangsamung")
+    parser.add_argument("--max-workers", type=int, default=16, help="Obergrenze des adaptiven Fensters")
+    parser.add_argument("--modes", default="fixed-2,fixed-16,adaptive", help="kommagetrennt: fixed-N, adaptive")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Entscheidungen ausgeben")
+    args = parser.parse_args()
+
+    print(f"{'mode':<12} {'time':>8} {'ok':>6} {'429':>6} {'req/s':>8}")
+    for mode in args.modes.split(","):
+        run(mode, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""End-to-end throughput of the portal backends against the mock portal.
+
+Usage:
+    python benchmarks/bench_backend.py --entries 2000 --actions 300 --latency 0.03
+
+For each processor mode a fresh mock portal is started; the run reports login
+and fetch time plus apply_action throughput and latency percentiles.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from erfassinator.action_processor import ActionProcessor  # noqa: E402
+from erfassinator.backend import FWPortalBackend  # noqa: E402
+from erfassinator.mock_portal import MockPortalConfig, MockPortalServer  # noqa: E402
+from erfassinator.transport import TransportConfig  # noqa: E402
+
+
+def percentile(samples: list[float], q: int) -> float:
+    """Return the q-th percentile of `samples`."""
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+
+def timed_sync(backend: Any, samples: list[float]):
+    """Record the duration of every apply_action call."""
+    apply_action = backend.apply_action
+
+    def wrapper(entry_id: int) -> bool:
+        start = time.perf_counter()
+        try:
+            return apply_action(entry_id)
+        finally:
+            samples.append(time.perf_counter() - start)
+
+    backend.apply_action = wrapper
+
+
+def timed_async(backend: Any, samples: list[float]):
+    """Record the duration of every awaited apply_action call."""
+    apply_action = backend.apply_action
+
+    async def wrapper(entry_id: int) -> bool:
+        start = time.perf_counter()
+        try:
+            return await apply_action(entry_id)
+        finally:
+            samples.append(time.perf_counter() - start)
+
+    backend.apply_action = wrapper
+
+
+def run_sync(url: str, workers: int, actions: int) -> dict:
+    backend = FWPortalBackend(url=url, transport=TransportConfig.for_workers(workers))
+    result = {}
+
+    start = time.perf_counter()
+    assert backend.login("admin", "admin"), "login failed"
+    result["login"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    entries = [entry for page in backend.fetch_pages() for entry in page]
+    result["fetch"] = time.perf_counter() - start
+
+    samples: list[float] = []
+    timed_sync(backend, samples)
+    processor = ActionProcessor(backend, max_workers=workers)
+    start = time.perf_counter()
+    outcomes = processor.process_all([entry.id for entry in entries[:actions]])
+    result["apply"] = time.perf_counter() - start
+    result["samples"] = samples
+    result["ok"] = sum(1 for success, _ in outcomes.values() if success)
+    result["transport"] = backend.transport_stats.snapshot()
+    return result
+
+
+def run_async(url: str, concurrency: int, actions: int) -> dict:
+    from erfassinator.async_backend import AsyncFWPortalBackend
+
+    async def run() -> dict:
+        backend = AsyncFWPortalBackend(max_connections=concurrency, url=url)
+        result = {}
+
+        start = time.perf_counter()
+        assert await backend.login("admin", "admin"), "login failed"
+        result["login"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        entries = [entry async for page in backend.fetch_pages() for entry in page]
+        result["fetch"] = time.perf_counter() - start
+
+        samples: list[float] = []
+        timed_async(backend, samples)
+        processor = ActionProcessor(backend, max_workers=concurrency)
+        start = time.perf_counter()
+        outcomes = await processor.process_all_async([entry.id for entry in entries[:actions]])
+        result["apply"] = time.perf_counter() - start
+        result["samples"] = samples
+        result["ok"] = sum(1 for success, _ in outcomes.values() if success)
+        await backend.logout()
+        return result
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000, help="Berichte im Mock-Portal")
+    parser.add_argument("--actions", type=int, default=200, help="zu erfassende Berichte")
+    parser.add_argument("--latency", type=float, default=0.02, help="Sekunden pro Anfrage")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--modes",
+        default="sequential,threads-4,threads-16,async-16",
+        help="kommagetrennt: sequential, threads-N, async-N",
+    )
+    args = parser.parse_args()
+
+    config = MockPortalConfig(
+        entries=args.entries,
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+
+    print(f"{'mode':<12} {'login':>8} {'fetch':>8} {'apply':>8} {'ok':>6} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for mode in args.modes.split(","):
+        kind, _, count = mode.partition("-")
+        with MockPortalServer(config) as server:
+            try:
+                if kind == "sequential":
+                    result = run_sync(server.url, 1, args.actions)
+                elif kind == "threads":
+                    result = run_sync(server.url, int(count), args.actions)
+                elif kind == "async":
+                    result = run_async(server.url, int(count), args.actions)
+                else:
+                    raise SystemExit(f"unbekannter Modus: {mode}")
+            except RuntimeError as e:
+                print(f"{mode:<12} übersprungen: {e}")
+                continue
+
+        samples = result["samples"]
+        print(
+            f"{mode:<12} {result['login'] * 1000:7.0f}ms {result['fetch'] * 1000:7.0f}ms "
+            f"{result['apply']:7.2f}s {result['ok']:>6} {len(samples) / result['apply']:8.1f} "
+            f"{percentile(samples, 50) * 1000:6.0f}ms {percentile(samples, 95) * 1000:6.0f}ms "
+            f"{percentile(samples, 99) * 1000:6.0f}ms"
+        )
+        if "transport" in result:
+            stats = result["transport"]
+            print(
+                f"{'':<12} Verbindungen: {stats['connections_opened']} geöffnet, "
+                f"{stats['connections_reused']} wiederverwendet, {stats['retries']} Wiederholungen"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Compare the page field extractor with the former bs4 parse.
+
+Usage:
+    uv run --extra bench python benchmarks/bench_page_parser.py [recorded_page.html ...]
+
+Pass pages saved from the portal (e.g. a `GetUpdateEinsatzberichtStatus`
+response and the homepage). Without arguments a synthetic page of similar
+shape is used.
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from erfassinator.page_parser import extract_page_fields  # noqa: E402
+
+
+def synthetic_status_page(rows: int = 400) -> str:
+    """Build a page with navigation, a status form and trailing content."""
+    navigation = "".join(
+        f'<li class="nav-item"><a href="/Einsatz/Details/{i}">Einsatz {i}</a></li>'
+        for i in range(rows)
+    )
+    footer = "".join(
+        f"<tr><td>{i}</td><td>Fahrzeug {i}</td><td>&nbsp;</td></tr>"
+        for i in range(rows)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>FW Portal</title>"
+        '<script>var config = {"theme": "default"};</script></head><body>'
+        f'<nav><ul class="nav">{navigation}</ul></nav>'
+        '<form action="/einsatz/saveupdateeinsatzberichtstatus/4711'
+        '?status=100&amp;organisationid=1234" method="post">'
+        '<input name="__RequestVerificationToken" type="hidden" '
+        'value="CfDJ8Nq1Xy2Z_abcdefghijklmnopqrstuvwxyz0123456789" />'
+        '<textarea name="UpdateStatusBemerkung"></textarea></form>'
+        f"<table>{footer}</table></body></html>"
+    )
+
+
+def bs4_fields(page: str) -> tuple[str | None, str | None]:
+    """The parse performed by FWPortalBackend before the extractor existed."""
+    import bs4
+
+    parsed = bs4.BeautifulSoup(page, features="html.parser")
+    infield = parsed.find("input", attrs={"name": "__RequestVerificationToken"})
+    token = str(infield.attrs["value"]) if infield else None
+    search = re.search(r"organisationid=(\d+)", page)
+    return token, search.group(1) if search else None
+
+
+def bench(name: str, page: str, number: int):
+    streaming = timeit.timeit(lambda: extract_page_fields(page), number=number)
+    print(f"{name} ({len(page) / 1024:.0f} KB)")
+    print(f"  extractor: {streaming / number * 1e6:9.1f} µs/page")
+
+    try:
+        import bs4  # noqa: F401
+    except ImportError:
+        print("  bs4:       nicht installiert, Vergleich übersprungen")
+        return
+
+    if tuple(extract_page_fields(page)) != bs4_fields(page):
+        print("  WARNUNG: Ergebnisse unterscheiden sich!")
+    full = timeit.timeit(lambda: bs4_fields(page), number=number)
+    print(f"  bs4:       {full / number * 1e6:9.1f} µs/page")
+    print(f"  speedup:   {full / streaming:9.1f}x")
+
+
+def main():
+    number = 200
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            bench(path, Path(path).read_text(encoding="utf-8"), number)
+    else:
+        bench("synthetic status page", synthetic_status_page(), number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Inline parsing versus a process pool for the pages of `FWPortalBackend`.
+
+Usage:
+    python benchmarks/bench_parse.py --threads 1,4,16 --processes 4
+
+Worker threads parse the same pages once through `ParseExecutor` (in the
+thread, under the GIL) and once through `ProcessParseExecutor`. Status pages
+are padded with `--padding` KiB of markup in front of the form to mimic a
+full portal layout; grid pages hold `--rows` rows. The pool only wins once
+parsing a page costs more than the round trip to a worker process and
+enough cores are free.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from erfassinator.backend import (  # noqa: E402
+    ParseExecutor,
+    ProcessParseExecutor,
+    parse_grid_content,
+    parse_status_page,
+)
+from erfassinator.mock_portal import MockPortal, MockPortalConfig  # noqa: E402
+
+_LAYOUT_ROW = (
+    '<div class="row"><div class="col-md-4"><a href="/Einsatz/Details/4711" '
+    'class="btn btn-default">Einsatz</a></div><span class="label">Beschreibung</span></div>\n'
+)
+
+
+def status_page(padding_kib: int) -> bytes:
+    """A status page with the form after `padding_kib` KiB of layout markup."""
+    layout = _LAYOUT_ROW * (padding_kib * 1024 // len(_LAYOUT_ROW))
+    return (
+        f"<!DOCTYPE html><html><body>{layout}"
+        '<div class="modal"><form method="post" action="/einsatz/saveupdateeinsatzberichtstatus/'
+        '100001?status=100&amp;organisationid=4711">'
+        '<input name="__RequestVerificationToken" type="hidden" value="abcdefghijklmnop" />'
+        "</form></div></body></html>"
+    ).encode()
+
+
+def grid_page(rows: int) -> bytes:
+    """An `EinsatzGridAjax` response with `rows` rows."""
+    reports = MockPortal(MockPortalConfig(entries=rows)).reports
+    return json.dumps({"Data": reports, "Total": rows}).encode()
+
+
+def measure(
+    executor: ParseExecutor, parser: Callable[..., Any], content: bytes, pages: int, threads: int
+) -> float:
+    """Pages per second parsed by `threads` threads sharing `executor`."""
+    executor.run(parser, content, "utf-8")  # Start the pool outside the timing
+    remaining = iter(range(pages))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            executor.run(parser, content, "utf-8")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        for _ in range(threads):
+            pool.submit(worker)
+    return pages / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400, help="Seiten je Messung")
+    parser.add_argument("--threads", default="1,4,16", help="kommagetrennte Thread-Anzahlen")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Prozesse im Pool")
+    parser.add_argument("--padding", default="0,256", help="KiB Layout vor dem Formular (kommagetrennt)")
+    parser.add_argument("--rows", default="250,2000", help="Zeilen je Grid-Seite (kommagetrennt)")
+    args = parser.parse_args()
+
+    cases = [
+        (f"status +{kib} KiB", parse_status_page, status_page(int(kib)))
+        for kib in args.padding.split(",")
+    ] + [
+        (f"grid {rows} Zeilen", parse_grid_content, grid_page(int(rows)))
+        for rows in args.rows.split(",")
+    ]
+
+    inline = ParseExecutor()
+    pool = ProcessParseExecutor(args.processes)
+    print(f"{os.cpu_count()} CPUs, {args.processes} Prozesse")
+    print(f"{'page':<20} {'size':>9} {'threads':>7} {'inline/s':>10} {'pool/s':>10} {'pool/inline':>12}")
+    try:
+        for name, page_parser, content in cases:
+            for threads in map(int, args.threads.split(",")):
+                inline_rate = measure(inline, page_parser, content, args.pages, threads)
+                pool_rate = measure(pool, page_parser, content, args.pages, threads)
+                print(
+                    f"{name:<20} {len(content) // 1024:>6} KiB {threads:>7} "
+                    f"{inline_rate:>10.0f} {pool_rate:>10.0f} {pool_rate / inline_rate:>11.2f}x"
+                )
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
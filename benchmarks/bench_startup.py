@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Startup time of the .pyz build variants.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [archive.pyz ...]
+
+Without arguments the variants are built first (needs `uv`, like
+build_pyz.py): compressed sources only (the former build), stored with
+bytecode, and extract-to-cache. Each archive is timed for `--help` (launcher
+and argument parsing only) and for `batch --dry-run` against the mock portal,
+which imports `requests` and all non-GUI modules.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from erfassinator.mock_portal import MockPortalConfig, MockPortalServer  # noqa: E402
+
+VARIANTS = {
+    "compressed": {"compressed": True, "bytecode": False},
+    "stored+pyc": {"compressed": False, "bytecode": True},
+    "extract": {"compressed": False, "bytecode": True, "extract": True},
+}
+
+
+def build_variants() -> list[Path]:
+    """Build one archive per variant into dist/."""
+    from build_pyz import build_pyz
+
+    os.chdir(ROOT)
+    return [build_pyz(f"erfassinator-{name}.pyz", **options) for name, options in VARIANTS.items()]
+
+
+def time_run(command: list[str], env: dict[str, str]) -> float:
+    """Wall-clock seconds of one process run."""
+    start = time.perf_counter()
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def measure(command: list[str], env: dict[str, str], runs: int) -> tuple[float, float]:
+    """Duration of the first run and median of the following ones."""
+    first = time_run(command, env)
+    rest = [time_run(command, env) for _ in range(runs)]
+    return first, statistics.median(rest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("archives", nargs="*", type=Path, help="vorhandene .pyz-Dateien")
+    parser.add_argument("--runs", type=int, default=10, help="Wiederholungen je Messung")
+    args = parser.parse_args()
+
+    archives = args.archives or build_variants()
+
+    with tempfile.TemporaryDirectory() as cache, MockPortalServer(MockPortalConfig(entries=50)) as server:
+        env = dict(os.environ, ERFASSINATOR_USERNAME="admin", ERFASSINATOR_PASSWORD="admin")
+        env.pop("LOCALAPPDATA", None)
+        python = [sys.executable]
+
+        first, median = measure([*python, "-c", "pass"], env, args.runs)
+        print(f"{'archive':<32} {'size':>7} {'help 1st':>9} {'help':>7} {'batch 1st':>10} {'batch':>7}")
+        print(f"{'(python -c pass)':<32} {'':>7} {first * 1000:7.0f}ms {median * 1000:5.0f}ms")
+
+        for archive in archives:
+            # Every archive starts with an empty extraction cache
+            env["XDG_CACHE_HOME"] = str(Path(cache) / archive.stem)
+            help_first, help_median = measure([*python, str(archive), "--help"], env, args.runs)
+            batch_first, batch_median = measure(
+                [*python, str(archive), "batch", "--dry-run", "--url", server.url], env, args.runs
+            )
+            print(
+                f"{archive.name:<32} {archive.stat().st_size / 1024:6.0f}K "
+                f"{help_first * 1000:7.0f}ms {help_median * 1000:5.0f}ms "
+                f"{batch_first * 1000:8.0f}ms {batch_median * 1000:5.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Scenario runner: GUI rendering and batch throughput on synthetic data.
+
+Usage:
+    python benchmarks/bench_synthetic.py --sizes 1000,10000,100000 --latency 0.002
+
+For every size the batch mode runs end to end (`erfassinator --backend
+synthetic batch`, output discarded) and the main window shows the same
+number of rows via `_display_data`, including the chunked inserts, a sort by
+date and a search. The GUI part needs a display and is skipped without one.
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from erfassinator.cli import run_batch  # noqa: E402
+from erfassinator.entries import EntryCollection  # noqa: E402
+from erfassinator.main import build_parser  # noqa: E402
+from erfassinator.synthetic_backend import (  # noqa: E402
+    SyntheticBackend,
+    SyntheticConfig,
+    synthetic_entries,
+)
+
+
+class _LineSink:
+    """stdout replacement counting the JSON lines and keeping the last one."""
+
+    def __init__(self):
+        self.lines = 0
+        self.last = ""
+
+    def write(self, text: str) -> int:
+        self.lines += text.count("\n")
+        if text.strip():
+            self.last = text
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def run_batch_scenario(size: int, args: argparse.Namespace) -> dict[str, Any]:
+    """End-to-end batch run; rows per second of the whole run and of the actions."""
+    spec = (
+        f"entries={size},latency={args.latency},error_rate={args.error_rate},"
+        f"expiry_rate={args.expiry_rate},relogin_failure_rate={args.relogin_failure_rate},"
+        f"seed={args.seed}"
+    )
+    batch_args = build_parser().parse_args(
+        ["--backend", "synthetic", "--synthetic", spec, "batch", "--no-journal",
+         "--workers", str(args.workers)]
+    )
+    sink = _LineSink()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(sink):
+        exit_code = run_batch(batch_args)
+    elapsed = time.perf_counter() - start
+    summary = json.loads(sink.last)["summary"]
+    return {
+        "seconds": elapsed,
+        "processed": summary["total"],
+        "rows_per_s": size / elapsed,
+        "actions_per_s": summary["total"] / elapsed,
+        "exit": exit_code,
+    }
+
+
+def run_gui_scenario(size: int, args: argparse.Namespace) -> dict[str, float] | None:
+    """Seconds to display `size` rows, to sort them by date and to search them."""
+    import tkinter as tk
+
+    from erfassinator.main_window import MainWindow
+
+    class ScenarioWindow(MainWindow):
+        def _restore_session(self):
+            pass  # No login dialog; rows are displayed directly
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    window = ScenarioWindow(root, SyntheticBackend(SyntheticConfig(entries=0)))
+    entries = EntryCollection(synthetic_entries(SyntheticConfig(entries=size, seed=args.seed)))
+    try:
+        result = {}
+        start = time.perf_counter()
+        window._display_data(entries)
+        result["display_call"] = time.perf_counter() - start
+        while window._insert_scheduled:
+            root.update()
+        result["all_rows"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        window._sort_by("date")
+        root.update()
+        result["sort_date"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        window.search_var.set("keller 2024")
+        window._apply_search()
+        root.update()
+        result["search"] = time.perf_counter() - start
+        return result
+    finally:
+        window.background.stop()
+        root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="kommagetrennte Zeilenzahlen")
+    parser.add_argument("--latency", type=float, default=0.0, help="Median-Latenz je Anfrage in Sekunden")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Anteil 503-Antworten der Aktionen")
+    parser.add_argument("--expiry-rate", type=float, default=0.0, help="Anteil abgelaufener Sitzungen")
+    parser.add_argument(
+        "--relogin-failure-rate", type=float, default=0.0, help="Anteil abgelehnter Neuanmeldungen"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="gleichzeitig verarbeitete Berichte")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-gui", action="store_true", help="nur den Batch-Modus messen")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'batch s':>9} {'actions':>8} {'rows/s':>9} {'actions/s':>10}"
+          f" {'display':>9} {'all rows':>9} {'sort':>8} {'search':>8}")
+    gui_available = not args.no_gui
+    for size in map(int, args.sizes.split(",")):
+        batch = run_batch_scenario(size, args)
+        gui = run_gui_scenario(size, args) if gui_available else None
+        if gui is None and gui_available:
+            gui_available = False
+            print("GUI: kein Display, nur Batch-Modus gemessen", file=sys.stderr)
+        line = (
+            f"{size:>8} {batch['seconds']:>9.2f} {batch['processed']:>8} "
+            f"{batch['rows_per_s']:>9.0f} {batch['actions_per_s']:>10.0f}"
+        )
+        if gui is not None:
+            line += (
+                f" {gui['display_call'] * 1000:>7.0f}ms {gui['all_rows'] * 1000:>7.0f}ms"
+                f" {gui['sort_date'] * 1000:>6.0f}ms {gui['search'] * 1000:>6.0f}ms"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
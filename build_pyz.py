@@ -1,14 +1,109 @@
 #!/usr/bin/env python3
-"""Build .pyz/.pyzw files with all dependencies bundled."""
+"""Build .pyz/.pyzw files with all dependencies bundled.
 
+By default the archive is stored uncompressed and ships precompiled bytecode,
+so a launch neither inflates nor recompiles `requests`/`urllib3` and the app.
+Variants:
+
+    python3 build_pyz.py               # stored, with bytecode (default)
+    python3 build_pyz.py --extract     # unpacks once into a cache directory
+    python3 build_pyz.py --compressed --no-bytecode   # former behaviour
+"""
+
+import argparse
+import compileall
+import hashlib
+import py_compile
 import zipapp
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 
+DEPENDENCIES = ["requests>=2.32.5"]
+
+# Entry point of the regular archive
+MAIN = (
+    "from erfassinator.main import main\n"
+    "if __name__ == '__main__':\n"
+    "    main()\n"
+)
+
+# Entry point of the extract-to-cache archive. On first launch the archive is
+# unpacked into a per-build cache directory, later launches import from there
+# like from a normal installation (with __pycache__ bytecode).
+EXTRACT_MAIN = '''\
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+BUILD_ID = "{build_id}"
+
+
+def _cache_dir():
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    base = Path(base) if base else Path.home() / ".cache"
+    return base / "erfassinator" / BUILD_ID
+
+
+def _extract(archive, target):
+    if (target / ".complete").exists():
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(f"{{target.name}}.{{os.getpid()}}.tmp")
+    with zipfile.ZipFile(archive) as bundle:
+        bundle.extractall(partial)
+    (partial / ".complete").touch()
+    try:
+        partial.rename(target)
+    except OSError:
+        # Another launch finished first
+        import shutil
+        shutil.rmtree(partial, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    target = _cache_dir()
+    _extract(os.path.dirname(__file__), target)
+    sys.path[0] = str(target)
+    from erfassinator.main import main
+    main()
+'''
+
 
-def build_pyz(output_name: str):
+def compile_bytecode(path: Path, legacy: bool):
+    """Precompile all modules below `path`.
+
+    zipimport only looks at `module.pyc` next to the source (`legacy`), a
+    normal directory import only at `__pycache__`. Unchecked hash-based pycs
+    skip the source timestamp comparison, which zip entries cannot satisfy
+    reliably. Interpreters of another version ignore the bytecode and fall
+    back to the sources.
+    """
+    compileall.compile_dir(
+        path,
+        quiet=1,
+        legacy=legacy,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+
+
+def payload_hash(path: Path) -> str:
+    """Hash of all files below `path`, identifying one build."""
+    digest = hashlib.sha256()
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        digest.update(file.relative_to(path).as_posix().encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_pyz(
+    output_name: str,
+    compressed: bool = False,
+    bytecode: bool = True,
+    extract: bool = False,
+) -> Path:
     output_file = Path("dist") / output_name
     output_file.parent.mkdir(exist_ok=True)
 
@@ -16,7 +111,11 @@ def build_pyz(output_name: str):
         temp_path = Path(temp_dir)
 
         # Copy package
-        shutil.copytree("erfassinator", temp_path / "erfassinator")
+        shutil.copytree(
+            "erfassinator",
+            temp_path / "erfassinator",
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
 
         # Install dependencies
         subprocess.run(
@@ -26,35 +125,50 @@ def build_pyz(output_name: str):
                 "install",
                 "--target",
                 str(temp_path),
-                "requests>=2.32.5",
-                "beautifulsoup4>=4.12.0",
+                *DEPENDENCIES,
             ],
             check=True,
             capture_output=True,
         )
+        for cache in temp_path.rglob("__pycache__"):
+            shutil.rmtree(cache)
+
+        if bytecode:
+            compile_bytecode(temp_path, legacy=not extract)
 
         # Create entry point
-        (temp_path / "__main__.py").write_text(
-            "from erfassinator.main import main\n"
-            "if __name__ == '__main__':\n"
-            "    main()\n"
-        )
+        if extract:
+            main = EXTRACT_MAIN.format(build_id=payload_hash(temp_path))
+        else:
+            main = MAIN
+        (temp_path / "__main__.py").write_text(main)
 
         # Create archive
         zipapp.create_archive(
             temp_path,
             target=output_file,
             interpreter="/usr/bin/env python3",
-            compressed=True,
+            compressed=compressed,
         )
 
         print(f"✓ {output_file} ({output_file.stat().st_size / 1024:.0f} KB)")
         return output_file
 
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(description="Build .pyz/.pyzw files")
+    parser.add_argument("--compressed", action="store_true", help="deflate the archive")
+    parser.add_argument("--no-bytecode", dest="bytecode", action="store_false", help="ship sources only")
+    parser.add_argument("--extract", action="store_true", help="unpack into a cache directory on first launch")
+    args = parser.parse_args()
+    options = {"compressed": args.compressed, "bytecode": args.bytecode, "extract": args.extract}
+
     print("Building .pyz files...\n")
-    pyz = build_pyz("erfassinator.pyz")
+    pyz = build_pyz("erfassinator.pyz", **options)
     pyz.chmod(0o755)
-    build_pyz("erfassinator.pyzw")
+    build_pyz("erfassinator.pyzw", **options)
     print("\nDone!")
+
+
+if __name__ == "__main__":
+    main()
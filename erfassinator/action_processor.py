@@ -1,13 +1,108 @@
 """Action processor for executing actions on data entries."""
 
-from typing import Any, Callable
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+from urllib.parse import urlsplit
+
+from erfassinator.backend import SessionExpiredError, TransientBackendError
+from erfassinator.concurrency import AdaptiveLimiter
+from erfassinator.entries import DataEntry, EntryCollection
+from erfassinator.journal import ActionJournal
+
+# Callback receiving (entry_id, (success, message)) for every finished entry
+ResultCallback = Callable[[int, tuple[bool, str]], None]
+
+# Shared per-host request slots so that several processors talking to the
+# same portal never exceed the configured cap together. The first processor
+# using a host sets its cap; later ones share it whatever their own limit.
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _host_semaphore(host: str, limit: int) -> threading.BoundedSemaphore:
+    """Return the shared semaphore limiting requests to `host`."""
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(limit)
+        return _host_slots[host]
+
+
+def _as_id_list(entry_ids: Iterable[int] | EntryCollection) -> list[int]:
+    """Return the entry IDs to process as a list."""
+    if isinstance(entry_ids, EntryCollection):
+        return entry_ids.ids()
+    return list(entry_ids)
+
+
+def _outcome(entry_id: int, success: bool) -> tuple[bool, str]:
+    """Result tuple of an action that returned without raising."""
+    if success:
+        return True, f"Action applied to entry {entry_id}"
+    return False, f"Failed to apply action to entry {entry_id}"
+
+
+class ActionResults(dict[int, tuple[bool, str]]):
+    """Outcome of every processed entry, in input order.
+
+    `skipped` lists the entries left out because they did not need the
+    action; they have no outcome and cost no request.
+    """
+
+    def __init__(self, *args: Any, skipped: list[int] | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.skipped: list[int] = skipped or []
 
 
 class ActionProcessor:
     """Processes actions on data entries."""
 
-    def __init__(self, backend: Any):
+    def __init__(
+        self,
+        backend: Any,
+        max_workers: int = 1,
+        max_per_host: int | None = None,
+        journal: ActionJournal | None = None,
+        needs_action: Callable[[DataEntry], bool] | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ):
+        """
+        Args:
+            backend: Backend used to apply the actions
+            max_workers: Number of entries processed concurrently
+            max_per_host: Optional cap on concurrent requests per backend host,
+                shared by all processors (the first one to use a host sets it)
+            journal: Optional journal recording the outcome of every entry
+            needs_action: Optional predicate; entries of an `EntryCollection`
+                for which it is false are skipped without any request
+            limiter: Optional adaptive concurrency window; replaces the fixed
+                `max_workers` (its maximum sizes the thread pool)
+        """
         self.backend = backend
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max_per_host
+        self.journal = journal
+        self.needs_action = needs_action
+        self.limiter = limiter
+
+    def select(self, entry_ids: Iterable[int] | EntryCollection) -> tuple[list[int], list[int]]:
+        """
+        Split entries into those to process and those not needing the action.
+
+        Plain IDs carry no status and are always processed.
+
+        Returns:
+            (entry IDs to process, skipped entry IDs)
+        """
+        if self.needs_action is None or not isinstance(entry_ids, EntryCollection):
+            return _as_id_list(entry_ids), []
+        selected: list[int] = []
+        skipped: list[int] = []
+        for entry in entry_ids:
+            (selected if self.needs_action(entry) else skipped).append(entry.id)
+        return selected, skipped
 
     def process_single(self, entry_id: int) -> tuple[bool, str]:
         """
@@ -16,38 +111,350 @@ class ActionProcessor:
         Returns:
             (success: bool, message: str)
         """
+        return self._attempt(entry_id)[0]
+
+    async def process_single_async(self, entry_id: int) -> tuple[bool, str]:
+        """
+        Process action for a single entry on an `AsyncBackend`.
+
+        Returns:
+            (success: bool, message: str)
+        """
+        return (await self._attempt_async(entry_id))[0]
+
+    def process_entry(self, entry_id: int, ticket: int | None = None) -> tuple[bool, str]:
+        """
+        Process one entry within the host slots and the adaptive window.
+
+        Args:
+            entry_id: Entry to process
+            ticket: Slot of `limiter` the caller already acquired
+                (default: wait for one here)
+
+        Returns:
+            (success: bool, message: str)
+
+        Raises:
+            SessionExpiredError: The session expired and could not be
+                renewed; the action was not applied
+        """
+        return self._process_limited(entry_id, ticket, raise_expired=True)
+
+    async def process_entry_async(self, entry_id: int, ticket: int | None = None) -> tuple[bool, str]:
+        """
+        Process one entry on an `AsyncBackend`; the caller bounds concurrency.
+
+        Args:
+            entry_id: Entry to process
+            ticket: Slot of `limiter` the caller acquired; released here
+                with the outcome
+
+        Returns:
+            (success: bool, message: str)
+
+        Raises:
+            SessionExpiredError: As `process_entry`
+        """
+        start = time.perf_counter()
         try:
-            success = self.backend.apply_action(entry_id)
-            if success:
-                return True, f"Action applied to entry {entry_id}"
-            else:
-                return False, f"Failed to apply action to entry {entry_id}"
+            result, throttled = await self._attempt_async(entry_id, raise_expired=True)
+        except SessionExpiredError:
+            if self.limiter is not None and ticket is not None:
+                self.limiter.cancel(ticket)
+            raise
+        if self.limiter is not None and ticket is not None:
+            self.limiter.release(ticket, time.perf_counter() - start, result[0], throttled)
+        return result
+
+    def _attempt(
+        self, entry_id: int, raise_expired: bool = False
+    ) -> tuple[tuple[bool, str], bool]:
+        """Apply the action; returns the result and whether it was throttled."""
+        try:
+            return _outcome(entry_id, self.backend.apply_action(entry_id)), False
+        except TransientBackendError as e:
+            return (False, f"Error: {str(e)}"), True
+        except SessionExpiredError as e:
+            if raise_expired:
+                raise
+            return (False, f"Error: {str(e)}"), False
+        except Exception as e:
+            return (False, f"Error: {str(e)}"), False
+
+    async def _attempt_async(
+        self, entry_id: int, raise_expired: bool = False
+    ) -> tuple[tuple[bool, str], bool]:
+        """Coroutine counterpart of `_attempt`."""
+        try:
+            return _outcome(entry_id, await self.backend.apply_action(entry_id)), False
+        except TransientBackendError as e:
+            return (False, f"Error: {str(e)}"), True
+        except SessionExpiredError as e:
+            if raise_expired:
+                raise
+            return (False, f"Error: {str(e)}"), False
         except Exception as e:
-            return False, f"Error: {str(e)}"
+            return (False, f"Error: {str(e)}"), False
 
     def process_all(
+        self,
+        entry_ids: Iterable[int] | EntryCollection,
+        progress_callback: Callable[[int, int], None] | None = None,
+        result_callback: ResultCallback | None = None,
+        resume: bool = False,
+    ) -> ActionResults:
+        """
+        Process action for multiple entries.
+
+        Entries are processed by up to `max_workers` threads. The returned
+        dictionary keeps the order of `entry_ids` and the progress callback
+        always receives a strictly increasing `current` value. Entries
+        rejected by `needs_action` are only listed in `skipped`.
+
+        Args:
+            entry_ids: Entry IDs to process, or a collection of entries
+            progress_callback: Optional callback function(current, total)
+            result_callback: Optional callback function(entry_id, result),
+                called as soon as an entry is done
+            resume: Skip entries the journal already records as applied
+
+        Returns:
+            Dictionary mapping entry_id to (success, message)
+        """
+        entry_ids, not_needed = self.select(entry_ids)
+        applied, pending, result_callback = self._start_run(entry_ids, result_callback, resume)
+        results = self.process_ids(pending, progress_callback, result_callback)
+        return self._finish_run(entry_ids, applied, results, not_needed)
+
+    def process_ids(
         self,
         entry_ids: list[int],
         progress_callback: Callable[[int, int], None] | None = None,
+        result_callback: ResultCallback | None = None,
     ) -> dict[int, tuple[bool, str]]:
         """
-        Process action for multiple entries.
+        Process exactly the given entries, without status filter or journal.
+
+        Returns:
+            Dictionary mapping entry_id to (success, message)
+        """
+        if self.limiter is None and (self.max_workers == 1 or len(entry_ids) <= 1):
+            return self._process_sequential(entry_ids, progress_callback, result_callback)
+        return self._process_concurrent(entry_ids, progress_callback, result_callback)
+
+    async def process_all_async(
+        self,
+        entry_ids: Iterable[int] | EntryCollection,
+        progress_callback: Callable[[int, int], None] | None = None,
+        max_concurrency: int | None = None,
+        result_callback: ResultCallback | None = None,
+        resume: bool = False,
+    ) -> ActionResults:
+        """
+        Process action for multiple entries on an `AsyncBackend`.
+
+        All entries are scheduled on the running event loop; at most
+        `max_concurrency` (default: `max_per_host` or `max_workers`) actions
+        are in flight at once.
 
         Args:
-            entry_ids: List of entry IDs to process
+            entry_ids: Entry IDs to process, or a collection of entries
             progress_callback: Optional callback function(current, total)
+            max_concurrency: Optional limit of concurrent actions
+            result_callback: Optional callback function(entry_id, result)
+            resume: Skip entries the journal already records as applied
 
         Returns:
             Dictionary mapping entry_id to (success, message)
         """
+        entry_ids, not_needed = self.select(entry_ids)
+        applied, pending, result_callback = self._start_run(entry_ids, result_callback, resume)
+        outcomes = await self.process_ids_async(
+            pending, progress_callback, result_callback, max_concurrency
+        )
+        return self._finish_run(entry_ids, applied, outcomes, not_needed)
+
+    async def process_ids_async(
+        self,
+        entry_ids: list[int],
+        progress_callback: Callable[[int, int], None] | None = None,
+        result_callback: ResultCallback | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[int, tuple[bool, str]]:
+        """
+        Coroutine counterpart of `process_ids` for an `AsyncBackend`.
+
+        Returns:
+            Dictionary mapping entry_id to (success, message)
+        """
+        limit = max_concurrency or self.max_per_host or self.max_workers
+        slots = asyncio.Semaphore(limit)
+        # Woken whenever the adaptive window frees a slot
+        window = asyncio.Condition()
+        outcomes: dict[int, tuple[bool, str]] = {}
+        total = len(entry_ids)
+        completed = 0
+
+        async def attempt(entry_id: int) -> tuple[bool, str]:
+            limiter = self.limiter
+            if limiter is None:
+                async with slots:
+                    return await self.process_single_async(entry_id)
+            async with window:
+                ticket = await window.wait_for(limiter.try_acquire)
+            start = time.perf_counter()
+            result, throttled = await self._attempt_async(entry_id)
+            limiter.release(ticket, time.perf_counter() - start, result[0], throttled)
+            async with window:
+                window.notify_all()
+            return result
+
+        async def work(entry_id: int):
+            nonlocal completed
+            outcomes[entry_id] = await attempt(entry_id)
+            completed += 1
+            if result_callback:
+                result_callback(entry_id, outcomes[entry_id])
+            if progress_callback:
+                progress_callback(completed, total)
+
+        await asyncio.gather(*(work(entry_id) for entry_id in entry_ids))
+
+        return {entry_id: outcomes[entry_id] for entry_id in entry_ids}
+
+    def _start_run(
+        self,
+        entry_ids: list[int],
+        result_callback: ResultCallback | None,
+        resume: bool,
+    ) -> tuple[dict[int, tuple[bool, str]], list[int], ResultCallback | None]:
+        """
+        Open a journal run.
+
+        Returns:
+            (results of the entries the journal lists as applied, entry IDs
+            still to process, result callback that also writes the journal)
+        """
+        if self.journal is None:
+            return {}, entry_ids, result_callback
+
+        pending = self.journal.pending(entry_ids) if resume else entry_ids
+        applied = {}
+        if len(pending) != len(entry_ids):
+            waiting = set(pending)
+            for entry_id in entry_ids:
+                if entry_id not in waiting:
+                    applied[entry_id] = (True, f"Action already applied to entry {entry_id}")
+                    if result_callback:
+                        result_callback(entry_id, applied[entry_id])
+
+        journal = self.journal
+        journal.start_run(pending)
+
+        def record(entry_id: int, result: tuple[bool, str]):
+            journal.record(entry_id, result)
+            if result_callback:
+                result_callback(entry_id, result)
+
+        return applied, pending, record
+
+    def _finish_run(
+        self,
+        entry_ids: list[int],
+        applied: dict[int, tuple[bool, str]],
+        results: dict[int, tuple[bool, str]],
+        not_needed: list[int],
+    ) -> ActionResults:
+        """Close the journal run and merge the results in input order."""
+        if self.journal is not None:
+            self.journal.finish_run()
+        return ActionResults(
+            ((entry_id, applied.get(entry_id) or results[entry_id]) for entry_id in entry_ids),
+            skipped=not_needed,
+        )
+
+    def _process_sequential(
+        self,
+        entry_ids: list[int],
+        progress_callback: Callable[[int, int], None] | None,
+        result_callback: ResultCallback | None,
+    ) -> dict[int, tuple[bool, str]]:
+        """Process entries one after another on the calling thread."""
         results = {}
         total = len(entry_ids)
 
         for index, entry_id in enumerate(entry_ids, start=1):
-            results[entry_id] = self.process_single(entry_id)
+            results[entry_id] = self._process_limited(entry_id)
+
+            if result_callback:
+                result_callback(entry_id, results[entry_id])
 
             # Call progress callback if provided
             if progress_callback:
                 progress_callback(index, total)
 
         return results
+
+    def _process_concurrent(
+        self,
+        entry_ids: list[int],
+        progress_callback: Callable[[int, int], None] | None,
+        result_callback: ResultCallback | None,
+    ) -> dict[int, tuple[bool, str]]:
+        """Process entries on a bounded thread pool."""
+        outcomes: dict[int, tuple[bool, str]] = {}
+        total = len(entry_ids)
+        completed = 0
+        lock = threading.Lock()
+
+        def work(entry_id: int):
+            nonlocal completed
+            result = self._process_limited(entry_id)
+            with lock:
+                outcomes[entry_id] = result
+                completed += 1
+                if result_callback:
+                    result_callback(entry_id, result)
+                # Report under the lock so `current` never goes backwards
+                if progress_callback:
+                    progress_callback(completed, total)
+
+        workers = self.limiter.maximum if self.limiter else self.max_workers
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="erfassinator-action"
+        ) as executor:
+            # Consume the iterator so worker exceptions are not swallowed
+            list(executor.map(work, entry_ids))
+
+        return {entry_id: outcomes[entry_id] for entry_id in entry_ids}
+
+    def _process_limited(
+        self, entry_id: int, ticket: int | None = None, raise_expired: bool = False
+    ) -> tuple[bool, str]:
+        """Process a single entry within the adaptive window and host slots."""
+        limiter = self.limiter
+        if limiter is not None and ticket is None:
+            ticket = limiter.acquire()
+        start = time.perf_counter()
+        slots = self._host_slots()
+        try:
+            if slots is None:
+                result, throttled = self._attempt(entry_id, raise_expired)
+            else:
+                with slots:
+                    result, throttled = self._attempt(entry_id, raise_expired)
+        except SessionExpiredError:
+            if limiter is not None and ticket is not None:
+                limiter.cancel(ticket)
+            raise
+        if limiter is not None and ticket is not None:
+            limiter.release(ticket, time.perf_counter() - start, result[0], throttled)
+        return result
+
+    def _host_slots(self) -> threading.BoundedSemaphore | None:
+        """Return the request slots for the backend host, if capped."""
+        if not self.max_per_host:
+            return None
+        url = getattr(self.backend, "url", None)
+        host = urlsplit(url).netloc if url else type(self.backend).__name__
+        return _host_semaphore(host, self.max_per_host)
@@ -0,0 +1,417 @@
+"""Asyncio backends for keeping many portal requests in flight on one thread.
+
+`AsyncFWPortalBackend` needs the optional `aiohttp` package
+(`pip install erfassinator[async]`).
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from erfassinator.backend import (
+    DEFAULT_PAGE_SIZE,
+    LOGGED_IN_MARKER,
+    LOGIN_PREFETCH_TTL,
+    RELOGIN_RESET_TIMEOUT,
+    FWPortalBackend,
+    SessionExpiredError,
+    VerificationCache,
+    dummy_entries,
+    grid_page_request,
+    is_last_grid_page,
+    is_logon_page,
+    is_token_rejection,
+    parse_grid_data,
+    parse_grid_page,
+    raise_for_transient_status,
+)
+from erfassinator.circuit_breaker import CircuitBreaker
+from erfassinator.entries import DataEntry, EntryCollection
+from erfassinator.page_parser import extract_page_fields
+
+T = TypeVar("T")
+
+
+class AsyncBackend(ABC):
+    """Coroutine counterpart of `Backend`."""
+
+    authenticated: bool
+    username: Optional[str]
+
+    @abstractmethod
+    async def login(self, username: str, password: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def logout(self) -> None:
+        ...
+
+    @abstractmethod
+    async def fetch_data(self) -> EntryCollection:
+        ...
+
+    @abstractmethod
+    async def apply_action(self, entry_id: int) -> bool:
+        ...
+
+    async def fetch_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[list[DataEntry]]:
+        """Yield the data entries page by page (default: a single page)."""
+        yield list(await self.fetch_data())
+
+
+class AsyncDummyBackend(AsyncBackend):
+    """Mock backend behaving like `DummyBackend` without blocking the loop."""
+
+    def __init__(self):
+        self.authenticated = False
+        self.username: Optional[str] = None
+
+    async def login(self, username: str, password: str) -> bool:
+        """Simulate login. Accepts 'admin'/'admin' or 'user'/'password'."""
+        await asyncio.sleep(0.5)  # Simulate network delay
+
+        valid_credentials = [
+            ("admin", "admin"),
+            ("user", "password"),
+        ]
+
+        if (username, password) in valid_credentials:
+            self.authenticated = True
+            self.username = username
+            return True
+        return False
+
+    async def logout(self):
+        """Logout the current user."""
+        self.authenticated = False
+        self.username = None
+
+    async def fetch_data(self) -> EntryCollection:
+        """Fetch dummy data entries."""
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+
+        await asyncio.sleep(0.3)  # Simulate network delay
+
+        return EntryCollection(dummy_entries())
+
+    async def apply_action(self, entry_id: int) -> bool:
+        """Apply action to a single entry. Returns success status."""
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+
+        await asyncio.sleep(0.2)  # Simulate processing
+        return True
+
+
+class AsyncFWPortalBackend(AsyncBackend):
+    """FW Portal backend on top of an `aiohttp.ClientSession`."""
+
+    url = FWPortalBackend.url
+
+    def __init__(self, max_connections: int = 20, url: Optional[str] = None):
+        """
+        Args:
+            max_connections: Upper bound of open connections to the portal
+            url: Base URL of the portal (default: the live portal)
+        """
+        if url:
+            self.url = url.rstrip("/")
+        self.authenticated = False
+        self.username: Optional[str] = None
+        self.max_connections = max_connections
+        self._session: Any = None
+        self.verification_cache = VerificationCache()
+        self._session_key = 0
+        self._credentials: Optional[tuple[str, str]] = None
+        self._relogin_lock = asyncio.Lock()
+        self.relogin_breaker = CircuitBreaker(reset_timeout=RELOGIN_RESET_TIMEOUT)
+        self.relogins = 0
+        self._login_prefetch: Optional[tuple[str, float]] = None
+        self._prefetch_lock = asyncio.Lock()
+
+    async def _get_session(self) -> Any:
+        """Create the client session lazily, inside the running loop."""
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise RuntimeError(
+                    "AsyncFWPortalBackend requires the 'aiohttp' package"
+                ) from e
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                # Also keep cookies of IP-address hosts (local test servers)
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+            )
+        return self._session
+
+    async def login(self, username: str, password: str) -> bool:
+        self.authenticated = await self._login(username, password)
+        if self.authenticated:
+            self.username = username
+            self._credentials = (username, password)
+            self.relogin_breaker.record_success()
+        return self.authenticated
+
+    async def prefetch_login(self):
+        """Connect and fetch the login page token ahead of `login`.
+
+        Like `FWPortalBackend.prefetch_login`.
+        """
+        async with self._prefetch_lock:
+            self._login_prefetch = None
+            verificationToken = await self._login_page_token()
+            if verificationToken:
+                self._login_prefetch = (verificationToken, time.monotonic())
+
+    async def _login(self, username: str, password: str) -> bool:
+        """Run the login form; the session key changes once it succeeded.
+
+        See `FWPortalBackend._login`.
+        """
+        self.verification_cache.invalidate(self._session_key)
+        verificationToken, prefetched = await self._take_login_token()
+        success, token_rejected = await self._post_login(verificationToken, username, password)
+        if token_rejected and prefetched:
+            # The portal dropped the token before our TTL ran out
+            verificationToken = await self._login_page_token()
+            success, _ = await self._post_login(verificationToken, username, password)
+        if success:
+            self._session_key += 1
+        return success
+
+    async def _login_page_token(self) -> Optional[str]:
+        """GET the homepage and extract the token of its login form."""
+        session = await self._get_session()
+        async with session.get(self.url) as homepage:
+            return extract_page_fields(await homepage.text(), organisation=False).token
+
+    async def _take_login_token(self) -> tuple[Optional[str], bool]:
+        """The prefetched token if still fresh, else a new one; and which it is."""
+        async with self._prefetch_lock:
+            prefetched, self._login_prefetch = self._login_prefetch, None
+        if prefetched is not None and time.monotonic() - prefetched[1] < LOGIN_PREFETCH_TTL:
+            return prefetched[0], True
+        return await self._login_page_token(), False
+
+    async def _post_login(
+        self, verificationToken: Optional[str], username: str, password: str
+    ) -> tuple[bool, bool]:
+        """Submit the login form.
+
+        Returns whether the portal greets the user, and whether it rejected
+        the anti-forgery token rather than the credentials.
+        """
+        if not verificationToken:
+            return False, False
+
+        session = await self._get_session()
+        async with session.post(f"{self.url}/Account/LogOn", data={
+            "__RequestVerificationToken": verificationToken,
+            "UserName": username,
+            "Password": password,
+            "AngemeldetBleiben": "false"
+        }) as response:
+            if response.status != 200:
+                return False, is_token_rejection(response.status, await response.text())
+            if LOGGED_IN_MARKER in await response.text():
+                return True, False
+        async with session.get(self.url) as homepage:
+            return LOGGED_IN_MARKER in await homepage.text(), False
+
+    async def logout(self):
+        """Logout the current user and close the client session."""
+        self.authenticated = False
+        self.username = None
+        self._credentials = None
+        self.verification_cache.invalidate(self._session_key)
+        if self._session is None or self._session.closed:
+            return
+        try:
+            async with self._session.get(f"{self.url}/Account/LogOff"):
+                pass
+        finally:
+            await self._session.close()
+
+    async def export_cookies(self) -> list[dict[str, Any]]:
+        """The cookies of the session, in the format of `FWPortalBackend`."""
+        session = await self._get_session()
+        return [
+            {
+                "name": morsel.key,
+                "value": morsel.value,
+                "domain": morsel["domain"],
+                "path": morsel["path"] or "/",
+                "secure": bool(morsel["secure"]),
+                "expires": None,
+            }
+            for morsel in session.cookie_jar
+        ]
+
+    async def restore_session(self, username: str, cookies: list[dict[str, Any]]) -> bool:
+        """Continue a stored session instead of logging in.
+
+        Like `FWPortalBackend.restore_session`; the cookies are bound to the
+        portal host.
+        """
+        from yarl import URL
+
+        self.verification_cache.invalidate(self._session_key)
+        self._session_key += 1
+        self._login_prefetch = None
+        session = await self._get_session()
+        session.cookie_jar.clear()
+        session.cookie_jar.update_cookies(
+            {cookie["name"]: cookie["value"] for cookie in cookies},
+            response_url=URL(self.url),
+        )
+
+        async with session.post(
+            f"{self.url}/Einsatz/EinsatzGridAjax",
+            data=grid_page_request(1, 1),
+            allow_redirects=False,
+        ) as response:
+            self.authenticated = response.status == 200
+        if self.authenticated:
+            self.username = username
+            self._credentials = None
+        else:
+            session.cookie_jar.clear()
+        return self.authenticated
+
+    async def _recover_session(self, session_key: int):
+        """Log in again after the session `session_key` has expired.
+
+        Same coordination as `FWPortalBackend._recover_session`, with the
+        coroutines of the loop waiting for one shared re-login.
+
+        Raises:
+            SessionExpiredError: No credentials, or re-login failed
+        """
+        async with self._relogin_lock:
+            if self._session_key != session_key:
+                return  # Already logged in again by another coroutine
+            if self._credentials is None:
+                raise SessionExpiredError("Session expired")
+            if not self.relogin_breaker.allow():
+                raise SessionExpiredError("Session expired, re-login failed recently")
+            try:
+                success = await self._login(*self._credentials)
+            except Exception as e:
+                self.relogin_breaker.record_failure()
+                raise SessionExpiredError(f"Session expired, re-login failed: {e}") from e
+            if not success:
+                self.relogin_breaker.record_failure()
+                raise SessionExpiredError("Session expired, re-login rejected")
+            self.relogin_breaker.record_success()
+            self.relogins += 1
+
+    async def _with_session(self, request: Callable[[int], Awaitable[T]]) -> T:
+        """Await `request(session_key)`; once more after recovering an expiry."""
+        session_key = self._session_key
+        try:
+            return await request(session_key)
+        except SessionExpiredError:
+            await self._recover_session(session_key)
+            return await request(self._session_key)
+
+    async def _grid_text(self, data: Optional[dict[str, Any]] = None) -> str:
+        """POST a grid request of the logged in session; returns the body."""
+        session = await self._get_session()
+        async with session.post(f"{self.url}/Einsatz/EinsatzGridAjax", data=data) as response:
+            if is_logon_page(response.url):
+                raise SessionExpiredError("Session expired")
+            return await response.text()
+
+    async def fetch_data(self) -> EntryCollection:
+        """Fetch all report entries of the logged in account."""
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+
+        return parse_grid_data(await self._with_session(lambda _: self._grid_text()))
+
+    async def fetch_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[list[DataEntry]]:
+        """Yield the data entries using the grid's paging parameters."""
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+
+        page = 1
+        fetched = 0
+        while True:
+            data = grid_page_request(page, page_size)
+            text = await self._with_session(lambda _: self._grid_text(data))
+            entries, total = parse_grid_page(text)
+            fetched += len(entries)
+            if entries:
+                yield entries
+            if is_last_grid_page(entries, fetched, total, page_size):
+                return
+            page += 1
+
+    async def apply_action(self, entry_id: int) -> bool:
+        """Apply action to a single entry. Returns success status.
+
+        Uses the cached token of the session and logs in again after an
+        expiry like `FWPortalBackend`.
+        """
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+
+        return await self._with_session(
+            lambda session_key: self._apply_action(entry_id, session_key)
+        )
+
+    async def _apply_action(self, entry_id: int, session_key: int) -> bool:
+        """One attempt of `apply_action` with the session `session_key`."""
+        cached = self.verification_cache.get(session_key)
+        if cached:
+            orgid, verificationToken = cached
+            status, text = await self._save_status(entry_id, orgid, verificationToken)
+            if status == 200:
+                return True
+            if not is_token_rejection(status, text):
+                raise_for_transient_status(status)
+            # Stale token or another organisation: use the report's own page
+            self.verification_cache.invalidate(session_key, orgid)
+
+        session = await self._get_session()
+        async with session.get(f"{self.url}/Einsatz/GetUpdateEinsatzberichtStatus/{entry_id}", params={
+            "stat": 0 # Erfassen
+        }) as response:
+            if is_logon_page(response.url):
+                raise SessionExpiredError("Session expired")
+            if response.status != 200:
+                raise_for_transient_status(response.status)
+                return False
+            page = await response.text()
+
+        verificationToken, orgid = extract_page_fields(page)
+        if not verificationToken or not orgid:
+            if is_logon_page(response.url, page):
+                raise SessionExpiredError("Session expired")
+            return False
+
+        status, text = await self._save_status(entry_id, orgid, verificationToken)
+        if status == 200:
+            self.verification_cache.put(session_key, orgid, verificationToken)
+        elif not is_token_rejection(status, text):
+            raise_for_transient_status(status)
+        return status == 200
+
+    async def _save_status(self, entry_id: int, orgid: str, verificationToken: str) -> tuple[int, str]:
+        """POST the "Bestätigen" status update; returns status and body."""
+        session = await self._get_session()
+        async with session.post(f"{self.url}/einsatz/saveupdateeinsatzberichtstatus/{entry_id}", params={
+            "status": 100, # Bestätigen
+            "organisationid": orgid
+        }, data={
+            "__RequestVerificationToken": verificationToken,
+            "UpdateStatusBemerkung": "",
+            "X-Requested-With": "XMLHttpRequest",
+        }) as response:
+            if is_logon_page(response.url):
+                raise SessionExpiredError("Session expired")
+            return response.status, await response.text()
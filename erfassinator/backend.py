@@ -1,23 +1,221 @@
 """Dummy backend that simulates a website for testing."""
 
+import sys
 import time
-import requests
-import bs4
+import threading
 import json
-import re
-from typing import Optional, Any
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Any, TypeVar
 from abc import ABC, abstractmethod
+from urllib.parse import urlsplit
 
-@dataclass
-class DataEntry:
-    """Represents a data entry from the website."""
+from erfassinator.circuit_breaker import CircuitBreaker
+from erfassinator.entries import DataEntry, EntryCollection
+from erfassinator.instrumentation import RequestMetrics
+from erfassinator.page_parser import TOKEN_FIELD, PageFields, extract_page_fields
 
-    id: int
-    title: str
-    date: str
-    status: str
-    description: str
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    import requests
+    from erfassinator.transport import TransportConfig, TransportStats
+
+# Rows requested per `EinsatzGridAjax` call when fetching page by page
+DEFAULT_PAGE_SIZE = 250
+
+# Login page the portal redirects to once a session has expired
+LOGON_PATH = "/Account/LogOn"
+
+# Seconds without re-login attempts after one failed
+RELOGIN_RESET_TIMEOUT = 60.0
+
+# Seconds a login page token fetched by `prefetch_login` is used for
+LOGIN_PREFETCH_TTL = 120.0
+
+# Field only present in the login form
+_LOGIN_FORM_MARKER = 'name="UserName"'
+
+# Text of the homepage of a logged in user
+LOGGED_IN_MARKER = "ungelesene Nachrichten"
+
+T = TypeVar("T")
+
+def parse_grid_page(text: str) -> tuple[list[DataEntry], Optional[int]]:
+    """Convert an `EinsatzGridAjax` response into entries and the row total."""
+    payload = json.loads(text)
+    data: list[Any] = payload["Data"]
+
+    # Keywords and statuses repeat a lot; interning shares one string each
+    return list(map(lambda x: DataEntry(
+            id = x["EinsatzberichtID"],
+            title = sys.intern(x["Stichwort"]),
+            date = x["BeginnDatumText"],
+            status = sys.intern(x["GesamtStatus"]),
+            description = x["Kurzbeschreibung"]
+        ), data)), payload.get("Total")
+
+def parse_grid_data(text: str) -> EntryCollection:
+    """Convert an `EinsatzGridAjax` response into data entries."""
+    return EntryCollection(parse_grid_page(text)[0])
+
+def grid_page_request(page: int, page_size: int) -> dict[str, Any]:
+    """Form data selecting one page of the (Kendo) report grid."""
+    return {"page": page, "pageSize": page_size, "sort": "", "group": "", "filter": ""}
+
+def is_last_grid_page(entries: list[DataEntry], fetched: int, total: Optional[int], page_size: int) -> bool:
+    """Check whether a grid page was the last one of the result set."""
+    if total is not None and fetched >= total:
+        return True
+    # A short page ends the set; a long one means paging was ignored
+    return len(entries) != page_size
+
+def decode_page(content: bytes, encoding: Optional[str]) -> str:
+    """Text of a response body in the encoding of its headers (default UTF-8)."""
+    return content.decode(encoding or "utf-8", errors="replace")
+
+def parse_login_page(content: bytes, encoding: Optional[str]) -> Optional[str]:
+    """Anti-forgery token of the login form on the homepage."""
+    return extract_page_fields(decode_page(content, encoding), organisation=False).token
+
+def parse_status_page(content: bytes, encoding: Optional[str]) -> PageFields:
+    """Token and organisation id of a `GetUpdateEinsatzberichtStatus` page."""
+    return extract_page_fields(decode_page(content, encoding))
+
+def parse_grid_content(content: bytes, encoding: Optional[str]) -> tuple[list[DataEntry], Optional[int]]:
+    """Entries and row total of a raw `EinsatzGridAjax` response."""
+    return parse_grid_page(decode_page(content, encoding))
+
+class ParseExecutor:
+    """Runs the page parsers of `FWPortalBackend` inline, in the calling thread.
+
+    Parsers are module-level functions of the raw response bytes and their
+    encoding (`parse_login_page`, `parse_status_page`, `parse_grid_content`),
+    so subclasses can hand them to other processes unchanged.
+    """
+
+    def run(self, parser: Callable[[bytes, Optional[str]], T], content: bytes, encoding: Optional[str]) -> T:
+        """Parse a response body."""
+        return parser(content, encoding)
+
+    def close(self):
+        """Release the resources of the executor."""
+
+class ProcessParseExecutor(ParseExecutor):
+    """Parses in a process pool, off the interpreter that does the I/O.
+
+    Every page costs a round trip to a worker process (the bytes and the
+    result are pickled), so this only pays off when parsing a page takes
+    clearly longer than that and spare cores are available; see
+    `benchmarks/bench_parse.py`. The pool starts on first use.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Worker processes (default: number of CPUs)
+        """
+        self.max_workers = max_workers
+        self._pool: Optional["ProcessPoolExecutor"] = None
+        self._lock = threading.Lock()
+
+    def run(self, parser: Callable[[bytes, Optional[str]], T], content: bytes, encoding: Optional[str]) -> T:
+        return self._get_pool().submit(parser, content, encoding).result()
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def _get_pool(self) -> "ProcessPoolExecutor":
+        with self._lock:
+            if self._pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # Forking a process with running I/O threads is unsafe
+                self._pool = ProcessPoolExecutor(
+                    self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+class VerificationCache:
+    """Anti-forgery tokens and organisation ids shared by report pages.
+
+    Every `GetUpdateEinsatzberichtStatus` page of one login carries the same
+    token, so it is cached per session (identified by a key that changes on
+    every login) together with the organisation id of the last successful
+    POST. Reports of another organisation make the cached POST fail; the
+    caller then drops the entry and reads the report's own status page.
+    """
+
+    def __init__(self):
+        self._tokens: dict[tuple[int, str], str] = {}
+        self._organisations: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_key: int) -> Optional[tuple[str, str]]:
+        """Return (organisation id, token) of the session, if cached."""
+        with self._lock:
+            orgid = self._organisations.get(session_key)
+            if orgid is None:
+                return None
+            token = self._tokens.get((session_key, orgid))
+            return (orgid, token) if token is not None else None
+
+    def put(self, session_key: int, orgid: str, token: str):
+        """Remember the token of an organisation for a session."""
+        with self._lock:
+            self._organisations[session_key] = orgid
+            self._tokens[(session_key, orgid)] = token
+
+    def invalidate(self, session_key: int, orgid: Optional[str] = None):
+        """Forget one organisation's token, or everything of a session."""
+        with self._lock:
+            if orgid is None:
+                self._organisations.pop(session_key, None)
+                for key in [key for key in self._tokens if key[0] == session_key]:
+                    del self._tokens[key]
+            else:
+                self._tokens.pop((session_key, orgid), None)
+                if self._organisations.get(session_key) == orgid:
+                    del self._organisations[session_key]
+
+def is_token_rejection(status_code: int, text: str) -> bool:
+    """Check whether a failed POST was rejected for its anti-forgery token."""
+    if status_code == 200:
+        return False
+    return (
+        status_code in (400, 403)
+        or "AntiForgery" in text
+        or "anti-forgery" in text
+        or TOKEN_FIELD in text
+    )
+
+class TransientBackendError(RuntimeError):
+    """The portal answered 429 or 5xx: overloaded, a later retry may succeed."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"Portal overloaded (HTTP {status_code})")
+        self.status_code = status_code
+
+def raise_for_transient_status(status_code: int):
+    """Raise `TransientBackendError` for throttling and server errors."""
+    if status_code == 429 or status_code >= 500:
+        raise TransientBackendError(status_code)
+
+class SessionExpiredError(RuntimeError):
+    """The portal answered with its login page: the session has expired."""
+
+def is_logon_page(url: Any, text: str = "") -> bool:
+    """Check whether a response is the login page of an expired session.
+
+    Requests of an expired session are redirected to `LOGON_PATH`; pages
+    missing their expected content can also be checked for the login form.
+    """
+    return (
+        urlsplit(str(url)).path.rstrip("/").lower() == LOGON_PATH.lower()
+        or _LOGIN_FORM_MARKER in text
+    )
 
 class Backend(ABC):
     authenticated: bool
@@ -32,13 +230,38 @@ class Backend(ABC):
         ...
 
     @abstractmethod
-    def fetch_data(self) -> list[DataEntry]:
+    def fetch_data(self) -> EntryCollection:
         ...
 
     @abstractmethod
     def apply_action(self, entry_id: int) -> bool:
         ...
 
+    def fetch_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[DataEntry]]:
+        """Yield the data entries page by page.
+
+        Backends without server-side paging deliver everything as one page.
+        """
+        yield list(self.fetch_data())
+
+def dummy_entries() -> list[DataEntry]:
+    """Return the fixed entries served by the dummy backends."""
+    return [
+        DataEntry(
+            1, "Einsatz Brand", "2024-01-15", "Ausstehend", "Kleinbrand im Keller"
+        ),
+        DataEntry(
+            2, "Technische Hilfe", "2024-01-16", "Ausstehend", "Ölspur auf Fahrbahn"
+        ),
+        DataEntry(
+            3, "Einsatz Rettung", "2024-01-17", "Ausstehend", "Person eingeklemmt"
+        ),
+        DataEntry(4, "Fehlalarm", "2024-01-18", "Ausstehend", "BMA ausgelöst"),
+        DataEntry(
+            5, "Einsatz Brand", "2024-01-19", "Ausstehend", "Mülltonnenbrand"
+        ),
+    ]
+
 class DummyBackend(Backend):
     """Mock backend that simulates website authentication and data fetching."""
 
@@ -66,28 +289,14 @@ class DummyBackend(Backend):
         self.authenticated = False
         self.username = None
 
-    def fetch_data(self) -> list[DataEntry]:
+    def fetch_data(self) -> EntryCollection:
         """Fetch dummy data entries."""
         if not self.authenticated:
             raise PermissionError("Not authenticated")
 
         time.sleep(0.3)  # Simulate network delay
 
-        return [
-            DataEntry(
-                1, "Einsatz Brand", "2024-01-15", "Ausstehend", "Kleinbrand im Keller"
-            ),
-            DataEntry(
-                2, "Technische Hilfe", "2024-01-16", "Ausstehend", "Ölspur auf Fahrbahn"
-            ),
-            DataEntry(
-                3, "Einsatz Rettung", "2024-01-17", "Ausstehend", "Person eingeklemmt"
-            ),
-            DataEntry(4, "Fehlalarm", "2024-01-18", "Ausstehend", "BMA ausgelöst"),
-            DataEntry(
-                5, "Einsatz Brand", "2024-01-19", "Ausstehend", "Mülltonnenbrand"
-            ),
-        ]
+        return EntryCollection(dummy_entries())
 
     def apply_action(self, entry_id: int) -> bool:
         """Apply action to a single entry. Returns success status."""
@@ -100,18 +309,116 @@ class DummyBackend(Backend):
 class FWPortalBackend(Backend):
     url = "https://live.fwportal.de"
 
-    def __init__(self):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        transport: Optional["TransportConfig"] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+    ):
+        """
+        Args:
+            url: Base URL of the portal (default: the live portal)
+            transport: Pool, retry and timeout settings of the HTTP session
+            parse_executor: Where pages are parsed (default: inline)
+        """
+        if url:
+            self.url = url.rstrip("/")
         self.authenticated = False
         self.username: Optional[str] = None
-        self.session = requests.Session()
+        self.transport = transport
+        self.transport_stats: Optional["TransportStats"] = None
+        self._session: Optional["requests.Session"] = None
+        self.metrics = RequestMetrics()
+        self.parse_executor = parse_executor or ParseExecutor()
+        self.verification_cache = VerificationCache()
+        # Changes with every login so cached tokens never outlive a session
+        self._session_key = 0
+        # Kept to log in again when the portal session expires
+        self._credentials: Optional[tuple[str, str]] = None
+        self._relogin_lock = threading.Lock()
+        self.relogin_breaker = CircuitBreaker(reset_timeout=RELOGIN_RESET_TIMEOUT)
+        self.relogins = 0
+        # Login page token of `prefetch_login` and when it was fetched
+        self._login_prefetch: Optional[tuple[str, float]] = None
+        self._prefetch_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session, created on first use.
+
+        `requests` takes a noticeable part of the startup time, so it is only
+        imported once the first request is made.
+        """
+        if self._session is None:
+            from erfassinator.transport import TransportStats, create_session
+
+            self.transport_stats = TransportStats()
+            self._session = create_session(self.transport, self.transport_stats)
+            self.metrics.install(self._session)
+        return self._session
 
     def login(self, username: str, password: str) -> bool:
+        self.authenticated = self._login(username, password)
+        if self.authenticated:
+            self.username = username
+            self._credentials = (username, password)
+            self.relogin_breaker.record_success()
+        return self.authenticated
+
+    def prefetch_login(self):
+        """Connect and fetch the login page token ahead of `login`.
+
+        Meant to run while the user types the credentials: `login` then only
+        has to POST the form, as long as the token is younger than
+        `LOGIN_PREFETCH_TTL`.
+        """
+        with self._prefetch_lock:
+            self._login_prefetch = None
+            verificationToken = self._login_page_token()
+            if verificationToken:
+                self._login_prefetch = (verificationToken, time.monotonic())
+
+    def _login(self, username: str, password: str) -> bool:
+        """Run the login form; the session key changes once it succeeded.
+
+        A failed login keeps the key, so workers waiting in `_recover_session`
+        reach `relogin_breaker` instead of retrying with a dead session.
+        """
+        self.verification_cache.invalidate(self._session_key)
+        verificationToken, prefetched = self._take_login_token()
+        success, token_rejected = self._post_login(verificationToken, username, password)
+        if token_rejected and prefetched:
+            # The portal dropped the token before our TTL ran out
+            success, _ = self._post_login(self._login_page_token(), username, password)
+        if success:
+            self._session_key += 1
+        return success
+
+    def _login_page_token(self) -> Optional[str]:
+        """GET the homepage and extract the token of its login form."""
         homepage = self.session.get(self.url)
-        parsed = bs4.BeautifulSoup(homepage.text, features="html.parser")
-        infield = parsed.find("input", attrs={"name": "__RequestVerificationToken"})
-        if not infield:
-            return False
-        verificationToken = str(infield.attrs["value"])
+        with self.metrics.timer("parse login page"):
+            return self.parse_executor.run(parse_login_page, homepage.content, homepage.encoding)
+
+    def _take_login_token(self) -> tuple[Optional[str], bool]:
+        """The prefetched token if still fresh, else a new one; and which it is."""
+        # Waits for a prefetch in flight instead of fetching the page twice
+        with self._prefetch_lock:
+            prefetched, self._login_prefetch = self._login_prefetch, None
+        if prefetched is not None and time.monotonic() - prefetched[1] < LOGIN_PREFETCH_TTL:
+            return prefetched[0], True
+        return self._login_page_token(), False
+
+    def _post_login(
+        self, verificationToken: Optional[str], username: str, password: str
+    ) -> tuple[bool, bool]:
+        """Submit the login form.
+
+        Returns whether the portal greets the user, and whether it rejected
+        the anti-forgery token rather than the credentials.
+        """
+        if not verificationToken:
+            return False, False
 
         response = self.session.post(f"{self.url}/Account/LogOn", data={
             "__RequestVerificationToken": verificationToken,
@@ -119,55 +426,214 @@ class FWPortalBackend(Backend):
             "Password": password,
             "AngemeldetBleiben": "false"
         })
-
-        self.authenticated = response.status_code == 200 and "ungelesene Nachrichten" in self.session.get(self.url).text
-        return self.authenticated
+        if response.status_code != 200:
+            return False, is_token_rejection(response.status_code, response.text)
+        # The form redirects to the homepage, which is only fetched again
+        # if the redirect ended elsewhere
+        return (
+            LOGGED_IN_MARKER in response.text or LOGGED_IN_MARKER in self.session.get(self.url).text,
+            False,
+        )
 
     def logout(self):
         """Logout the current user."""
         self.authenticated = False
         self.username = None
+        self._credentials = None
+        self.verification_cache.invalidate(self._session_key)
         self.session.get(f"{self.url}/Account/LogOff")
 
-    def fetch_data(self) -> list[DataEntry]:
+    def export_cookies(self) -> list[dict[str, Any]]:
+        """The cookies of the session, e.g. to store them for `restore_session`."""
+        return [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "secure": cookie.secure,
+                "expires": cookie.expires,
+            }
+            for cookie in self.session.cookies
+        ]
+
+    def restore_session(self, username: str, cookies: list[dict[str, Any]]) -> bool:
+        """Continue a stored session instead of logging in.
+
+        A single request for one grid row checks whether the portal still
+        accepts the cookies. The password is not known afterwards, so an
+        expiry of the restored session cannot be recovered by re-login: it
+        raises `SessionExpiredError` and the caller has to ask for the
+        password (the GUI's job queue pauses for it). A later `login`
+        enables transparent re-login again.
+        """
+        self.verification_cache.invalidate(self._session_key)
+        self._session_key += 1
+        self._login_prefetch = None
+        self.session.cookies.clear()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False),
+                expires=cookie.get("expires"),
+            )
+
+        response = self.session.post(
+            f"{self.url}/Einsatz/EinsatzGridAjax",
+            data=grid_page_request(1, 1),
+            allow_redirects=False,
+        )
+        self.authenticated = response.status_code == 200
+        if self.authenticated:
+            self.username = username
+            self._credentials = None
+        else:
+            self.session.cookies.clear()
+        return self.authenticated
+
+    def _recover_session(self, session_key: int):
+        """Log in again after the session `session_key` has expired.
+
+        Workers that notice the expiry at the same time wait for one shared
+        re-login; those that get the lock after it only retry. A failed
+        re-login opens `relogin_breaker`, so further workers fail at once
+        instead of each trying to log in again.
+
+        Raises:
+            SessionExpiredError: No credentials, or re-login failed
+        """
+        with self._relogin_lock:
+            if self._session_key != session_key:
+                return  # Already logged in again by another worker
+            if self._credentials is None:
+                raise SessionExpiredError("Session expired")
+            if not self.relogin_breaker.allow():
+                raise SessionExpiredError("Session expired, re-login failed recently")
+            try:
+                success = self._login(*self._credentials)
+            except Exception as e:
+                self.relogin_breaker.record_failure()
+                raise SessionExpiredError(f"Session expired, re-login failed: {e}") from e
+            if not success:
+                self.relogin_breaker.record_failure()
+                raise SessionExpiredError("Session expired, re-login rejected")
+            self.relogin_breaker.record_success()
+            self.relogins += 1
+
+    def _with_session(self, request: Callable[[int], T]) -> T:
+        """Run `request(session_key)`; once more after recovering an expiry."""
+        session_key = self._session_key
+        try:
+            return request(session_key)
+        except SessionExpiredError:
+            self._recover_session(session_key)
+            return request(self._session_key)
+
+    def _grid_response(self, data: Optional[dict[str, Any]] = None) -> "requests.Response":
+        """POST a grid request of the logged in session."""
+        response = self.session.post(f"{self.url}/Einsatz/EinsatzGridAjax", data=data)
+        if is_logon_page(response.url):
+            raise SessionExpiredError("Session expired")
+        return response
+
+    def fetch_data(self) -> EntryCollection:
         """Fetch dummy data entries."""
         if not self.authenticated:
             raise PermissionError("Not authenticated")
 
-        response = self.session.post(f"{self.url}/Einsatz/EinsatzGridAjax")
+        response = self._with_session(lambda _: self._grid_response())
 
-        data: list[Any] = json.loads(response.text)["Data"]
+        with self.metrics.timer("parse grid page"):
+            entries, _ = self.parse_executor.run(parse_grid_content, response.content, response.encoding)
+        return EntryCollection(entries)
 
-        return list(map(lambda x: DataEntry(
-                id = x["EinsatzberichtID"],
-                title = x["Stichwort"],
-                date = x["BeginnDatumText"],
-                status = x["GesamtStatus"],
-                description = x["Kurzbeschreibung"]
-            ), data))
+    def fetch_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[DataEntry]]:
+        """Yield the data entries using the grid's paging parameters.
+
+        Only one page of the response is held in memory at a time.
+        """
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+
+        page = 1
+        fetched = 0
+        while True:
+            data = grid_page_request(page, page_size)
+            response = self._with_session(lambda _: self._grid_response(data))
+            with self.metrics.timer("parse grid page"):
+                entries, total = self.parse_executor.run(
+                    parse_grid_content, response.content, response.encoding
+                )
+            fetched += len(entries)
+            if entries:
+                yield entries
+            if is_last_grid_page(entries, fetched, total, page_size):
+                return
+            page += 1
 
     def apply_action(self, entry_id: int) -> bool:
-        """Apply action to a single entry. Returns success status."""
+        """Apply action to a single entry. Returns success status.
+
+        The status page is only requested when no token is cached for the
+        session. Any failed POST with the cached token and organisation id,
+        other than a 429/5xx, drops the cache entry and is retried once with
+        the values of the report's own status page (e.g. when the report
+        belongs to another organisation). When the session has expired, the
+        action is retried after logging in again.
+
+        Raises:
+            TransientBackendError: The portal answered 429 or 5xx
+            SessionExpiredError: The session expired and re-login failed
+        """
         if not self.authenticated:
             raise PermissionError("Not authenticated")
 
+        return self._with_session(lambda session_key: self._apply_action(entry_id, session_key))
+
+    def _apply_action(self, entry_id: int, session_key: int) -> bool:
+        """One attempt of `apply_action` with the session `session_key`."""
+        cached = self.verification_cache.get(session_key)
+        if cached:
+            orgid, verificationToken = cached
+            response = self._save_status(entry_id, orgid, verificationToken)
+            if response.status_code == 200:
+                return True
+            if not is_token_rejection(response.status_code, response.text):
+                raise_for_transient_status(response.status_code)
+            # Stale token or another organisation: use the report's own page
+            self.verification_cache.invalidate(session_key, orgid)
+
         response = self.session.get(f"{self.url}/Einsatz/GetUpdateEinsatzberichtStatus/{entry_id}", params={
             "stat": 0 # Erfassen
         })
 
+        if is_logon_page(response.url):
+            raise SessionExpiredError("Session expired")
         if response.status_code != 200:
+            raise_for_transient_status(response.status_code)
             return False
 
-        parsed = bs4.BeautifulSoup(response.text, features="html.parser")
-        infield = parsed.find("input", attrs={"name": "__RequestVerificationToken"})
-        if not infield:
+        with self.metrics.timer("parse status page"):
+            verificationToken, orgid = self.parse_executor.run(
+                parse_status_page, response.content, response.encoding
+            )
+        if not verificationToken or not orgid:
+            if is_logon_page(response.url, response.text):
+                raise SessionExpiredError("Session expired")
             return False
-        verificationToken = str(infield.attrs["value"])
-        search = re.search(r'organisationid=(\d+)', response.text)
-        if not search:
-            return False
-        orgid = search.group(1)
 
+        response = self._save_status(entry_id, orgid, verificationToken)
+        if response.status_code == 200:
+            self.verification_cache.put(session_key, orgid, verificationToken)
+        elif not is_token_rejection(response.status_code, response.text):
+            raise_for_transient_status(response.status_code)
+        return response.status_code == 200
+
+    def _save_status(self, entry_id: int, orgid: str, verificationToken: str) -> "requests.Response":
+        """POST the "Bestätigen" status update of a report."""
         response = self.session.post(f"{self.url}/einsatz/saveupdateeinsatzberichtstatus/{entry_id}", params={
             "status": 100, # Bestätigen
             "organisationid": orgid
@@ -176,5 +642,6 @@ class FWPortalBackend(Backend):
             "UpdateStatusBemerkung": "",
             "X-Requested-With": "XMLHttpRequest",
         })
-
-        return response.status_code == 200
+        if is_logon_page(response.url):
+            raise SessionExpiredError("Session expired")
+        return response
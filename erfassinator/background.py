@@ -0,0 +1,40 @@
+"""Single background event loop shared by the GUI for all backend work."""
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+class BackgroundLoop:
+    """Runs an asyncio event loop on one daemon thread.
+
+    Coroutine functions are scheduled directly on the loop; plain callables
+    (the blocking `Backend` API) run in the loop's default executor, so the
+    GUI never needs to start threads of its own.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="erfassinator-loop", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """Run `func(*args)` on the background loop and return its future."""
+        if inspect.iscoroutinefunction(func):
+            coro = func(*args)
+        else:
+            coro = asyncio.to_thread(func, *args)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        """Stop the loop and wait for its thread to finish."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
@@ -0,0 +1,423 @@
+"""Headless batch mode: `erfassinator batch`.
+
+Logs in, fetches all reports, filters them by status, runs the
+`ActionProcessor` and writes one JSON object per processed report to
+stdout. Nothing in here imports tkinter.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from erfassinator.action_processor import ActionProcessor, ActionResults
+from erfassinator.concurrency import AdaptiveLimiter, LimiterDecision
+from erfassinator.data_collector import DataCollector
+from erfassinator.entries import EntryCollection, needs_capture
+from erfassinator.journal import DEFAULT_JOURNAL_PATH, ActionJournal
+from erfassinator.session_manager import SessionManager
+
+USERNAME_ENV = "ERFASSINATOR_USERNAME"
+PASSWORD_ENV = "ERFASSINATOR_PASSWORD"
+
+# Account of `--backend synthetic` runs without credentials
+SYNTHETIC_USERNAME = "synthetic"
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_LOGIN_FAILED = 2
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser):
+    """Register the options of the batch subcommand."""
+    parser.add_argument(
+        "--credentials-file",
+        type=Path,
+        help='JSON-Datei mit {"username": ..., "password": ...} '
+        f"(sonst ${USERNAME_ENV} / ${PASSWORD_ENV})",
+    )
+    parser.add_argument(
+        "--status",
+        action="append",
+        default=[],
+        help="nur Berichte mit diesem GesamtStatus erfassen (mehrfach möglich)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="gleichzeitig verarbeitete Berichte"
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Parallelität anpassen (höchstens --workers), Entscheidungen auf stderr",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Seiten in so vielen Prozessen parsen (0: im I/O-Thread, Standard; nicht mit --async)",
+    )
+    parser.add_argument("--url", help="Basis-URL des Portals (z.B. Mock-Portal)")
+    parser.add_argument(
+        "--accounts",
+        type=Path,
+        help='JSON-Liste mehrerer Konten [{"username", "password", "url"?, "workers"?}], '
+        "die gleichzeitig abgerufen und erfasst werden",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="nur die ausgewählten Berichte ausgeben, nichts erfassen",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=DEFAULT_JOURNAL_PATH,
+        help=f"Protokoll der Ergebnisse je Bericht (Standard: {DEFAULT_JOURNAL_PATH})",
+    )
+    parser.add_argument(
+        "--no-journal", action="store_true", help="kein Protokoll schreiben"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="laut Protokoll bereits erfasste Berichte überspringen",
+    )
+    parser.add_argument(
+        "--include-captured",
+        action="store_true",
+        help="auch Berichte bearbeiten, deren Status schon erfasst bedeutet",
+    )
+
+
+def read_credentials(path: Path | None) -> tuple[str, str]:
+    """Read credentials from a JSON file or the environment."""
+    if path is not None:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data["username"], data["password"]
+    try:
+        return os.environ[USERNAME_ENV], os.environ[PASSWORD_ENV]
+    except KeyError as e:
+        raise ValueError(
+            f"Zugangsdaten fehlen: --credentials-file oder ${USERNAME_ENV} "
+            f"und ${PASSWORD_ENV} setzen"
+        ) from e
+
+
+def select_entries(entries: EntryCollection, statuses: list[str]) -> EntryCollection:
+    """Entries with one of the given statuses (all if none given)."""
+    if not statuses:
+        return entries
+    return EntryCollection(entry for status in statuses for entry in entries.with_status(status))
+
+
+def create_processor(
+    args: argparse.Namespace,
+    backend: Any,
+    username: str,
+    workers: int | None = None,
+    **kwargs: Any,
+) -> ActionProcessor:
+    """Action processor of the batch run with journal and status filter.
+
+    `workers` overrides `--workers`, e.g. with the limit of one of several
+    accounts.
+    """
+    workers = workers or args.workers
+    limiter = None
+    if args.adaptive:
+        on_decision = (
+            _log_decision if args.accounts is None else partial(_log_decision, account=username)
+        )
+        limiter = AdaptiveLimiter(
+            initial=min(2, workers), maximum=workers, on_decision=on_decision
+        )
+    return ActionProcessor(
+        backend,
+        max_workers=workers,
+        journal=None if args.no_journal else ActionJournal(args.journal, account=username),
+        needs_action=None if args.include_captured else needs_capture,
+        limiter=limiter,
+        **kwargs,
+    )
+
+
+def _log_decision(decision: LimiterDecision, account: str | None = None):
+    """Report a change of the adaptive window on stderr."""
+    record = {"limit": decision.limit, "previous": decision.previous, "reason": decision.reason}
+    if account is not None:
+        record = {"account": account, **record}
+    print(json.dumps(record, ensure_ascii=False), file=sys.stderr, flush=True)
+
+
+def _emit(record: dict[str, Any], lock: threading.Lock):
+    """Write one JSON line to stdout."""
+    with lock:
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Run the batch subcommand. Returns the process exit code."""
+    if args.accounts is not None:
+        return _run_accounts(args)
+
+    try:
+        username, password = read_credentials(args.credentials_file)
+    except (OSError, ValueError, KeyError) as e:
+        if args.backend != "synthetic" or args.credentials_file is not None:
+            print(f"Fehler: {e}", file=sys.stderr)
+            return EXIT_LOGIN_FAILED
+        username, password = SYNTHETIC_USERNAME, ""
+
+    if args.use_async:
+        return asyncio.run(_run_batch_async(args, username, password))
+
+    executor = _parse_executor(args)
+    try:
+        return _run_batch_sync(args, username, password, executor)
+    finally:
+        executor.close()
+
+
+def _synthetic_backend(args: argparse.Namespace) -> Any:
+    """Backend of `--backend synthetic` with the settings of `--synthetic`."""
+    from erfassinator.synthetic_backend import SyntheticBackend, SyntheticConfig
+
+    return SyntheticBackend(SyntheticConfig.from_spec(args.synthetic))
+
+
+def _parse_executor(args: argparse.Namespace) -> Any:
+    """Inline parsing, or a process pool with `--parse-processes`."""
+    from erfassinator.backend import ParseExecutor, ProcessParseExecutor
+
+    if args.parse_processes > 0:
+        return ProcessParseExecutor(args.parse_processes)
+    return ParseExecutor()
+
+
+def _run_batch_sync(args: argparse.Namespace, username: str, password: str, executor: Any) -> int:
+    """Batch run on the threaded `FWPortalBackend`."""
+    from erfassinator.backend import FWPortalBackend
+    from erfassinator.transport import TransportConfig
+
+    if args.backend == "synthetic":
+        backend = _synthetic_backend(args)
+    else:
+        backend = FWPortalBackend(
+            url=args.url,
+            transport=TransportConfig.for_workers(args.workers),
+            parse_executor=executor,
+        )
+    success, message = SessionManager(backend).login(username, password)
+    if not success:
+        print(message, file=sys.stderr)
+        return EXIT_LOGIN_FAILED
+
+    try:
+        entries = DataCollector(backend).fetch_all()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return EXIT_FAILURES
+
+    selected = select_entries(entries, args.status)
+    processor = create_processor(args, backend, username, max_per_host=args.workers)
+    if args.dry_run:
+        return _dry_run(processor, selected)
+
+    lock = threading.Lock()
+    results = processor.process_all(
+        selected,
+        result_callback=lambda entry_id, result: _emit(_result_record(entry_id, result), lock),
+        resume=args.resume,
+    )
+    return _summary(results, lock)
+
+
+async def _run_batch_async(args: argparse.Namespace, username: str, password: str) -> int:
+    """Batch run on the asyncio backend."""
+    from erfassinator.async_backend import AsyncFWPortalBackend
+
+    backend = AsyncFWPortalBackend(max_connections=args.workers, url=args.url)
+    try:
+        success, message = await SessionManager(backend).login_async(username, password)
+        if not success:
+            print(message, file=sys.stderr)
+            return EXIT_LOGIN_FAILED
+
+        try:
+            entries = await DataCollector(backend).fetch_all_async()
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return EXIT_FAILURES
+
+        selected = select_entries(entries, args.status)
+        processor = create_processor(args, backend, username)
+        if args.dry_run:
+            return _dry_run(processor, selected)
+
+        lock = threading.Lock()
+        results = await processor.process_all_async(
+            selected,
+            result_callback=lambda entry_id, result: _emit(_result_record(entry_id, result), lock),
+            resume=args.resume,
+        )
+        return _summary(results, lock)
+    finally:
+        await backend.logout()
+
+
+def _run_accounts(args: argparse.Namespace) -> int:
+    """Batch run of all accounts of `--accounts` at the same time.
+
+    Every output line carries the account; each account ends with its own
+    summary line, followed by one summary over all accounts. Progress of
+    each account goes to stderr, one line per percent.
+    """
+    from erfassinator.multi_account import MultiAccountRunner, read_accounts
+
+    try:
+        accounts = read_accounts(args.accounts)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return EXIT_LOGIN_FAILED
+
+    def workers(account: Any) -> int:
+        return account.workers or args.workers
+
+    executor = None
+    if args.use_async:
+        from erfassinator.async_backend import AsyncFWPortalBackend
+
+        def create_backend(account: Any) -> Any:
+            return AsyncFWPortalBackend(
+                max_connections=workers(account), url=account.url or args.url
+            )
+    else:
+        from erfassinator.backend import FWPortalBackend
+        from erfassinator.transport import TransportConfig
+
+        executor = _parse_executor(args)
+
+        def create_backend(account: Any) -> Any:
+            if args.backend == "synthetic":
+                return _synthetic_backend(args)
+            return FWPortalBackend(
+                url=account.url or args.url,
+                transport=TransportConfig.for_workers(workers(account)),
+                parse_executor=executor,
+            )
+
+    runner = MultiAccountRunner(
+        accounts,
+        create_backend,
+        lambda account, backend: create_processor(
+            args, backend, account.username, workers=workers(account)
+        ),
+        select=lambda entries: select_entries(entries, args.status),
+    )
+    lock = threading.Lock()
+
+    def emit_result(account: str, entry_id: int, result: tuple[bool, str]):
+        _emit({"account": account, **_result_record(entry_id, result)}, lock)
+
+    # Last reported percent of every account
+    percents: dict[str, int] = {}
+
+    def emit_progress(account: str, done: int, total: int):
+        percent = done * 100 // max(total, 1)
+        with lock:
+            if percents.get(account) == percent:
+                return
+            percents[account] = percent
+            record = {"account": account, "done": done, "total": total}
+            print(json.dumps(record, ensure_ascii=False), file=sys.stderr, flush=True)
+
+    try:
+        if args.use_async:
+            runs = asyncio.run(
+                runner.run_async(
+                    emit_result, emit_progress, resume=args.resume, dry_run=args.dry_run
+                )
+            )
+        else:
+            runs = runner.run(
+                emit_result, emit_progress, resume=args.resume, dry_run=args.dry_run
+            )
+    finally:
+        if executor is not None:
+            executor.close()
+
+    totals = {"accounts": len(runs), "total": 0, "succeeded": 0, "skipped": 0, "failed_accounts": 0}
+    for run in runs:
+        summary: dict[str, Any] = {"total": len(run.selected), "skipped": len(run.results.skipped)}
+        if args.dry_run:
+            for entry_id in run.selected:
+                entry = run.entries.get(entry_id)
+                _emit(
+                    {
+                        "account": run.account,
+                        "id": entry.id,
+                        "title": entry.title,
+                        "date": entry.date,
+                        "status": entry.status,
+                    },
+                    lock,
+                )
+        else:
+            summary = {"total": len(run.results), "succeeded": run.succeeded, **summary}
+            totals["succeeded"] += run.succeeded
+        if run.error is not None:
+            print(f"{run.account}: {run.error}", file=sys.stderr)
+            summary["error"] = run.error
+            totals["failed_accounts"] += 1
+        totals["total"] += summary["total"]
+        totals["skipped"] += summary["skipped"]
+        _emit({"account": run.account, "summary": summary}, lock)
+    if args.dry_run:
+        del totals["succeeded"]
+    _emit({"summary": totals}, lock)
+    return _accounts_exit_code(runs, args.dry_run)
+
+
+def _accounts_exit_code(runs: list[Any], dry_run: bool) -> int:
+    """The most severe exit code of the accounts."""
+    if any(run.login_failed for run in runs):
+        return EXIT_LOGIN_FAILED
+    if any(run.error is not None for run in runs):
+        return EXIT_FAILURES
+    if not dry_run and any(run.succeeded != len(run.results) for run in runs):
+        return EXIT_FAILURES
+    return EXIT_OK
+
+
+def _result_record(entry_id: int, result: tuple[bool, str]) -> dict[str, Any]:
+    success, message = result
+    return {"id": entry_id, "success": success, "message": message}
+
+
+def _dry_run(processor: ActionProcessor, selected: EntryCollection) -> int:
+    lock = threading.Lock()
+    entry_ids, skipped = processor.select(selected)
+    for entry_id in entry_ids:
+        entry = selected.get(entry_id)
+        _emit(
+            {"id": entry.id, "title": entry.title, "date": entry.date, "status": entry.status},
+            lock,
+        )
+    _emit({"summary": {"total": len(entry_ids), "skipped": len(skipped)}}, lock)
+    return EXIT_OK
+
+
+def _summary(results: ActionResults, lock: threading.Lock) -> int:
+    succeeded = sum(1 for success, _ in results.values() if success)
+    _emit(
+        {"summary": {"total": len(results), "succeeded": succeeded, "skipped": len(results.skipped)}},
+        lock,
+    )
+    return EXIT_OK if succeeded == len(results) else EXIT_FAILURES
@@ -0,0 +1,183 @@
+"""Adaptive (AIMD) limit of concurrent portal actions.
+
+`AdaptiveLimiter` raises the number of requests in flight by one after every
+healthy window of completions and halves it as soon as the portal throttles
+(429/5xx), errors pile up or the p95 latency rises well above the best one
+seen. Every change is kept as a `LimiterDecision` for display.
+"""
+
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, NamedTuple
+
+# Decisions kept for `decisions()`
+_DECISION_HISTORY = 50
+
+
+class LimiterDecision(NamedTuple):
+    """One change of the concurrency window."""
+
+    time: float
+    previous: int
+    limit: int
+    reason: str
+
+
+class AdaptiveLimiter:
+    """Thread-safe AIMD concurrency window."""
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 16,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        min_success_rate: float = 0.9,
+        min_window: int = 8,
+        on_decision: Callable[[LimiterDecision], None] | None = None,
+    ):
+        """
+        Args:
+            initial: Starting number of concurrent actions
+            minimum: Lower bound of the window
+            maximum: Upper bound of the window
+            backoff: Factor applied to the window on a decrease
+            latency_tolerance: Decrease once the window's p95 exceeds the
+                best p95 seen by this factor
+            min_success_rate: Decrease when fewer actions of a window succeed
+            min_window: Completions evaluated per decision at least (otherwise
+                one per slot of the current window)
+            on_decision: Optional callback for every change of the window
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.min_success_rate = min_success_rate
+        self.min_window = min_window
+        self.on_decision = on_decision
+
+        self._condition = threading.Condition()
+        self._limit = min(max(initial, self.minimum), self.maximum)
+        self._in_flight = 0
+        # Tickets number the acquisitions; completions of actions started
+        # before the last decrease do not decrease the window again.
+        self._issued = 0
+        self._decrease_mark = 0
+        self._latencies: list[float] = []
+        self._failures = 0
+        self._baseline_p95: float | None = None
+        self._last_p95: float | None = None
+        self._decisions: deque[LimiterDecision] = deque(maxlen=_DECISION_HISTORY)
+
+    @property
+    def limit(self) -> int:
+        """Current number of actions allowed in flight."""
+        return self._limit
+
+    def try_acquire(self) -> int | None:
+        """Take a slot if one is free; returns its ticket or None."""
+        with self._condition:
+            return self._take()
+
+    def acquire(self) -> int:
+        """Block until a slot is free; returns its ticket."""
+        with self._condition:
+            while (ticket := self._take()) is None:
+                self._condition.wait()
+            return ticket
+
+    def release(self, ticket: int, latency: float, success: bool, throttled: bool = False):
+        """
+        Return a slot and record the outcome of its action.
+
+        Args:
+            ticket: Ticket returned by `acquire`/`try_acquire`
+            latency: Seconds the action took
+            success: Whether the action succeeded
+            throttled: Whether the portal answered 429/5xx
+        """
+        decision = None
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                if ticket > self._decrease_mark:
+                    decision = self._decrease("Portal überlastet (429/5xx)")
+            else:
+                self._latencies.append(latency)
+                if not success:
+                    self._failures += 1
+                if len(self._latencies) >= max(self._limit, self.min_window):
+                    decision = self._evaluate_window()
+            self._condition.notify_all()
+        if decision is not None and self.on_decision:
+            self.on_decision(decision)
+
+    def cancel(self, ticket: int):
+        """Return a slot that was not used, without recording an outcome."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current window, load and latency figures."""
+        with self._condition:
+            return {
+                "limit": self._limit,
+                "in_flight": self._in_flight,
+                "p95_ms": (self._last_p95 or 0.0) * 1000,
+                "baseline_p95_ms": (self._baseline_p95 or 0.0) * 1000,
+            }
+
+    def decisions(self) -> list[LimiterDecision]:
+        """The most recent changes of the window, oldest first."""
+        with self._condition:
+            return list(self._decisions)
+
+    def _take(self) -> int | None:
+        if self._in_flight >= self._limit:
+            return None
+        self._in_flight += 1
+        self._issued += 1
+        return self._issued
+
+    def _evaluate_window(self) -> LimiterDecision | None:
+        latencies = sorted(self._latencies)
+        success_rate = 1 - self._failures / len(latencies)
+        if len(latencies) > 1:
+            p95 = statistics.quantiles(latencies, n=20, method="inclusive")[-1]
+        else:
+            p95 = latencies[0]
+        self._latencies.clear()
+        self._failures = 0
+        self._last_p95 = p95
+
+        baseline = self._baseline_p95
+        # The baseline drifts up slowly so a lasting slowdown is accepted
+        self._baseline_p95 = p95 if baseline is None else min(p95, baseline * 1.1)
+
+        if baseline is not None and p95 > baseline * self.latency_tolerance:
+            return self._decrease(f"p95 {p95 * 1000:.0f} ms > {baseline * 1000:.0f} ms × {self.latency_tolerance:g}")
+        if success_rate < self.min_success_rate:
+            return self._decrease(f"Erfolgsquote {success_rate:.0%}")
+        if self._limit < self.maximum:
+            return self._change(self._limit + 1, "stabil")
+        return None
+
+    def _decrease(self, reason: str) -> LimiterDecision | None:
+        self._decrease_mark = self._issued
+        self._latencies.clear()
+        self._failures = 0
+        limit = max(self.minimum, int(self._limit * self.backoff))
+        if limit == self._limit:
+            return None
+        return self._change(limit, reason)
+
+    def _change(self, limit: int, reason: str) -> LimiterDecision:
+        decision = LimiterDecision(time.time(), self._limit, limit, reason)
+        self._limit = limit
+        self._decisions.append(decision)
+        return decision
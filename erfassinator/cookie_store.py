@@ -0,0 +1,64 @@
+"""Session cookies kept on disk so a restart can skip the login flow."""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_COOKIE_PATH = Path.home() / ".erfassinator" / "session.json"
+
+
+@dataclass
+class StoredSession:
+    """Cookies of a logged in portal session."""
+
+    account: str
+    url: str
+    # Dicts with name, value, domain, path, secure and expires
+    cookies: list[dict[str, Any]] = field(default_factory=list)
+
+
+class CookieStore:
+    """JSON file holding the session of the last logged in account.
+
+    The cookies grant access to the portal like a password, so the file is
+    only readable by the user (mode 0600, directory 0700) and is replaced
+    atomically.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_COOKIE_PATH):
+        self.path = Path(path)
+
+    def load(self) -> StoredSession | None:
+        """The stored session, or None if there is none or it is unreadable."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+            return StoredSession(data["account"], data["url"], list(data["cookies"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, session: StoredSession):
+        """Replace the stored session."""
+        directory = self.path.parent
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkdir leaves the mode of an existing directory alone
+        directory.chmod(0o700)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        # A leftover file would keep its old permissions
+        temporary.unlink(missing_ok=True)
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(descriptor, "w", encoding="utf-8") as file:
+            json.dump(
+                {"account": session.account, "url": session.url, "cookies": session.cookies},
+                file,
+            )
+        os.replace(temporary, self.path)
+
+    def clear(self):
+        """Forget the stored session."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -1,6 +1,15 @@
 """Data collector for fetching data from backend."""
 
-from typing import Any
+from typing import Any, Callable
+
+from erfassinator.entries import DataEntry, EntryCollection
+
+
+def _as_collection(entries: Any) -> EntryCollection:
+    """Wrap plain entry lists of older backends into a collection."""
+    if isinstance(entries, EntryCollection):
+        return entries
+    return EntryCollection(entries)
 
 
 class DataCollector:
@@ -9,9 +18,46 @@ class DataCollector:
     def __init__(self, backend: Any):
         self.backend = backend
 
-    def fetch_all(self) -> list[Any]:
+    def fetch_all(self) -> EntryCollection:
         """Fetch all data entries from the backend."""
         try:
-            return self.backend.fetch_data()
+            return _as_collection(self.backend.fetch_data())
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch data: {str(e)}")
+
+    async def fetch_all_async(self) -> EntryCollection:
+        """Fetch all data entries from an `AsyncBackend`."""
+        try:
+            return _as_collection(await self.backend.fetch_data())
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch data: {str(e)}")
+
+    def fetch_paged(self, page_callback: Callable[[list[DataEntry]], None]) -> int:
+        """
+        Fetch the data entries page by page.
+
+        Args:
+            page_callback: Called with every page as soon as it arrived
+
+        Returns:
+            Number of entries fetched
+        """
+        count = 0
+        try:
+            for page in self.backend.fetch_pages():
+                count += len(page)
+                page_callback(page)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch data: {str(e)}")
+        return count
+
+    async def fetch_paged_async(self, page_callback: Callable[[list[DataEntry]], None]) -> int:
+        """Fetch the data entries of an `AsyncBackend` page by page."""
+        count = 0
+        try:
+            async for page in self.backend.fetch_pages():
+                count += len(page)
+                page_callback(page)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch data: {str(e)}")
+        return count
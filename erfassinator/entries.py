@@ -0,0 +1,130 @@
+"""Data entries and the indexed collection shared by all layers."""
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+# Status shown for reports after a successful "Berichte erfassen"
+CAPTURED_STATUS = "Berichte erwarten Freigabe"
+
+# Parts of GesamtStatus texts of reports that were already captured
+CAPTURED_STATUS_MARKERS = ("erwarten freigabe", "erfasst", "freigegeben")
+
+
+@dataclass(slots=True)
+class DataEntry:
+    """Represents a data entry from the website."""
+
+    id: int
+    title: str
+    date: str
+    status: str
+    description: str
+
+
+def needs_capture(entry: DataEntry) -> bool:
+    """Check whether "Berichte erfassen" still has to be applied to an entry."""
+    status = entry.status.lower()
+    return not any(marker in status for marker in CAPTURED_STATUS_MARKERS)
+
+
+class EntryCollection:
+    """Ordered entries with an id index and a secondary status index.
+
+    Lookups by id are O(1); selecting by status is O(k) in the number of
+    matches and keeps insertion order. Date filters use `QueryIndex`.
+    """
+
+    def __init__(self, entries: Iterable[DataEntry] = ()):
+        self._by_id: dict[int, DataEntry] = {}
+        self._by_status: dict[str, dict[int, None]] = {}
+        self.extend(entries)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[DataEntry]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, entry_id: object) -> bool:
+        return entry_id in self._by_id
+
+    def get(self, entry_id: int) -> DataEntry | None:
+        """Return the entry with the given id, if present."""
+        return self._by_id.get(entry_id)
+
+    def ids(self) -> list[int]:
+        """Return all entry ids in order."""
+        return list(self._by_id)
+
+    def add(self, entry: DataEntry):
+        """Add an entry, replacing an existing one with the same id."""
+        if entry.id in self._by_id:
+            self._unindex(self._by_id[entry.id])
+        self._by_id[entry.id] = entry
+        self._index(entry)
+
+    def extend(self, entries: Iterable[DataEntry]):
+        """Add several entries."""
+        for entry in entries:
+            self.add(entry)
+
+    def remove(self, entry_id: int) -> DataEntry | None:
+        """Remove an entry and return it, if present."""
+        entry = self._by_id.pop(entry_id, None)
+        if entry is not None:
+            self._unindex(entry)
+        return entry
+
+    def clear(self):
+        """Remove all entries."""
+        self._by_id.clear()
+        self._by_status.clear()
+
+    def set_status(self, entry_id: int, status: str) -> bool:
+        """Change the status of an entry. Returns whether it changed."""
+        entry = self._by_id.get(entry_id)
+        if entry is None or entry.status == status:
+            return False
+        self._discard(self._by_status, entry.status, entry_id)
+        entry.status = status
+        self._by_status.setdefault(status, {})[entry_id] = None
+        return True
+
+    def with_status(self, status: str) -> list[DataEntry]:
+        """Return the entries having the given status."""
+        return [self._by_id[entry_id] for entry_id in self._by_status.get(status, ())]
+
+    def status_counts(self) -> dict[str, int]:
+        """Return the number of entries per status."""
+        return {status: len(ids) for status, ids in self._by_status.items()}
+
+    def apply_results(
+        self,
+        results: dict[int, tuple[bool, str]],
+        status: str = CAPTURED_STATUS,
+    ) -> list[int]:
+        """
+        Set `status` on every successfully processed entry.
+
+        Returns:
+            IDs of the entries whose status changed
+        """
+        return [
+            entry_id
+            for entry_id, (success, _) in results.items()
+            if success and self.set_status(entry_id, status)
+        ]
+
+    def _index(self, entry: DataEntry):
+        self._by_status.setdefault(entry.status, {})[entry.id] = None
+
+    def _unindex(self, entry: DataEntry):
+        self._discard(self._by_status, entry.status, entry.id)
+
+    @staticmethod
+    def _discard(index: dict[str, dict[int, None]], key: str, entry_id: int):
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(entry_id, None)
+            if not ids:
+                del index[key]
@@ -0,0 +1,179 @@
+"""Persistent local store of fetched data entries."""
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from erfassinator.entries import DataEntry, EntryCollection
+
+DEFAULT_STORE_PATH = Path.home() / ".erfassinator" / "entries.sqlite3"
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    account TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    description TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (account, id)
+)
+"""
+
+
+@dataclass
+class SyncResult:
+    """Changes found while refreshing the store from the portal."""
+
+    added: list[DataEntry] = field(default_factory=list)
+    changed: list[DataEntry] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+
+    def merge(self, other: "SyncResult"):
+        """Add the changes of `other` to this result."""
+        self.added.extend(other.added)
+        self.changed.extend(other.changed)
+        self.removed.extend(other.removed)
+
+    @property
+    def summary(self) -> str:
+        """Short description of the change counts."""
+        return (
+            f"{len(self.added)} neu, {len(self.changed)} geändert, "
+            f"{len(self.removed)} entfernt"
+        )
+
+
+class SyncCancelled(RuntimeError):
+    """The refresh was cancelled; its remaining pages are not stored."""
+
+
+class EntryStore:
+    """SQLite backed store of the last known entries of each account."""
+
+    def __init__(self, path: Path | str = DEFAULT_STORE_PATH):
+        """
+        Args:
+            path: Database file, or ":memory:" for a non-persistent store
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def load(self, account: str) -> EntryCollection:
+        """Return the stored entries of an account in portal order."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, title, date, status, description FROM entries "
+                "WHERE account = ? ORDER BY position",
+                (account,),
+            ).fetchall()
+        return EntryCollection(DataEntry(*row) for row in rows)
+
+    def start_sync(self, account: str) -> "StoreSync":
+        """Begin refreshing the entries of an account."""
+        return StoreSync(self, account)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class StoreSync:
+    """A single refresh of one account, fed page by page.
+
+    Call `update` for every fetched page and `finish` once the portal
+    delivered all entries; only then are vanished entries removed. Only one
+    sync per account may write at a time: a second one would find the rows
+    of the first already stored and not report them as added.
+    """
+
+    def __init__(self, store: EntryStore, account: str):
+        self._store = store
+        self.account = account
+        self.result = SyncResult()
+        self._seen: set[int] = set()
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop writing; once this returns, `update` and `finish` raise `SyncCancelled`."""
+        with self._store._lock:
+            self._cancelled = True
+
+    def update(self, entries: Iterable[DataEntry]) -> SyncResult:
+        """Store a page of entries and return what changed on it."""
+        entries = list(entries)
+        delta = SyncResult()
+        connection = self._store._connection
+
+        with self._store._lock, connection:
+            if self._cancelled:
+                raise SyncCancelled("Refresh cancelled")
+            stored = {}
+            ids = [entry.id for entry in entries]
+            for start in range(0, len(ids), _QUERY_CHUNK):
+                chunk = ids[start : start + _QUERY_CHUNK]
+                rows = connection.execute(
+                    "SELECT id, title, date, status, description FROM entries "
+                    f"WHERE account = ? AND id IN ({', '.join('?' * len(chunk))})",
+                    (self.account, *chunk),
+                )
+                stored.update((row[0], row) for row in rows)
+
+            for entry in entries:
+                row = (entry.id, entry.title, entry.date, entry.status, entry.description)
+                if entry.id not in stored:
+                    delta.added.append(entry)
+                elif stored[entry.id] != row:
+                    delta.changed.append(entry)
+
+            position = len(self._seen)
+            connection.executemany(
+                "INSERT INTO entries "
+                "(account, id, title, date, status, description, position) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (account, id) DO UPDATE SET title = excluded.title, "
+                "date = excluded.date, status = excluded.status, "
+                "description = excluded.description, position = excluded.position",
+                [
+                    (self.account, entry.id, entry.title, entry.date,
+                     entry.status, entry.description, position + index)
+                    for index, entry in enumerate(entries)
+                ],
+            )
+
+        self._seen.update(ids)
+        self.result.merge(delta)
+        return delta
+
+    def finish(self) -> SyncResult:
+        """Remove entries the portal no longer lists; return all changes."""
+        connection = self._store._connection
+
+        with self._store._lock, connection:
+            if self._cancelled:
+                raise SyncCancelled("Refresh cancelled")
+            stored_ids = [
+                row[0]
+                for row in connection.execute(
+                    "SELECT id FROM entries WHERE account = ?", (self.account,)
+                )
+            ]
+            removed = [entry_id for entry_id in stored_ids if entry_id not in self._seen]
+            connection.executemany(
+                "DELETE FROM entries WHERE account = ? AND id = ?",
+                [(self.account, entry_id) for entry_id in removed],
+            )
+
+        self.result.removed.extend(removed)
+        return self.result
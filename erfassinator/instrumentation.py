@@ -0,0 +1,176 @@
+"""Per-request timing instrumentation for the portal backend.
+
+`RequestMetrics` collects latency samples and byte counts per endpoint (or
+per named step such as an HTML parse) and exports them as JSON or CSV.
+Installed on a `requests.Session`, a response hook records every request
+without touching the calling code.
+"""
+
+import csv
+import json
+import re
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# Upper bucket bounds of the exported latency histograms in milliseconds
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Samples kept per endpoint for percentiles
+_SAMPLE_LIMIT = 10_000
+
+# Seconds of history used for the requests/s rate
+_RATE_WINDOW = 5.0
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Name of an endpoint with numeric IDs folded, e.g. `GET /Einsatz/X/{id}`."""
+    path = re.sub(r"^[a-z]+://[^/]+", "", url, flags=re.IGNORECASE).split("?", 1)[0]
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path) or '/'}"
+
+
+def _short_name(name: str) -> str:
+    """Method and last path segment of an endpoint name."""
+    method, _, path = name.partition(" ")
+    segments = [segment for segment in path.split("/") if segment and segment != "{id}"]
+    return f"{method} {segments[-1] if segments else '/'}"
+
+
+class _Series:
+    """Samples, histogram and byte count of one endpoint."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.bytes = 0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        # (finish time, duration) of the most recent samples
+        self.samples: deque[tuple[float, float]] = deque(maxlen=_SAMPLE_LIMIT)
+
+    def add(self, seconds: float, nbytes: int):
+        self.count += 1
+        self.total += seconds
+        self.bytes += nbytes
+        milliseconds = seconds * 1000
+        for index, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if milliseconds <= bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.samples.append((time.monotonic(), seconds))
+
+    def stats(self, now: float) -> dict[str, Any]:
+        durations = sorted(duration for _, duration in self.samples)
+        recent = sum(1 for finished, _ in self.samples if now - finished <= _RATE_WINDOW)
+        return {
+            "count": self.count,
+            "bytes": self.bytes,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": _quantile(durations, 0.50) * 1000,
+            "p95_ms": _quantile(durations, 0.95) * 1000,
+            "max_ms": durations[-1] * 1000 if durations else 0.0,
+            "rate_per_s": recent / _RATE_WINDOW,
+            "histogram_ms": dict(
+                zip([*map(str, HISTOGRAM_BOUNDS_MS), "inf"], self.buckets)
+            ),
+        }
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    if len(ordered) == 1:
+        return ordered[0]
+    return statistics.quantiles(ordered, n=100, method="inclusive")[round(q * 100) - 1]
+
+
+class RequestMetrics:
+    """Thread-safe latency and byte counters keyed by endpoint or step name."""
+
+    def __init__(self):
+        self._series: dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, nbytes: int = 0):
+        """Record one sample of `name`."""
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series()
+            series.add(seconds, nbytes)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the duration of the enclosed block as a sample of `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def install(self, session: Any):
+        """Record every response of a `requests.Session`."""
+        session.hooks["response"].append(self._on_response)
+
+    def _on_response(self, response: Any, *args: Any, **kwargs: Any):
+        # `elapsed` covers sending the request until the headers arrived
+        self.record(
+            endpoint_name(response.request.method, response.request.url),
+            response.elapsed.total_seconds(),
+            len(response.content),
+        )
+
+    def reset(self):
+        """Drop all samples."""
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Statistics of every endpoint and step."""
+        now = time.monotonic()
+        with self._lock:
+            return {name: series.stats(now) for name, series in sorted(self._series.items())}
+
+    def summary(self, active_only: bool = False) -> str:
+        """
+        One-line p50/p95 and requests/s overview of the HTTP endpoints.
+
+        Args:
+            active_only: Only include endpoints requested in the last seconds
+        """
+        parts = []
+        total_rate = 0.0
+        for name, stats in self.snapshot().items():
+            if not name.startswith(("GET ", "POST ")):
+                continue
+            if active_only and not stats["rate_per_s"]:
+                continue
+            total_rate += stats["rate_per_s"]
+            parts.append(f"{_short_name(name)} p50 {stats['p50_ms']:.0f} ms / p95 {stats['p95_ms']:.0f} ms")
+        if not parts:
+            return ""
+        return f"{' | '.join(parts)} | {total_rate:.1f} Anfragen/s"
+
+    def export_json(self, path: str):
+        """Write the statistics of all endpoints to a JSON file."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, indent=2)
+
+    def export_csv(self, path: str):
+        """Write the statistics of all endpoints to a CSV file."""
+        fields = ["name", "count", "bytes", "mean_ms", "p50_ms", "p95_ms", "max_ms", "rate_per_s"]
+        buckets = [f"le_{bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + ["le_infms"]
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(fields + buckets)
+            for name, stats in self.snapshot().items():
+                writer.writerow(
+                    [name] + [stats[field] for field in fields[1:]]
+                    + list(stats["histogram_ms"].values())
+                )
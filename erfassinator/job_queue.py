@@ -0,0 +1,374 @@
+"""Single scheduler for action jobs: priorities, cancel, pause and dedup."""
+
+import itertools
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Iterable
+
+from erfassinator.action_processor import ActionProcessor, ActionResults, ResultCallback
+from erfassinator.backend import SessionExpiredError
+from erfassinator.entries import EntryCollection
+
+# Job priorities; lower values run first
+PRIORITY_SELECTION = 0
+PRIORITY_ALL = 10
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+CANCELLED = "cancelled"
+DONE = "done"
+
+# Runs one entry with an acquired limiter ticket (or None) and returns its result
+EntryRunner = Callable[[int, int | None], tuple[bool, str]]
+
+# Starts one entry like `EntryRunner`, e.g. on an event loop, without waiting
+EntryStarter = Callable[[int, int | None], "Future[tuple[bool, str]]"]
+
+
+@dataclass(eq=False)
+class ActionJob:
+    """Entries queued for the action with a common priority."""
+
+    id: int
+    priority: int
+    total: int
+    state: str = QUEUED
+    results: ActionResults = field(default_factory=ActionResults)
+    # Entries still waiting, as an ordered set
+    pending: dict[int, None] = field(default_factory=dict)
+    in_flight: int = 0
+    finished: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def completed(self) -> int:
+        return len(self.results)
+
+
+class JobQueue:
+    """Runs queued action jobs on a set of persistent worker threads.
+
+    With `start_entry` a single dispatcher thread starts the entries instead
+    (e.g. as coroutines of one event loop) and their completion callbacks
+    record the results, so no thread waits for an entry in flight.
+
+    Whenever a worker (and, with an adaptive limiter, a slot of its window)
+    is free, it takes the next entry from the job with the lowest priority
+    value (oldest first), so a new job overtakes a running one with the
+    next free slot. An entry is queued at most once: submitting it again
+    moves it to the new job if that one has a higher priority and is
+    ignored otherwise. While paused or cancelled, the entries in flight
+    still complete. An entry failing with `SessionExpiredError` was not
+    applied: it goes back to the front of its job and the queue pauses
+    until `resume` is called after a new login.
+    """
+
+    def __init__(
+        self,
+        processor: ActionProcessor,
+        workers: int | None = None,
+        run_entry: EntryRunner | None = None,
+        start_entry: EntryStarter | None = None,
+        result_callback: ResultCallback | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        job_callback: Callable[[ActionJob], None] | None = None,
+        expired_callback: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            processor: Processor applying the action (and its journal)
+            workers: Worker threads (default: the processor's concurrency,
+                or the maximum of its limiter)
+            run_entry: Optional replacement for `processor.process_entry`
+            start_entry: Starts entries without blocking instead of `run_entry`,
+                e.g. coroutines on an event loop; one dispatcher thread then
+                keeps up to `workers` entries in flight
+            result_callback: Called from the worker for every finished entry
+            progress_callback: Called from the worker with (done, total) of
+                all jobs since the queue was last idle
+            job_callback: Called from the worker when a job is done or cancelled
+            expired_callback: Called from the worker once the session expired
+                and the queue paused for a new login
+        """
+        self.processor = processor
+        limit = processor.limiter.maximum if processor.limiter else processor.max_workers
+        self.workers = workers or max(1, limit)
+        self.run_entry = run_entry or processor.process_entry
+        self.start_entry = start_entry
+        # Entries in flight of the dispatcher of `start_entry`
+        self._slots = threading.Semaphore(self.workers)
+        self.result_callback = result_callback
+        self.progress_callback = progress_callback
+        self.job_callback = job_callback
+        self.expired_callback = expired_callback
+
+        self._condition = threading.Condition()
+        self._jobs: list[ActionJob] = []
+        # Job owning each queued entry ID
+        self._owners: dict[int, ActionJob] = {}
+        self._in_flight: set[int] = set()
+        self._ids = itertools.count(1)
+        self._paused = False
+        self._session_expired = False
+        self._done = 0
+        self._total = 0
+        self._journal_open = False
+        self._workers = 0
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    @property
+    def session_expired(self) -> bool:
+        """Whether the queue paused for a new login."""
+        return self._session_expired
+
+    @property
+    def busy(self) -> bool:
+        """Whether any job is queued or running."""
+        with self._condition:
+            return bool(self._jobs)
+
+    def submit(
+        self,
+        entries: Iterable[int] | EntryCollection,
+        priority: int = PRIORITY_ALL,
+        resume: bool = False,
+    ) -> ActionJob:
+        """
+        Queue entries for the action.
+
+        Entries rejected by the processor's status predicate are listed in
+        the job's `results.skipped`; with `resume`, entries the journal
+        records as applied are left out.
+        """
+        entry_ids, skipped = self.processor.select(entries)
+        journal = self.processor.journal
+        if resume and journal is not None:
+            entry_ids = journal.pending(entry_ids)
+
+        with self._condition:
+            job = ActionJob(next(self._ids), priority, 0)
+            job.results.skipped = skipped
+            for entry_id in entry_ids:
+                if entry_id in self._in_flight or entry_id in job.pending:
+                    continue
+                owner = self._owners.get(entry_id)
+                if owner is not None:
+                    if owner.priority <= priority:
+                        continue
+                    # Overtake the queued entry of a lower priority job
+                    del owner.pending[entry_id]
+                    owner.total -= 1
+                    self._total -= 1
+                job.pending[entry_id] = None
+                self._owners[entry_id] = job
+            job.total = len(job.pending)
+            self._total += job.total
+
+            if not job.pending:
+                job.state = DONE
+                job.finished.set()
+            else:
+                self._jobs.append(job)
+                if journal is not None:
+                    if self._journal_open:
+                        journal.extend_run(job.pending)
+                    else:
+                        journal.start_run(job.pending)
+                        self._journal_open = True
+                self._ensure_workers()
+                self._condition.notify_all()
+
+        if job.state == DONE and self.job_callback:
+            self.job_callback(job)
+        return job
+
+    def cancel(self, job: ActionJob | None = None):
+        """Drop the waiting entries of a job (default: of all jobs)."""
+        with self._condition:
+            for current in [job] if job is not None else list(self._jobs):
+                if current.state in (CANCELLED, DONE):
+                    continue
+                for entry_id in current.pending:
+                    del self._owners[entry_id]
+                self._total -= len(current.pending)
+                current.pending.clear()
+                current.state = CANCELLED
+            finished = self._collect_finished()
+            self._condition.notify_all()
+        self._report(finished)
+
+    def pause(self):
+        """Stop starting new entries."""
+        with self._condition:
+            self._paused = True
+
+    def resume(self):
+        """Continue starting entries."""
+        with self._condition:
+            self._paused = False
+            self._session_expired = False
+            self._condition.notify_all()
+
+    def jobs(self) -> list[ActionJob]:
+        """Jobs that are queued or running."""
+        with self._condition:
+            return list(self._jobs)
+
+    def _ensure_workers(self):
+        """Start workers up to `workers`, or the dispatcher (lock held)."""
+        while self._workers < (1 if self.start_entry else self.workers):
+            self._workers += 1
+            threading.Thread(
+                target=self._dispatch if self.start_entry else self._work,
+                name="erfassinator-jobs",
+                daemon=True,
+            ).start()
+
+    def _next_entry(self) -> tuple[ActionJob, int] | None:
+        """Take the next entry of the most urgent job; None if idle."""
+        with self._condition:
+            while True:
+                waiting = [job for job in self._jobs if job.pending]
+                if waiting and not self._paused:
+                    break
+                if not self._jobs:
+                    self._workers -= 1
+                    return None
+                self._condition.wait()
+            job = min(waiting, key=lambda job: (job.priority, job.id))
+            entry_id = next(iter(job.pending))
+            del job.pending[entry_id]
+            del self._owners[entry_id]
+            self._in_flight.add(entry_id)
+            job.in_flight += 1
+            job.state = RUNNING
+            return job, entry_id
+
+    def _work(self):
+        limiter = self.processor.limiter
+        while True:
+            # Wait for a slot of the window before choosing the entry, so
+            # priority and cancel still apply to everything not yet started
+            ticket = limiter.acquire() if limiter is not None else None
+            taken = self._next_entry()
+            if taken is None:
+                if ticket is not None:
+                    limiter.cancel(ticket)
+                return
+            job, entry_id = taken
+            try:
+                result = self.run_entry(entry_id, ticket)
+            except Exception as e:
+                self._complete(job, entry_id, e)
+            else:
+                self._complete(job, entry_id, result)
+
+    def _dispatch(self):
+        """Start entries through `start_entry` while slots are free."""
+        limiter = self.processor.limiter
+        while True:
+            self._slots.acquire()
+            ticket = limiter.acquire() if limiter is not None else None
+            taken = self._next_entry()
+            if taken is None:
+                if ticket is not None:
+                    limiter.cancel(ticket)
+                self._slots.release()
+                return
+            job, entry_id = taken
+            try:
+                future = self.start_entry(entry_id, ticket)
+            except Exception as e:
+                self._slots.release()
+                self._complete(job, entry_id, e)
+            else:
+                future.add_done_callback(partial(self._started_done, job, entry_id, ticket))
+
+    def _started_done(self, job: ActionJob, entry_id: int, ticket: int | None, future: Future):
+        """Completion of an entry of `start_entry`, on the thread finishing it."""
+        self._slots.release()
+        if future.cancelled():
+            if ticket is not None:
+                self.processor.limiter.cancel(ticket)
+            self._complete(job, entry_id, RuntimeError("cancelled"))
+        elif future.exception() is not None:
+            self._complete(job, entry_id, future.exception())
+        else:
+            self._complete(job, entry_id, future.result())
+
+    def _complete(
+        self, job: ActionJob, entry_id: int, outcome: tuple[bool, str] | BaseException
+    ):
+        """Record the result of an entry, or put it back after an expiry."""
+        if isinstance(outcome, SessionExpiredError):
+            self._requeue(job, entry_id)
+            return
+        if isinstance(outcome, BaseException):
+            outcome = (False, f"Error: {str(outcome)}")
+        self._record(job, entry_id, outcome)
+
+        with self._condition:
+            finished = self._collect_finished()
+            if finished:
+                self._condition.notify_all()
+        self._report(finished)
+
+    def _requeue(self, job: ActionJob, entry_id: int):
+        """Put back an entry that hit an expired session and pause."""
+        with self._condition:
+            job.in_flight -= 1
+            self._in_flight.discard(entry_id)
+            if job.state == CANCELLED:
+                job.total -= 1
+                self._total -= 1
+            else:
+                job.pending = {entry_id: None, **job.pending}
+                self._owners[entry_id] = job
+            self._paused = True
+            notify = not self._session_expired
+            self._session_expired = True
+            finished = self._collect_finished()
+            self._condition.notify_all()
+        self._report(finished)
+        if notify and self.expired_callback:
+            self.expired_callback()
+
+    def _record(self, job: ActionJob, entry_id: int, result: tuple[bool, str]):
+        journal = self.processor.journal
+        if journal is not None:
+            journal.record(entry_id, result)
+        with self._condition:
+            job.results[entry_id] = result
+            job.in_flight -= 1
+            self._in_flight.discard(entry_id)
+            self._done += 1
+            done, total = self._done, self._total
+        if self.result_callback:
+            self.result_callback(entry_id, result)
+        if self.progress_callback:
+            self.progress_callback(done, total)
+
+    def _collect_finished(self) -> list[ActionJob]:
+        """Remove jobs without waiting or running entries (lock held)."""
+        finished = [job for job in self._jobs if not job.pending and not job.in_flight]
+        for job in finished:
+            self._jobs.remove(job)
+            if job.state != CANCELLED:
+                job.state = DONE
+        if not self._jobs:
+            self._done = self._total = 0
+            if self._journal_open:
+                self.processor.journal.finish_run()
+                self._journal_open = False
+        return finished
+
+    def _report(self, finished: list[ActionJob]):
+        for job in finished:
+            job.finished.set()
+            if self.job_callback:
+                self.job_callback(job)
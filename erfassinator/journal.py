@@ -0,0 +1,169 @@
+"""Append-only journal of action outcomes for resuming interrupted runs."""
+
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+DEFAULT_JOURNAL_PATH = Path.home() / ".erfassinator" / "journal.jsonl"
+
+
+@dataclass
+class InterruptedRun:
+    """The last run of an account that ended without its finish marker."""
+
+    run_id: str
+    total: int
+    # Entries of the run without a successful outcome
+    remaining: list[int]
+
+
+class ActionJournal:
+    """JSON-lines file recording every run and the outcome of each entry.
+
+    Each line is one record: a `start` marker with the entry IDs of the run,
+    `add` markers for entries queued while it runs, one outcome per processed
+    entry and a `finish` marker. A run without a finish marker was
+    interrupted. Entries whose latest outcome succeeded count as completed
+    and are skipped when resuming.
+
+    The file is read once; afterwards the in-memory state is kept up to date
+    by the writes of this instance.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_JOURNAL_PATH, account: str = ""):
+        """
+        Args:
+            path: Journal file, created on the first write
+            account: Account the runs belong to
+        """
+        self.path = Path(path)
+        self.account = account
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._run_id: str | None = None
+        self._loaded = False
+        # Per account: IDs whose latest outcome succeeded
+        self._completed: dict[str, set[int]] = {}
+        # Per account: (run id, entry IDs, finished) of the latest run
+        self._last_run: dict[str, tuple[str, list[int], bool]] = {}
+
+    def start_run(self, entry_ids: Iterable[int]) -> str:
+        """Write the start marker of a run and return its ID."""
+        entry_ids = list(entry_ids)
+        with self._lock:
+            self._ensure_loaded()
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._run_id = uuid.uuid4().hex
+            self._last_run[self.account] = (self._run_id, entry_ids, False)
+            self._write({"event": "start", "ids": entry_ids})
+            return self._run_id
+
+    def extend_run(self, entry_ids: Iterable[int]):
+        """Add entries to the running run."""
+        entry_ids = list(entry_ids)
+        with self._lock:
+            if self._run_id is None:
+                raise RuntimeError("No journal run started")
+            self._last_run[self.account][1].extend(entry_ids)
+            self._write({"event": "add", "ids": entry_ids})
+
+    def record(self, entry_id: int, result: tuple[bool, str]):
+        """Append the outcome of one entry to the running run."""
+        success, message = result
+        with self._lock:
+            if self._run_id is None:
+                raise RuntimeError("No journal run started")
+            completed = self._completed.setdefault(self.account, set())
+            if success:
+                completed.add(entry_id)
+            else:
+                completed.discard(entry_id)
+            self._write({"id": entry_id, "success": success, "message": message})
+
+    def finish_run(self):
+        """Write the finish marker and close the file."""
+        with self._lock:
+            if self._run_id is None:
+                return
+            self._write({"event": "finish"})
+            run_id, entry_ids, _ = self._last_run[self.account]
+            self._last_run[self.account] = (run_id, entry_ids, True)
+            self._run_id = None
+            self._close()
+
+    def completed_ids(self) -> set[int]:
+        """IDs of the account whose latest recorded outcome succeeded."""
+        with self._lock:
+            self._ensure_loaded()
+            return set(self._completed.get(self.account, ()))
+
+    def pending(self, entry_ids: Iterable[int]) -> list[int]:
+        """The given IDs without the completed ones, in their order."""
+        completed = self.completed_ids()
+        return [entry_id for entry_id in entry_ids if entry_id not in completed]
+
+    def interrupted_run(self) -> InterruptedRun | None:
+        """The account's last run, if it ended without finish marker."""
+        with self._lock:
+            self._ensure_loaded()
+            last = self._last_run.get(self.account)
+            if last is None or last[2] or last[0] == self._run_id:
+                return None
+            run_id, entry_ids, _ = last
+            completed = self._completed.get(self.account, set())
+            remaining = [entry_id for entry_id in entry_ids if entry_id not in completed]
+            return InterruptedRun(run_id, len(entry_ids), remaining)
+
+    def _write(self, record: dict[str, Any]):
+        assert self._file is not None
+        record = {"run": self._run_id, "account": self.account, "time": time.time(), **record}
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # Flushed per record so a crash loses at most the entry in flight
+        self._file.flush()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            file = open(self.path, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Line cut off by a crash
+                self._replay(record)
+
+    def _replay(self, record: dict[str, Any]):
+        account = record.get("account", "")
+        event = record.get("event")
+        if event == "start":
+            self._last_run[account] = (record["run"], record["ids"], False)
+        elif event == "add":
+            last = self._last_run.get(account)
+            if last is not None and last[0] == record["run"]:
+                last[1].extend(record["ids"])
+        elif event == "finish":
+            last = self._last_run.get(account)
+            if last is not None and last[0] == record["run"]:
+                self._last_run[account] = (last[0], last[1], True)
+        elif "id" in record:
+            completed = self._completed.setdefault(account, set())
+            if record.get("success"):
+                completed.add(record["id"])
+            else:
+                completed.discard(record["id"])
@@ -2,25 +2,119 @@
 Erfassinator - FW Portal Daten Manager
 
 Haupteinstiegspunkt der Anwendung.
+
+GUI-Module (tkinter) werden erst geladen, wenn die Oberfläche gestartet wird,
+damit `erfassinator batch` auch ohne Display schnell startet.
 """
 
-import tkinter as tk
+import argparse
+import importlib
+import sys
+import threading
 
-# from erfassinator.backend import DummyBackend
-from erfassinator.backend import FWPortalBackend
-from erfassinator.main_window import MainWindow
 
+def build_parser() -> argparse.ArgumentParser:
+    """Kommandozeilen-Parser für GUI und Batch-Modus."""
+    from erfassinator.cli import add_batch_arguments
+
+    parser = argparse.ArgumentParser(prog="erfassinator")
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="asyncio-Backend verwenden (benötigt aiohttp)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("portal", "synthetic"),
+        default="portal",
+        help="FW Portal oder erzeugte Testdaten für Lasttests (Standard: portal)",
+    )
+    parser.add_argument(
+        "--synthetic",
+        default="",
+        metavar="EINSTELLUNGEN",
+        help='Testdaten für --backend synthetic, z.B. "entries=100000,latency=0.05,'
+        'latency_sigma=0.5,error_rate=0.01,expiry_rate=0.001,relogin_failure_rate=0,seed=1"',
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    add_batch_arguments(
+        subparsers.add_parser(
+            "batch", help="Berichte ohne Oberfläche erfassen (JSON-Zeilen auf stdout)"
+        )
+    )
+    return parser
+
+
+def run_gui(args: argparse.Namespace):
+    """Oberfläche starten."""
+    import tkinter as tk
+
+    # from erfassinator.backend import DummyBackend
+    from erfassinator.backend import FWPortalBackend
+    from erfassinator.cookie_store import CookieStore
+    from erfassinator.entry_store import EntryStore
+    from erfassinator.journal import ActionJournal
+    from erfassinator.main_window import MainWindow
 
-def main():
-    """Haupteinstiegspunkt der Anwendung."""
     # Backend erstellen
-    backend = FWPortalBackend()
+    if args.backend == "synthetic":
+        from erfassinator.synthetic_backend import SyntheticBackend, SyntheticConfig
+
+        # Testdaten nicht in den echten Speicher, das Protokoll oder die Sitzung schreiben
+        root = tk.Tk()
+        MainWindow(root, SyntheticBackend(SyntheticConfig.from_spec(args.synthetic)))
+        root.mainloop()
+        return
+    if args.use_async:
+        from erfassinator.async_backend import AsyncFWPortalBackend
+
+        backend = AsyncFWPortalBackend()
+    else:
+        backend = FWPortalBackend()
+
+    # requests im Hintergrund laden, während der Anmeldedialog angezeigt wird
+    threading.Thread(
+        target=importlib.import_module, args=("requests",), daemon=True
+    ).start()
 
     # GUI erstellen und starten
     root = tk.Tk()
-    app = MainWindow(root, backend)
+    app = MainWindow(
+        root,
+        backend,
+        entry_store=EntryStore(),
+        journal=ActionJournal(),
+        cookie_store=CookieStore(),
+    )
     root.mainloop()
 
 
+def main():
+    """Haupteinstiegspunkt der Anwendung."""
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.backend == "synthetic":
+        if args.use_async:
+            parser.error("--backend synthetic unterstützt kein --async")
+        try:
+            from erfassinator.synthetic_backend import SyntheticConfig
+
+            SyntheticConfig.from_spec(args.synthetic)
+        except ValueError as e:
+            parser.error(f"--synthetic: {e}")
+
+    if args.command == "batch":
+        if args.use_async and args.parse_processes > 0:
+            # The asyncio backend parses on its event loop only
+            parser.error("--parse-processes unterstützt kein --async")
+
+        from erfassinator.cli import run_batch
+
+        sys.exit(run_batch(args))
+
+    run_gui(args)
+
+
 if __name__ == "__main__":
     main()
@@ -1,33 +1,141 @@
 """Main application window."""
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import threading
-from erfassinator.backend import Backend, DataEntry
+from tkinter import ttk, messagebox, filedialog
+from collections import deque
+from dataclasses import replace
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, Callable, Iterable
+from erfassinator.backend import Backend
+from erfassinator.entries import CAPTURED_STATUS, DataEntry, EntryCollection, needs_capture
+from erfassinator.async_backend import AsyncBackend
+from erfassinator.background import BackgroundLoop
+from erfassinator.cookie_store import CookieStore, StoredSession
+from erfassinator.entry_store import EntryStore, StoreSync, SyncResult
+from erfassinator.instrumentation import RequestMetrics
+from erfassinator.journal import ActionJournal
+from erfassinator.progress import ProgressChannel, ProgressPoller
+from erfassinator.query import Query, QueryIndex, parse_query
 
 from erfassinator.login_dialog import LoginDialog
 from erfassinator.session_manager import SessionManager
 from erfassinator.data_collector import DataCollector
 from erfassinator.action_processor import ActionProcessor
+from erfassinator.concurrency import AdaptiveLimiter
+from erfassinator.job_queue import (
+    CANCELLED,
+    PRIORITY_ALL,
+    PRIORITY_SELECTION,
+    ActionJob,
+    JobQueue,
+)
+
+
+# Number of reports processed concurrently by "Berichte erfassen"
+ACTION_WORKERS = 4
+
+# Upper bound of the adaptive concurrency window (the transport pool size)
+MAX_ACTION_WORKERS = 10
+
+# Rows inserted into the table per Tk event loop iteration
+INSERT_CHUNK_SIZE = 500
+
+# Milliseconds between updates of the latency panel during a run
+METRICS_INTERVAL_MS = 500
+
+# Milliseconds after the last key press before the search runs
+SEARCH_DELAY_MS = 150
+
+# Sort key of each table column (see `query.SORT_KEYS`)
+COLUMN_SORT_KEYS = {
+    "ID": "id",
+    "Title": "title",
+    "Date": "date",
+    "Status": "status",
+    "Description": "description",
+}
+
+# Status filter choice showing all entries
+ALL_STATUSES = "Alle Status"
 
 
 class MainWindow:
     """Main application window with data table and actions."""
 
-    def __init__(self, root: tk.Tk, backend: Backend):
+    def __init__(
+        self,
+        root: tk.Tk,
+        backend: Backend | AsyncBackend,
+        max_workers: int = ACTION_WORKERS,
+        entry_store: EntryStore | None = None,
+        journal: ActionJournal | None = None,
+        cookie_store: CookieStore | None = None,
+    ):
         self.root = root
         self.backend = backend
+        # Without a persistent store the diffing works on an in-memory one
+        self.entry_store = entry_store or EntryStore(":memory:")
+        self.is_async = isinstance(backend, AsyncBackend)
+        self.background = BackgroundLoop()
         self.session_manager = SessionManager(backend)
         self.data_collector = DataCollector(backend)
-        self.action_processor = ActionProcessor(backend)
+        self.journal = journal
+        # Session of the last login, reused on the next start
+        self.cookie_store = cookie_store
+        # Starts at `max_workers` and adapts to the portal's response
+        self.limiter = AdaptiveLimiter(
+            initial=max_workers, maximum=max(max_workers, MAX_ACTION_WORKERS)
+        )
+        self.action_processor = ActionProcessor(
+            backend,
+            max_workers=max_workers,
+            max_per_host=self.limiter.maximum,
+            journal=journal,
+            needs_action=needs_capture,
+            limiter=self.limiter,
+        )
+        # Request timings of the backend; GUI steps are recorded alongside
+        self.metrics: RequestMetrics = getattr(backend, "metrics", None) or RequestMetrics()
+        self._actions_running = False
+        # Workers only queue updates; the poller applies them at a fixed rate
+        self._progress_channel = ProgressChannel()
+        self._progress_poller: ProgressPoller | None = None
+        # Single scheduler for all action jobs of the window
+        self.job_queue = JobQueue(
+            self.action_processor,
+            start_entry=self._start_entry_async if self.is_async else None,
+            result_callback=self._progress_channel.report_result,
+            progress_callback=self._progress_channel.report_progress,
+            job_callback=lambda job: self.root.after(0, self._handle_job_done, job),
+            expired_callback=lambda: self.root.after(0, self._handle_session_expired),
+        )
 
-        self.data_entries = []
+        self.data_entries = EntryCollection()
+        # Search indexes over `data_entries`, updated wherever it changes
+        self.query_index = QueryIndex(self.data_entries)
+        self._query = Query()
+        self._search_after: str | None = None
+        # Status filter choices ("status (count)") and their status
+        self._status_choices: dict[str, str | None] = {ALL_STATUSES: None}
+        # Treeview item of every displayed entry and the reverse mapping
+        self._row_iids: dict[int, str] = {}
+        self._iid_rows: dict[str, int] = {}
+        # Entry IDs waiting for chunked insertion into the table
+        self._pending_rows: deque[int] = deque()
+        self._insert_scheduled = False
+        # Account whose entries are shown (also the entry store key)
+        self._account: str | None = None
+        # Identifies the running refresh; pages of older ones are dropped
+        self._fetch_generation = 0
+        # Store sync of the running refresh; at most one writes at a time
+        self._sync: StoreSync | None = None
 
         self.root.title("Erfassinator - FW Portal Daten Manager")
         self.root.geometry("900x600")
 
         self._create_widgets()
-        self._show_login()
+        self._restore_session()
 
     def _create_widgets(self):
         """Create main window widgets."""
@@ -38,7 +146,7 @@ class MainWindow:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(1, weight=1)
+        main_frame.rowconfigure(2, weight=1)
 
         # Top bar with status and buttons
         top_frame = ttk.Frame(main_frame)
@@ -54,9 +162,34 @@ class MainWindow:
             side=tk.RIGHT, padx=5
         )
 
+        # Search and status filter
+        filter_frame = ttk.Frame(main_frame)
+        filter_frame.grid(row=1, column=0, sticky="ew", pady=(0, 5))
+
+        ttk.Label(filter_frame, text="Suche:").pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *_: self._schedule_search())
+        ttk.Entry(filter_frame, textvariable=self.search_var, width=40).pack(
+            side=tk.LEFT, padx=5
+        )
+
+        self.status_filter = ttk.Combobox(
+            filter_frame,
+            state="readonly",
+            width=35,
+            values=[ALL_STATUSES],
+            postcommand=self._update_status_facets,
+        )
+        self.status_filter.set(ALL_STATUSES)
+        self.status_filter.bind("<<ComboboxSelected>>", lambda _: self._apply_search())
+        self.status_filter.pack(side=tk.LEFT, padx=5)
+
+        self.result_label = ttk.Label(filter_frame, text="")
+        self.result_label.pack(side=tk.RIGHT, padx=5)
+
         # Data table frame
         table_frame = ttk.Frame(main_frame)
-        table_frame.grid(row=1, column=0, sticky="nsew")
+        table_frame.grid(row=2, column=0, sticky="nsew")
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
 
@@ -80,12 +213,18 @@ class MainWindow:
         vsb.config(command=self.tree.yview)
         hsb.config(command=self.tree.xview)
 
-        # Configure columns
-        self.tree.heading("ID", text="ID")
-        self.tree.heading("Title", text="Titel")
-        self.tree.heading("Date", text="Datum")
-        self.tree.heading("Status", text="Status")
-        self.tree.heading("Description", text="Beschreibung")
+        # Configure columns; a click on a heading sorts by it
+        self._headings = {
+            "ID": "ID",
+            "Title": "Titel",
+            "Date": "Datum",
+            "Status": "Status",
+            "Description": "Beschreibung",
+        }
+        for column, text in self._headings.items():
+            self.tree.heading(
+                column, text=text, command=partial(self._sort_by, COLUMN_SORT_KEYS[column])
+            )
 
         self.tree.column("ID", width=50, anchor=tk.CENTER)
         self.tree.column("Title", width=150)
@@ -94,10 +233,11 @@ class MainWindow:
         self.tree.column("Description", width=400)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
+        self.tree.bind("<Control-a>", self._select_all_rows)
 
         # Action buttons
         action_frame = ttk.Frame(main_frame)
-        action_frame.grid(row=2, column=0, sticky="ew", pady=(10, 0))
+        action_frame.grid(row=3, column=0, sticky="ew", pady=(10, 0))
 
         ttk.Button(
             action_frame,
@@ -109,27 +249,133 @@ class MainWindow:
             action_frame, text="Berichte erfassen (Alle)", command=self._apply_to_all
         ).pack(side=tk.LEFT, padx=5)
 
+        self.pause_button = ttk.Button(
+            action_frame, text="Pausieren", command=self._toggle_pause, state=tk.DISABLED
+        )
+        self.pause_button.pack(side=tk.LEFT, padx=5)
+
+        self.cancel_button = ttk.Button(
+            action_frame, text="Abbrechen", command=self._cancel_actions, state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
         # Progress label
         self.progress_label = ttk.Label(action_frame, text="")
         self.progress_label.pack(side=tk.RIGHT, padx=5)
 
         # Progress bar (always visible to reserve space)
         progress_container = ttk.Frame(main_frame, height=25)
-        progress_container.grid(row=3, column=0, sticky="ew", pady=(5, 0))
+        progress_container.grid(row=4, column=0, sticky="ew", pady=(5, 0))
         progress_container.columnconfigure(0, weight=1)
         progress_container.grid_propagate(False)
 
         self.progress_bar = ttk.Progressbar(progress_container, mode="determinate")
         self.progress_bar.grid(row=0, column=0, sticky="ew")
 
+        # Latency panel
+        metrics_frame = ttk.Frame(main_frame)
+        metrics_frame.grid(row=5, column=0, sticky="ew", pady=(5, 0))
+
+        self.metrics_label = ttk.Label(metrics_frame, text="")
+        self.metrics_label.pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            metrics_frame, text="Messwerte exportieren", command=self._export_metrics
+        ).pack(side=tk.RIGHT, padx=5)
+
+    def _run_in_background(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> Future:
+        """Run `func` on the background loop and hand its outcome to Tk."""
+
+        def done(future: Future):
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error is None:
+                    raise
+                self.root.after(0, lambda: on_error(e))
+            else:
+                self.root.after(0, lambda: on_done(result))
+
+        future = self.background.submit(func, *args)
+        future.add_done_callback(done)
+        return future
+
+    def _restore_session(self):
+        """Continue the stored session; the login dialog only if it is gone."""
+        stored = self.cookie_store.load() if self.cookie_store else None
+        if stored is None or stored.url != self.backend.url:
+            self._show_login()
+            return
+
+        self._account = stored.account
+        self._display_data(self.entry_store.load(stored.account))
+        self.status_label.config(text="Sitzung wird geprüft...")
+
+        restore = (
+            self.session_manager.restore_async
+            if self.is_async
+            else self.session_manager.restore
+        )
+        self._run_in_background(
+            restore,
+            stored.account,
+            stored.cookies,
+            on_done=self._handle_restore_result,
+            on_error=lambda error: self._show_login(),
+        )
+
+    def _handle_restore_result(self, success: bool):
+        """Show the data of a restored session or ask for a new login."""
+        if success:
+            self.status_label.config(text=f"Angemeldet als {self.backend.username}")
+            self._refresh_data()
+        else:
+            self.cookie_store.clear()
+            self._show_login()
+
+    def _save_session(self):
+        """Store the cookies of the new session for the next start."""
+        if self.cookie_store is None:
+            return
+        export = (
+            self.session_manager.export_cookies_async
+            if self.is_async
+            else self.session_manager.export_cookies
+        )
+        stored = partial(StoredSession, self.backend.username, self.backend.url)
+        self._run_in_background(
+            export,
+            on_done=lambda cookies: self.cookie_store.save(stored(cookies)),
+            on_error=lambda error: None,  # The next start just logs in again
+        )
+
     def _show_login(self):
         """Show login dialog."""
+        # Connect and fetch the login form while the user types
+        prefetch = getattr(self.backend, "prefetch_login", None)
+        if prefetch is not None:
+            self.background.submit(
+                self.session_manager.prefetch_login_async
+                if self.is_async
+                else self.session_manager.prefetch_login
+            )
         dialog = LoginDialog(self.root)
         credentials = dialog.show()
 
         if credentials:
             username, password = credentials
             self._perform_login(username, password)
+        elif self.data_entries:
+            # Keep browsing the last known state of the account offline
+            self.status_label.config(
+                text=f"Offline - letzter bekannter Stand von {self._account}"
+            )
         else:
             messagebox.showinfo(
                 "Abgebrochen", "Anmeldung abgebrochen. Anwendung wird beendet."
@@ -138,29 +384,56 @@ class MainWindow:
 
     def _perform_login(self, username: str, password: str):
         """Perform login in background thread."""
+        if username != self._account:
+            # Queued entries and a running refresh belong to the previous account
+            self._cancel_actions()
+            self._cancel_refresh()
+            # Show the stored entries right away while logging in
+            self._account = username
+            self._display_data(self.entry_store.load(username))
         self.status_label.config(text="Anmeldung läuft...")
         self.root.update()
 
-        def login_thread():
-            success, message = self.session_manager.login(username, password)
-            self.root.after(0, lambda: self._handle_login_result(success, message))
-
-        threading.Thread(target=login_thread, daemon=True).start()
+        login = (
+            self.session_manager.login_async
+            if self.is_async
+            else self.session_manager.login
+        )
+        self._run_in_background(
+            login,
+            username,
+            password,
+            on_done=lambda result: self._handle_login_result(*result),
+        )
 
     def _handle_login_result(self, success: bool, message: str):
         """Handle login result."""
         if success:
             self.status_label.config(text=f"Angemeldet als {self.backend.username}")
-            self._refresh_data()
+            self._save_session()
+            if self.job_queue.session_expired:
+                # Continue the interrupted run; its results update the rows
+                self._toggle_pause()
+            else:
+                self._refresh_data()
         else:
             messagebox.showerror("Anmeldung fehlgeschlagen", message)
             self._show_login()
 
     def _logout(self):
         """Logout and show login dialog again."""
-        self.session_manager.logout()
-        self.data_entries = []
-        self.tree.delete(*self.tree.get_children())
+        self.job_queue.cancel()
+        if self.cookie_store is not None:
+            self.cookie_store.clear()
+        logout = (
+            self.session_manager.logout_async
+            if self.is_async
+            else self.session_manager.logout
+        )
+        self.background.submit(logout).result()
+        self._cancel_refresh()
+        self._account = None
+        self._clear_data()
         self.status_label.config(text="Nicht angemeldet")
         self._show_login()
 
@@ -170,40 +443,225 @@ class MainWindow:
             messagebox.showwarning("Nicht angemeldet", "Bitte zuerst anmelden")
             return
 
+        if self._sync is not None:
+            # A second sync would see the pages of the first as unchanged
+            self.status_label.config(text="Daten werden bereits geladen...")
+            return
+
         self.status_label.config(text="Daten werden geladen...")
         self.root.update()
 
-        def fetch_thread():
-            try:
-                data = self.data_collector.fetch_all()
-                self.root.after(0, lambda: self._display_data(data))
-            except Exception as e:
-                self.root.after(0, lambda: self._handle_fetch_error(str(e)))
+        self._fetch_generation += 1
+        generation = self._fetch_generation
+        sync = self._sync = self.entry_store.start_sync(self._account or "")
 
-        threading.Thread(target=fetch_thread, daemon=True).start()
+        def page_callback(page: list[DataEntry]):
+            """Diff each page against the store and hand changes to Tk."""
+            delta = sync.update(page)
+            self.root.after(0, lambda: self._apply_changes(generation, delta))
 
-    def _display_data(self, data: list[DataEntry]):
-        """Display fetched data in the table."""
-        self.data_entries = data
-        self.tree.delete(*self.tree.get_children())
+        def refresh() -> SyncResult:
+            self.data_collector.fetch_paged(page_callback)
+            return sync.finish()
 
-        for entry in data:
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    entry.id,
-                    entry.title,
-                    entry.date,
-                    entry.status,
-                    entry.description,
-                ),
-            )
+        async def refresh_async() -> SyncResult:
+            await self.data_collector.fetch_paged_async(page_callback)
+            return sync.finish()
+
+        self._run_in_background(
+            refresh_async if self.is_async else refresh,
+            on_done=lambda result: self._finish_fetch(generation, result),
+            on_error=lambda e: self._handle_fetch_error(generation, str(e)),
+        )
+
+    def _cancel_refresh(self):
+        """Drop the running refresh; the store keeps the pages it already wrote."""
+        self._fetch_generation += 1
+        if self._sync is not None:
+            self._sync.cancel()
+            self._sync = None
 
+    def _apply_changes(self, generation: int, delta: SyncResult):
+        """Apply added and changed entries of a running refresh."""
+        if generation != self._fetch_generation:
+            return
+
+        if delta.changed:
+            self.data_entries.extend(delta.changed)
+            self.query_index.extend(delta.changed)
+            for entry in delta.changed:
+                iid = self._row_iids.get(entry.id)
+                # Rows still waiting for insertion pick up the new entry later
+                if iid is not None:
+                    self.tree.item(iid, values=self._row_values(entry))
+
+        self._insert_rows(delta.added)
+        self.status_label.config(
+            text=f"{len(self.data_entries)} Einträge, weitere werden geladen..."
+        )
+
+    def _finish_fetch(self, generation: int, result: SyncResult):
+        """Drop removed entries and report the changes of a refresh."""
+        if generation != self._fetch_generation:
+            return
+        self._sync = None
+
+        if result.removed:
+            iids = []
+            for entry_id in result.removed:
+                self.data_entries.remove(entry_id)
+                self.query_index.remove(entry_id)
+                iid = self._row_iids.pop(entry_id, None)
+                if iid is not None:
+                    del self._iid_rows[iid]
+                    iids.append(iid)
+            self.tree.delete(*iids)
+
+        self.status_label.config(
+            text=f"{len(self.data_entries)} Einträge geladen ({result.summary})"
+        )
+        self._update_result_label()
+
+    def _clear_data(self):
+        """Remove all entries from the table."""
+        self.data_entries.clear()
+        self.query_index.clear()
+        self._pending_rows.clear()
+        # Includes the rows detached by the search
+        self.tree.delete(*self._iid_rows)
+        self._row_iids.clear()
+        self._iid_rows.clear()
+
+    def _display_data(self, data: EntryCollection):
+        """Display fetched data in the table."""
+        self._clear_data()
+        self._insert_rows(data)
         self.status_label.config(text=f"{len(data)} Einträge geladen")
 
-    def _handle_fetch_error(self, error: str):
+    def _insert_rows(self, data: Iterable[DataEntry]):
+        """Append entries to the table.
+
+        The rows are inserted in chunks between Tk events so that large
+        tables do not freeze the window.
+        """
+        for entry in data:
+            self.data_entries.add(entry)
+            self.query_index.add(entry)
+            self._pending_rows.append(entry.id)
+
+        if self._pending_rows and not self._insert_scheduled:
+            self._insert_scheduled = True
+            self.root.after_idle(self._insert_pending_rows)
+
+    def _insert_pending_rows(self):
+        """Insert the next chunk of pending rows into the table."""
+        with self.metrics.timer("tk insert rows"):
+            for _ in range(min(INSERT_CHUNK_SIZE, len(self._pending_rows))):
+                entry_id = self._pending_rows.popleft()
+                entry = self.data_entries.get(entry_id)
+                if entry is None or entry_id in self._row_iids:
+                    continue  # Removed or already shown in the meantime
+                iid = self.tree.insert("", tk.END, values=self._row_values(entry))
+                self._row_iids[entry_id] = iid
+                self._iid_rows[iid] = entry_id
+                if self._query.filtered and not self.query_index.matches(entry_id, self._query):
+                    self.tree.detach(iid)
+
+        if self._pending_rows:
+            self.root.after(1, self._insert_pending_rows)
+        else:
+            self._insert_scheduled = False
+            if self._query.sort != "position":
+                self._render_rows()  # New rows were appended unsorted
+            else:
+                self._update_result_label()
+
+    @staticmethod
+    def _row_values(entry: DataEntry) -> tuple:
+        """Table cell values of an entry."""
+        return (
+            entry.id,
+            entry.title,
+            entry.date,
+            entry.status,
+            entry.description,
+        )
+
+    def _schedule_search(self):
+        """Run the search once typing pauses."""
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(SEARCH_DELAY_MS, self._apply_search)
+
+    def _apply_search(self):
+        """Show the rows matching the search box and status filter."""
+        self._search_after = None
+        self._query = parse_query(
+            self.search_var.get(),
+            status=self._status_choices.get(self.status_filter.get()),
+            sort=self._query.sort,
+            descending=self._query.descending,
+        )
+        self._render_rows()
+
+    def _sort_by(self, sort: str):
+        """Sort by a column; a second click reverses the order."""
+        descending = self._query.sort == sort and not self._query.descending
+        self._query = replace(self._query, sort=sort, descending=descending)
+        for column, text in self._headings.items():
+            if COLUMN_SORT_KEYS[column] == sort:
+                text += " ▼" if descending else " ▲"
+            self.tree.heading(column, text=text)
+        self._render_rows()
+
+    def _render_rows(self):
+        """Attach only the rows of the current query, in its order."""
+        with self.metrics.timer("tk render query"):
+            entry_ids = self.query_index.search(self._query)
+            row_iids = self._row_iids
+            visible = [row_iids[entry_id] for entry_id in entry_ids if entry_id in row_iids]
+            # Replaces the children; rows not listed are detached, not deleted
+            self.tree.set_children("", *visible)
+            selected = self.tree.selection()
+            if selected:
+                shown = set(visible)
+                self.tree.selection_set([iid for iid in selected if iid in shown])
+        self._update_result_label(len(entry_ids))
+
+    def _update_result_label(self, matches: int | None = None):
+        """Show how many entries the filter lets through."""
+        if not self._query.filtered:
+            self.result_label.config(text="")
+            return
+        if matches is None:
+            matches = len(self.tree.get_children())
+        self.result_label.config(text=f"{matches} von {len(self.data_entries)} Einträgen")
+
+    def _update_status_facets(self):
+        """Offer the statuses of the current matches with their counts."""
+        facets = self.query_index.facets(self._query)
+        self._status_choices = {ALL_STATUSES: None}
+        for status in sorted(facets):
+            self._status_choices[f"{status} ({facets[status]})"] = status
+        # Keep the selected status even when it has no matches now
+        if self._query.status is not None and self._query.status not in facets:
+            self._status_choices[f"{self._query.status} (0)"] = self._query.status
+        choices = list(self._status_choices)
+        self.status_filter.config(values=choices)
+        for choice, status in self._status_choices.items():
+            if status == self._query.status:
+                self.status_filter.set(choice)
+
+    def _select_all_rows(self, event: Any = None) -> str:
+        """Select all rows shown by the current filter."""
+        self.tree.selection_set(self.tree.get_children())
+        return "break"
+
+    def _handle_fetch_error(self, generation: int, error: str):
         """Handle data fetch error."""
+        if generation != self._fetch_generation:
+            return  # Cancelled refresh
+        self._sync = None
         self.status_label.config(text="Fehler beim Laden der Daten")
         messagebox.showerror("Fehler", f"Daten konnten nicht geladen werden: {error}")
 
@@ -217,13 +675,12 @@ class MainWindow:
             )
             return
 
-        # Get entry IDs from selected rows
-        entry_ids = []
-        for item in selected:
-            values = self.tree.item(item)["values"]
-            entry_ids.append(int(values[0]))
+        # Get the entries of the selected rows
+        entries = EntryCollection(
+            self.data_entries.get(self._iid_rows[item]) for item in selected
+        )
 
-        self._execute_actions(entry_ids)
+        self._execute_actions(entries, PRIORITY_SELECTION)
 
     def _apply_to_all(self):
         """Apply action to all rows."""
@@ -233,67 +690,174 @@ class MainWindow:
             )
             return
 
-        confirm = messagebox.askyesno(
-            "Bestätigen",
-            f"Berichte für alle {len(self.data_entries)} Einträge erfassen?",
-        )
-
-        if confirm:
-            entry_ids = [entry.id for entry in self.data_entries]
-            self._execute_actions(entry_ids)
-
-    def _execute_actions(self, entry_ids: list[int]):
-        """Execute actions on given entry IDs."""
-        total = len(entry_ids)
+        entries = EntryCollection(self.data_entries)
+        entry_ids, skipped = self.action_processor.select(entries)
+        if not entry_ids:
+            messagebox.showinfo(
+                "Nichts zu tun", "Alle Berichte sind bereits erfasst"
+            )
+            return
 
-        # Reset progress bar
-        self.progress_bar["maximum"] = total
-        self.progress_bar["value"] = 0
-        self.progress_label.config(text="")
+        question = f"Berichte für {len(entry_ids)} Einträge erfassen?"
+        if skipped:
+            question += f"\n\n{len(skipped)} bereits erfasste werden übersprungen."
+        confirm = messagebox.askyesno("Bestätigen", question)
 
-        self.root.update()
+        if confirm:
+            self._execute_actions(entries, PRIORITY_ALL)
+
+    def _ask_resume(self) -> bool | None:
+        """Ask whether to skip entries of an interrupted run that are done.
+
+        Returns:
+            True to resume, False to process everything, None to cancel
+        """
+        if self.journal is None:
+            return False
+        self.journal.account = self._account or ""
+        interrupted = self.journal.interrupted_run()
+        if interrupted is None:
+            return False
+        done = interrupted.total - len(interrupted.remaining)
+        return messagebox.askyesnocancel(
+            "Unterbrochener Lauf",
+            f"Der letzte Lauf wurde nach {done} von {interrupted.total} Berichten "
+            "unterbrochen.\n\nBereits erfasste Berichte überspringen?",
+        )
 
-        def progress_callback(current: int, total: int):
-            """Update progress bar from background thread."""
-            self.root.after(0, lambda: self._update_progress(current, total))
+    def _execute_actions(self, entries: EntryCollection, priority: int):
+        """Queue the given entries that still need the action as a job."""
+        # An interrupted run can only be resumed before the queue runs again
+        resume = False
+        if not self.job_queue.busy:
+            resume = self._ask_resume()
+            if resume is None:
+                return
+
+        job = self.job_queue.submit(entries, priority, resume=resume)
+        if not job.total:
+            messagebox.showinfo(
+                "Nichts zu tun",
+                "Die ausgewählten Berichte sind bereits erfasst oder eingereiht",
+            )
+            return
 
-        def process_thread():
-            results = self.action_processor.process_all(entry_ids, progress_callback)
-            self.root.after(0, lambda: self._handle_action_results(results))
+        if not self._actions_running:
+            self.progress_bar["value"] = 0
+            self._actions_running = True
+            self.pause_button.config(state=tk.NORMAL, text="Pausieren")
+            self.cancel_button.config(state=tk.NORMAL)
+            self._progress_poller = ProgressPoller(
+                self.root,
+                self._progress_channel,
+                self._update_progress,
+                self._show_action_results,
+            )
+            self._progress_poller.start()
+            self._update_metrics()
+
+        text = f"{job.total} Berichte eingereiht"
+        if job.results.skipped:
+            text += f", {len(job.results.skipped)} bereits erfasst"
+        self.progress_label.config(text=text)
+
+    def _start_entry_async(self, entry_id: int, ticket: int | None) -> Future:
+        """Start one job queue entry on the event loop."""
+        return self.background.submit(self.action_processor.process_entry_async, entry_id, ticket)
+
+    def _toggle_pause(self):
+        """Pause the job queue or let it continue."""
+        if self.job_queue.paused:
+            self.job_queue.resume()
+            self.pause_button.config(text="Pausieren")
+            self.progress_label.config(text="Fortgesetzt")
+        else:
+            self.job_queue.pause()
+            self.pause_button.config(text="Fortsetzen")
+            self.progress_label.config(text="Pausiert nach den laufenden Berichten")
+
+    def _handle_session_expired(self):
+        """Ask for a new login after the session of a running job expired."""
+        self.pause_button.config(text="Fortsetzen")
+        self.progress_label.config(text="Sitzung abgelaufen - pausiert bis zur Anmeldung")
+        self._show_login()
 
-        threading.Thread(target=process_thread, daemon=True).start()
+    def _cancel_actions(self):
+        """Drop all queued entries; the ones in flight still complete."""
+        self.job_queue.cancel()
+        self.job_queue.resume()
+        self.pause_button.config(text="Pausieren")
 
     def _update_progress(self, current: int, total: int):
         """Update progress bar."""
-        self.progress_bar["value"] = current
-        self.root.update()
-
-    def _handle_action_results(self, results: dict[int, tuple[bool, str]]):
-        """Handle action processing results."""
-        success_count = sum(1 for success, _ in results.values() if success)
-        total = len(results)
-
-        # Reset progress bar to 0
+        with self.metrics.timer("tk progress"):
+            # Jobs submitted during the run raise the total
+            self.progress_bar["maximum"] = max(total, 1)
+            self.progress_bar["value"] = current
+
+    def _show_action_results(self, results: dict[int, tuple[bool, str]]):
+        """Show the new status of the rows that were captured successfully."""
+        with self.metrics.timer("tk apply results"):
+            for entry_id in self.data_entries.apply_results(results, CAPTURED_STATUS):
+                iid = self._row_iids.get(entry_id)
+                if iid is not None:
+                    self.tree.set(iid, "Status", CAPTURED_STATUS)
+
+    def _update_metrics(self):
+        """Refresh the latency panel while actions are running."""
+        summary = self.metrics.summary(active_only=self._actions_running)
+        if summary:
+            window = f"Parallelität {self.limiter.limit}"
+            decisions = self.limiter.decisions()
+            if decisions:
+                window += f" ({decisions[-1].reason})"
+            self.metrics_label.config(text=f"{summary} | {window}")
+        if self._actions_running:
+            self.root.after(METRICS_INTERVAL_MS, self._update_metrics)
+
+    def _export_metrics(self):
+        """Save the collected request timings as JSON or CSV."""
+        path = filedialog.asksaveasfilename(
+            title="Messwerte exportieren",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")],
+        )
+        if not path:
+            return
+        try:
+            if path.lower().endswith(".csv"):
+                self.metrics.export_csv(path)
+            else:
+                self.metrics.export_json(path)
+        except OSError as e:
+            messagebox.showerror("Fehler", f"Messwerte konnten nicht gespeichert werden: {e}")
+
+    def _stop_actions(self):
+        """Deliver the last queued updates once the job queue is idle."""
+        if self._progress_poller is not None:
+            self._progress_poller.stop()
+            self._progress_poller = None
+        self._actions_running = False
         self.progress_bar["value"] = 0
+        self.pause_button.config(state=tk.DISABLED, text="Pausieren")
+        self.cancel_button.config(state=tk.DISABLED)
+        self._update_metrics()
+
+    def _handle_job_done(self, job: ActionJob):
+        """Report a finished or cancelled job."""
+        if not job.total:
+            return  # Nothing was queued, see `_execute_actions`
+        success_count = sum(1 for success, _ in job.results.values() if success)
+        if job.state == CANCELLED:
+            text = f"Abgebrochen: {success_count}/{job.completed} erfolgreich"
+        else:
+            text = f"Abgeschlossen: {success_count}/{job.completed} erfolgreich"
+        if job.results.skipped:
+            text += f", {len(job.results.skipped)} übersprungen"
 
-        self.progress_label.config(
-            text=f"Abgeschlossen: {success_count}/{total} erfolgreich"
-        )
+        if not self.job_queue.busy:
+            self._stop_actions()
+        self.progress_label.config(text=text)
 
-        # Update status in table
-        for item in self.tree.get_children():
-            values = self.tree.item(item)["values"]
-            entry_id = int(values[0])
-
-            if entry_id in results and results[entry_id][0]:
-                # Update status to "Berichte erwarten Freigabe"
-                self.tree.item(
-                    item,
-                    values=(
-                        values[0],
-                        values[1],
-                        values[2],
-                        "Berichte erwarten Freigabe",
-                        values[4],
-                    ),
-                )
+        # Rows normally changed during the run already; this catches the rest
+        self._show_action_results(job.results)
@@ -0,0 +1,426 @@
+"""Local stand-in for the FW Portal, for benchmarks and offline testing.
+
+Implements the endpoints used by `FWPortalBackend` on top of the stdlib
+`http.server` with configurable latency, error rate and dataset size:
+
+    python -m erfassinator.mock_portal --entries 5000 --latency 0.05
+"""
+
+import argparse
+import json
+import random
+import secrets
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+SESSION_COOKIE = ".ASPXAUTH"
+
+_KEYWORDS = ["Einsatz Brand", "Technische Hilfe", "Einsatz Rettung", "Fehlalarm", "Unwetter"]
+_DESCRIPTIONS = ["Kleinbrand im Keller", "Ölspur auf Fahrbahn", "Person eingeklemmt", "BMA ausgelöst", "Baum auf Straße"]
+_OPEN_STATUS = "Berichte erfassen"
+
+
+@dataclass
+class MockPortalConfig:
+    """Behaviour of the mock portal."""
+
+    entries: int = 1000
+    # Seconds added to every response: uniform in latency +- latency_jitter
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Share of requests answered with HTTP 500
+    error_rate: float = 0.0
+    # Share of requests answered with HTTP 429
+    throttle_rate: float = 0.0
+    # Requests served at once; further concurrent ones get HTTP 429 (0: no limit)
+    capacity: int = 0
+    # Seconds added per other request in flight (server-side queueing)
+    load_latency: float = 0.0
+    # Seconds a session stays valid after login (0: until logoff)
+    session_lifetime: float = 0.0
+    username: str = "admin"
+    password: str = "admin"
+    organisation_id: str = "4711"
+    seed: int = 0
+
+
+class MockPortal:
+    """State of the mock portal: reports, sessions and request counters."""
+
+    def __init__(self, config: MockPortalConfig):
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self.sessions: dict[str, str] = {}  # session id -> verification token
+        self._session_started: dict[str, float] = {}
+        self.login_token = secrets.token_urlsafe(16)
+        self.reports = [
+            {
+                "EinsatzberichtID": 100000 + index,
+                "Stichwort": self._random.choice(_KEYWORDS),
+                "BeginnDatumText": f"{index % 28 + 1:02d}.{index % 12 + 1:02d}.{2020 + index % 5} 12:00",
+                "GesamtStatus": _OPEN_STATUS,
+                "Kurzbeschreibung": self._random.choice(_DESCRIPTIONS),
+            }
+            for index in range(config.entries)
+        ]
+        self._reports_by_id = {report["EinsatzberichtID"]: report for report in self.reports}
+        self.request_counts: dict[str, int] = {}
+        self.in_flight = 0
+
+    def configure(self, **changes):
+        """Change the behaviour at runtime, e.g. `configure(latency=0.2)`."""
+        with self._lock:
+            for name, value in changes.items():
+                if not hasattr(self.config, name):
+                    raise AttributeError(f"MockPortalConfig has no field {name!r}")
+                setattr(self.config, name, value)
+
+    def enter(self) -> int:
+        """Count a request as in flight; returns the number now in flight."""
+        with self._lock:
+            self.in_flight += 1
+            return self.in_flight
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def count(self, endpoint: str):
+        with self._lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+
+    def delay(self, in_flight: int = 1):
+        """Sleep for the configured response latency."""
+        config = self.config
+        load = config.load_latency * (in_flight - 1)
+        if config.latency or config.latency_jitter or load:
+            with self._lock:
+                jitter = self._random.uniform(-config.latency_jitter, config.latency_jitter)
+            time.sleep(max(0.0, config.latency + jitter + load))
+
+    def injected_error(self, in_flight: int = 1) -> Optional[int]:
+        """Status code of an injected error for the current request, if any."""
+        config = self.config
+        if config.capacity and in_flight > config.capacity:
+            return 429
+        if not (config.error_rate or config.throttle_rate):
+            return None
+        with self._lock:
+            roll = self._random.random()
+        if roll < config.error_rate:
+            return 500
+        if roll < config.error_rate + config.throttle_rate:
+            return 429
+        return None
+
+    def create_session(self) -> str:
+        session_id = secrets.token_urlsafe(16)
+        with self._lock:
+            self.sessions[session_id] = secrets.token_urlsafe(24)
+            self._session_started[session_id] = time.monotonic()
+        return session_id
+
+    def session_valid(self, session_id: Optional[str]) -> bool:
+        """Whether the session exists and has not outlived `session_lifetime`."""
+        lifetime = self.config.session_lifetime
+        with self._lock:
+            started = self._session_started.get(session_id or "")
+            if started is None:
+                return False
+            if lifetime and time.monotonic() - started > lifetime:
+                self.sessions.pop(session_id, None)
+                del self._session_started[session_id]
+                return False
+            return True
+
+    def drop_session(self, session_id: Optional[str]):
+        with self._lock:
+            self.sessions.pop(session_id or "", None)
+            self._session_started.pop(session_id or "", None)
+
+    def expire_sessions(self):
+        """End all sessions, as the portal does after a timeout or restart."""
+        with self._lock:
+            self.sessions.clear()
+            self._session_started.clear()
+
+    def rotate_tokens(self):
+        """Issue new anti-forgery tokens; pages fetched before carry stale ones."""
+        with self._lock:
+            for session_id in self.sessions:
+                self.sessions[session_id] = secrets.token_urlsafe(24)
+            self.login_token = secrets.token_urlsafe(16)
+
+    def report(self, report_id: int) -> Optional[dict]:
+        return self._reports_by_id.get(report_id)
+
+    def set_status(self, report_id: int, status: str):
+        with self._lock:
+            self._reports_by_id[report_id]["GesamtStatus"] = status
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler serving the portal endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_PortalHTTPServer"
+
+    def setup(self):
+        # Headers and body are written separately; without this, Nagle's
+        # algorithm adds a delayed-ACK pause to every keep-alive response.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().setup()
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+    @property
+    def portal(self) -> MockPortal:
+        return self.server.portal
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/").lower()
+        self.query = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        self.form = parse_qs(self.rfile.read(length).decode()) if length else {}
+
+        routes = {
+            ("GET", ""): self._homepage,
+            ("GET", "/account/logon"): self._homepage,
+            ("POST", "/account/logon"): self._logon,
+            ("GET", "/account/logoff"): self._logoff,
+            ("POST", "/einsatz/einsatzgridajax"): self._grid,
+        }
+        handler = routes.get((method, path))
+        report_id = None
+        if handler is None and path.count("/") == 3:
+            prefix, _, tail = path.rpartition("/")
+            if tail.isdigit():
+                report_id = int(tail)
+                handler = {
+                    ("GET", "/einsatz/getupdateeinsatzberichtstatus"): self._status_page,
+                    ("POST", "/einsatz/saveupdateeinsatzberichtstatus"): self._save_status,
+                }.get((method, prefix))
+
+        self.portal.count(f"{method} {path.rsplit('/', 1)[0] if report_id else path or '/'}")
+        in_flight = self.portal.enter()
+        try:
+            self.portal.delay(in_flight)
+            error = self.portal.injected_error(in_flight)
+            if handler is None:
+                self._send(404, "Not Found")
+            elif error == 429:
+                self._send(429, "Too Many Requests", headers={"Retry-After": "1"})
+            elif error is not None:
+                self._send(error, "Internal Server Error")
+            elif report_id is not None:
+                handler(report_id)
+            else:
+                handler()
+        finally:
+            self.portal.leave()
+
+    def _field(self, values: dict, name: str) -> Optional[str]:
+        return values.get(name, [None])[0]
+
+    def _session_id(self) -> Optional[str]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        session_id = morsel.value if morsel else None
+        return session_id if self.portal.session_valid(session_id) else None
+
+    def _send(self, status: int, body: str, content_type: str = "text/html", headers: Optional[dict] = None):
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect_to_logon(self):
+        self._send(302, "", headers={"Location": f"/Account/LogOn?ReturnUrl={self.path}"})
+
+    def _homepage(self):
+        session_id = self._session_id()
+        token = self.portal.sessions.get(session_id, "") if session_id else self.portal.login_token
+        greeting = "<p>Sie haben 0 ungelesene Nachrichten</p>" if session_id else (
+            "<h1>Anmeldung</h1>"
+            "<input name=\"UserName\" type=\"text\" /><input name=\"Password\" type=\"password\" />"
+        )
+        self._send(200, (
+            "<!DOCTYPE html><html><head><title>FW Portal</title></head><body>"
+            f"{greeting}<form method=\"post\" action=\"/Account/LogOn\">"
+            f"<input name=\"__RequestVerificationToken\" type=\"hidden\" value=\"{token}\" />"
+            "</form></body></html>"
+        ))
+
+    def _logon(self):
+        config = self.portal.config
+        if self._field(self.form, "__RequestVerificationToken") != self.portal.login_token:
+            self._send(500, "The provided anti-forgery token is invalid (AntiForgery)")
+            return
+        if (
+            self._field(self.form, "UserName") != config.username
+            or self._field(self.form, "Password") != config.password
+        ):
+            self._homepage()
+            return
+        session_id = self.portal.create_session()
+        self._send(302, "", headers={
+            "Location": "/",
+            "Set-Cookie": f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly",
+        })
+
+    def _logoff(self):
+        self.portal.drop_session(self._session_id())
+        self._send(302, "", headers={
+            "Location": "/",
+            "Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0",
+        })
+
+    def _grid(self):
+        if not self._session_id():
+            self._redirect_to_logon()
+            return
+        reports = self.portal.reports
+        page = self._field(self.form, "page")
+        page_size = self._field(self.form, "pageSize")
+        if page and page_size:
+            start = (int(page) - 1) * int(page_size)
+            rows = reports[start : start + int(page_size)]
+        else:
+            rows = reports
+        self._send(200, json.dumps({"Data": rows, "Total": len(reports)}), "application/json")
+
+    def _status_page(self, report_id: int):
+        session_id = self._session_id()
+        if not session_id:
+            self._redirect_to_logon()
+            return
+        if self.portal.report(report_id) is None:
+            self._send(404, "Not Found")
+            return
+        token = self.portal.sessions.get(session_id, "")
+        organisation_id = self.portal.config.organisation_id
+        self._send(200, (
+            "<div class=\"modal\"><form method=\"post\" action=\"/einsatz/saveupdateeinsatzberichtstatus/"
+            f"{report_id}?status=100&amp;organisationid={organisation_id}\">"
+            f"<input name=\"__RequestVerificationToken\" type=\"hidden\" value=\"{token}\" />"
+            "<textarea name=\"UpdateStatusBemerkung\"></textarea></form></div>"
+        ))
+
+    def _save_status(self, report_id: int):
+        session_id = self._session_id()
+        if not session_id:
+            self._redirect_to_logon()
+            return
+        if self._field(self.form, "__RequestVerificationToken") != self.portal.sessions.get(session_id):
+            self._send(500, "The provided anti-forgery token is invalid (AntiForgery)")
+            return
+        if (
+            self.portal.report(report_id) is None
+            or self._field(self.query, "organisationid") != self.portal.config.organisation_id
+        ):
+            self._send(404, "Not Found")
+            return
+        self.portal.set_status(report_id, "Berichte erwarten Freigabe")
+        self._send(200, json.dumps({"success": True}), "application/json")
+
+
+class _PortalHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connects of a burst of clients, which
+    # then wait a full second for the SYN retransmit
+    request_queue_size = 128
+
+    def __init__(self, address, portal: MockPortal):
+        super().__init__(address, _Handler)
+        self.portal = portal
+
+
+class MockPortalServer:
+    """Runs a `MockPortal` on a background thread.
+
+    Usable as a context manager; `url` is the base URL to pass to
+    `FWPortalBackend(url=...)`.
+    """
+
+    def __init__(self, config: Optional[MockPortalConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.portal = MockPortal(config or MockPortalConfig())
+        self._server = _PortalHTTPServer((host, port), self.portal)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockPortalServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-portal", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockPortalServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokaler FW-Portal-Ersatz")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Sekunden pro Anfrage")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Streuung der Latenz in Sekunden")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Anteil fehlerhafter Antworten")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Anteil 429-Antworten")
+    parser.add_argument("--capacity", type=int, default=0, help="gleichzeitig bediente Anfragen (0: unbegrenzt)")
+    parser.add_argument("--load-latency", type=float, default=0.0, help="Sekunden je weiterer laufender Anfrage")
+    parser.add_argument("--session-lifetime", type=float, default=0.0, help="Sekunden bis eine Sitzung abläuft (0: nie)")
+    args = parser.parse_args()
+
+    config = MockPortalConfig(
+        entries=args.entries,
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        capacity=args.capacity,
+        load_latency=args.load_latency,
+        session_lifetime=args.session_lifetime,
+    )
+    server = MockPortalServer(config, port=args.port)
+    print(f"Mock-Portal läuft auf {server.url} (Benutzer {config.username}/{config.password})")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
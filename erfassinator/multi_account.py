@@ -0,0 +1,216 @@
+"""Fetch and capture the reports of several portal accounts at the same time.
+
+Every account gets its own backend (session, connection pool, re-login) and
+its own `ActionProcessor`, so the `workers` limit of an account only bounds
+the requests of that account. Results of all accounts reach one callback,
+tagged with the account name.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from erfassinator.action_processor import ActionProcessor, ActionResults
+from erfassinator.data_collector import DataCollector
+from erfassinator.entries import EntryCollection
+from erfassinator.session_manager import SessionManager
+
+# Callback receiving (account, entry_id, (success, message)) for every finished entry
+AccountResultCallback = Callable[[str, int, tuple[bool, str]], None]
+
+# Callback receiving (account, done, total) of the account's run
+AccountProgressCallback = Callable[[str, int, int], None]
+
+
+@dataclass
+class Account:
+    """Credentials and limits of one portal account."""
+
+    username: str
+    password: str
+    # Base URL of the portal (None: the backend's default)
+    url: str | None = None
+    # Reports of this account processed concurrently (None: the caller's default)
+    workers: int | None = None
+
+
+def read_accounts(path: Path) -> list[Account]:
+    """Accounts from a JSON list of {"username", "password", "url"?, "workers"?}."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"{path}: Liste mit mindestens einem Konto erwartet")
+    accounts = [
+        Account(item["username"], item["password"], item.get("url"), item.get("workers"))
+        for item in data
+    ]
+    names = [account.username for account in accounts]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"{path}: Konto mehrfach angegeben: {', '.join(duplicates)}")
+    return accounts
+
+
+@dataclass
+class AccountRun:
+    """Outcome of one account."""
+
+    account: str
+    entries: EntryCollection = field(default_factory=EntryCollection)
+    # Entry IDs chosen for the action (in a dry run: that would be processed)
+    selected: list[int] = field(default_factory=list)
+    results: ActionResults = field(default_factory=ActionResults)
+    # Why the account stopped before processing, if it did
+    error: str | None = None
+    login_failed: bool = False
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for success, _ in self.results.values() if success)
+
+
+class MultiAccountRunner:
+    """Logs in, fetches and processes every account in parallel.
+
+    A failing account does not stop the others; its `AccountRun` carries
+    the error instead. Callbacks are called from the worker threads (or the
+    event loop) of all accounts and have to be thread-safe.
+    """
+
+    def __init__(
+        self,
+        accounts: list[Account],
+        create_backend: Callable[[Account], Any],
+        create_processor: Callable[[Account, Any], ActionProcessor],
+        select: Callable[[EntryCollection], EntryCollection] | None = None,
+    ):
+        """
+        Args:
+            accounts: Accounts to run, each at most once
+            create_backend: Builds the (not yet logged in) backend of an account
+            create_processor: Builds the processor of an account and its backend;
+                its `max_workers` is the account's concurrency limit
+            select: Optional filter of the fetched entries before processing
+        """
+        self.accounts = accounts
+        self.create_backend = create_backend
+        self.create_processor = create_processor
+        self.select = select or (lambda entries: entries)
+
+    def run(
+        self,
+        result_callback: AccountResultCallback | None = None,
+        progress_callback: AccountProgressCallback | None = None,
+        resume: bool = False,
+        dry_run: bool = False,
+    ) -> list[AccountRun]:
+        """Run all accounts on threaded backends; runs are in account order."""
+        with ThreadPoolExecutor(
+            len(self.accounts), thread_name_prefix="erfassinator-account"
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self._run_account, account, result_callback, progress_callback, resume, dry_run
+                )
+                for account in self.accounts
+            ]
+            return [future.result() for future in futures]
+
+    async def run_async(
+        self,
+        result_callback: AccountResultCallback | None = None,
+        progress_callback: AccountProgressCallback | None = None,
+        resume: bool = False,
+        dry_run: bool = False,
+    ) -> list[AccountRun]:
+        """Run all accounts on `AsyncBackend`s of the running event loop."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self._run_account_async(
+                        account, result_callback, progress_callback, resume, dry_run
+                    )
+                    for account in self.accounts
+                )
+            )
+        )
+
+    def _run_account(
+        self,
+        account: Account,
+        result_callback: AccountResultCallback | None,
+        progress_callback: AccountProgressCallback | None,
+        resume: bool,
+        dry_run: bool,
+    ) -> AccountRun:
+        run = AccountRun(account.username)
+        backend = self.create_backend(account)
+        success, message = SessionManager(backend).login(account.username, account.password)
+        if not success:
+            run.error, run.login_failed = message, True
+            return run
+        try:
+            run.entries = self.select(DataCollector(backend).fetch_all())
+        except RuntimeError as e:
+            run.error = str(e)
+            return run
+
+        processor = self.create_processor(account, backend)
+        run.selected, skipped = processor.select(run.entries)
+        if dry_run:
+            run.results.skipped = skipped
+            return run
+        run.results = processor.process_all(
+            run.entries,
+            progress_callback=_tagged(progress_callback, account.username),
+            result_callback=_tagged(result_callback, account.username),
+            resume=resume,
+        )
+        return run
+
+    async def _run_account_async(
+        self,
+        account: Account,
+        result_callback: AccountResultCallback | None,
+        progress_callback: AccountProgressCallback | None,
+        resume: bool,
+        dry_run: bool,
+    ) -> AccountRun:
+        run = AccountRun(account.username)
+        backend = self.create_backend(account)
+        try:
+            success, message = await SessionManager(backend).login_async(
+                account.username, account.password
+            )
+            if not success:
+                run.error, run.login_failed = message, True
+                return run
+            try:
+                run.entries = self.select(await DataCollector(backend).fetch_all_async())
+            except RuntimeError as e:
+                run.error = str(e)
+                return run
+
+            processor = self.create_processor(account, backend)
+            run.selected, skipped = processor.select(run.entries)
+            if dry_run:
+                run.results.skipped = skipped
+                return run
+            run.results = await processor.process_all_async(
+                run.entries,
+                progress_callback=_tagged(progress_callback, account.username),
+                result_callback=_tagged(result_callback, account.username),
+                resume=resume,
+            )
+            return run
+        finally:
+            await backend.logout()
+
+
+def _tagged(callback: Callable[..., None] | None, account: str) -> Callable[..., None] | None:
+    """The callback with the account name as first argument."""
+    if callback is None:
+        return None
+    return lambda *args: callback(account, *args)
@@ -0,0 +1,97 @@
+"""Progress and result hand-off from worker threads to the Tk main loop."""
+
+import queue
+from typing import Any, Callable
+
+# Milliseconds between two polls of the channel (about 20 frames per second)
+POLL_INTERVAL_MS = 50
+
+
+class ProgressChannel:
+    """Thread-safe queue of progress updates and per-entry results.
+
+    Workers call `report_progress` and `report_result` from any thread; the
+    consumer drains everything queued since the last poll in one go, with
+    the progress updates reduced to the latest one.
+    """
+
+    def __init__(self):
+        self._events: queue.SimpleQueue[tuple[str, Any]] = queue.SimpleQueue()
+
+    def report_progress(self, current: int, total: int):
+        """Queue a progress update; usable as `progress_callback`."""
+        self._events.put(("progress", (current, total)))
+
+    def report_result(self, entry_id: int, result: tuple[bool, str]):
+        """Queue the result of one entry; usable as `result_callback`."""
+        self._events.put(("result", (entry_id, result)))
+
+    def drain(self) -> tuple[tuple[int, int] | None, dict[int, tuple[bool, str]]]:
+        """
+        Take all queued events.
+
+        Returns:
+            (latest progress or None, results by entry ID in arrival order)
+        """
+        progress = None
+        results: dict[int, tuple[bool, str]] = {}
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                return progress, results
+            if kind == "progress":
+                progress = payload
+            else:
+                entry_id, result = payload
+                results[entry_id] = result
+
+
+class ProgressPoller:
+    """Polls a `ProgressChannel` from the Tk main loop at a fixed rate."""
+
+    def __init__(
+        self,
+        root: Any,
+        channel: ProgressChannel,
+        on_progress: Callable[[int, int], None],
+        on_results: Callable[[dict[int, tuple[bool, str]]], None],
+        interval_ms: int = POLL_INTERVAL_MS,
+    ):
+        """
+        Args:
+            root: Tk widget used for scheduling
+            channel: Channel filled by the workers
+            on_progress: Called with the latest (current, total) of a poll
+            on_results: Called with the results that arrived since the last poll
+            interval_ms: Milliseconds between polls
+        """
+        self.root = root
+        self.channel = channel
+        self.on_progress = on_progress
+        self.on_results = on_results
+        self.interval_ms = interval_ms
+        self._after_id: str | None = None
+
+    def start(self):
+        """Start polling."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._poll)
+
+    def stop(self):
+        """Stop polling and deliver whatever is still queued."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._deliver()
+
+    def _poll(self):
+        self._deliver()
+        self._after_id = self.root.after(self.interval_ms, self._poll)
+
+    def _deliver(self):
+        progress, results = self.channel.drain()
+        if results:
+            self.on_results(results)
+        if progress is not None:
+            self.on_progress(*progress)
@@ -0,0 +1,276 @@
+"""Client-side search, filter and sort over the loaded entries.
+
+`QueryIndex` keeps indexes next to an `EntryCollection`:
+
+- the word tokens of title and description, searchable by prefix
+- the date of every entry, parsed once and sorted on demand
+- status facets, taken from the collection's own status index
+
+`parse_query` turns the text of the search box into a `Query`; date terms
+("15.01.2024", "01.2024", "2024") become a date range, all other words have
+to prefix-match a word of the entry.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Iterable
+
+from erfassinator.entries import DataEntry, EntryCollection
+
+# Orders of `Query.sort`; "position" is the order of the portal
+SORT_KEYS = ("position", "id", "title", "date", "status", "description")
+
+MINUTES_PER_DAY = 24 * 60
+
+_TOKEN_RE = re.compile(r"\w+")
+_DAY_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_MONTH_RE = re.compile(r"(\d{1,2})\.(\d{4})")
+_YEAR_RE = re.compile(r"(?:19|20)\d\d")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased words of a text."""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def date_key(text: str) -> int | None:
+    """Sortable minutes of a `BeginnDatumText` ("15.01.2024 13:45"); None if invalid."""
+    day, _, time = text.partition(" ")
+    try:
+        days, months, years = day.split(".")
+        key = date(int(years), int(months), int(days)).toordinal() * MINUTES_PER_DAY
+        if time:
+            hours, _, minutes = time.partition(":")
+            key += int(hours) * 60 + int(minutes or 0)
+    except ValueError:
+        return None
+    return key
+
+
+def _day_key(day: date) -> int:
+    return day.toordinal() * MINUTES_PER_DAY
+
+
+@dataclass(frozen=True)
+class Query:
+    """Filter and order of the displayed entries."""
+
+    # Every word has to be the prefix of a title or description word
+    words: tuple[str, ...] = ()
+    status: str | None = None
+    # Range of `date_key` values: inclusive start, exclusive end
+    date_from: int | None = None
+    date_until: int | None = None
+    sort: str = "position"
+    descending: bool = False
+
+    @property
+    def filtered(self) -> bool:
+        """Whether the query hides any entries."""
+        return bool(
+            self.words
+            or self.status is not None
+            or self.date_from is not None
+            or self.date_until is not None
+        )
+
+
+def parse_query(
+    text: str, status: str | None = None, sort: str = "position", descending: bool = False
+) -> Query:
+    """Build a query from the search box text."""
+    words: list[str] = []
+    date_from: int | None = None
+    date_until: int | None = None
+    for term in text.split():
+        try:
+            if match := _DAY_RE.fullmatch(term):
+                days, months, years = map(int, match.groups())
+                start = date(years, months, days)
+                end = date.fromordinal(start.toordinal() + 1)
+            elif match := _MONTH_RE.fullmatch(term):
+                months, years = map(int, match.groups())
+                start = date(years, months, 1)
+                end = date(years + months // 12, months % 12 + 1, 1)
+            elif _YEAR_RE.fullmatch(term):
+                start = date(int(term), 1, 1)
+                end = date(int(term) + 1, 1, 1)
+            else:
+                words.extend(tokenize(term))
+                continue
+        except ValueError:
+            words.extend(tokenize(term))  # E.g. "31.02.2024": search it as text
+            continue
+        # Several date terms narrow the range down
+        date_from = max(date_from or 0, _day_key(start))
+        date_until = min(date_until or _day_key(end), _day_key(end))
+    return Query(tuple(words), status, date_from, date_until, sort, descending)
+
+
+class QueryIndex:
+    """Search indexes over the entries of an `EntryCollection`.
+
+    The owner calls `add`/`extend`/`remove`/`clear` whenever it changes the
+    collection; status changes need no update since the status facets use
+    the collection's index. The sorted token and date lists are rebuilt
+    lazily after changes, so loading many pages costs no sorting.
+    """
+
+    def __init__(self, entries: EntryCollection):
+        self.entries = entries
+        self._postings: dict[str, set[int]] = {}
+        self._tokens: dict[int, frozenset[str]] = {}
+        self._date_keys: dict[int, int | None] = {}
+        # Sorted tokens and (date key, id) pairs; None after changes
+        self._vocabulary: list[str] | None = None
+        self._by_date: list[tuple[int, int]] | None = None
+        self.extend(entries)
+
+    def add(self, entry: DataEntry):
+        """Index an entry, replacing its previous version."""
+        self.remove(entry.id)
+        tokens = frozenset(tokenize(entry.title) + tokenize(entry.description))
+        self._tokens[entry.id] = tokens
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                self._vocabulary = None
+            posting.add(entry.id)
+        self._date_keys[entry.id] = date_key(entry.date)
+        self._by_date = None
+
+    def extend(self, entries: Iterable[DataEntry]):
+        """Index several entries."""
+        for entry in entries:
+            self.add(entry)
+
+    def remove(self, entry_id: int):
+        """Drop an entry from the indexes, if present."""
+        tokens = self._tokens.pop(entry_id, None)
+        if tokens is None:
+            return
+        for token in tokens:
+            posting = self._postings[token]
+            posting.discard(entry_id)
+            if not posting:
+                del self._postings[token]
+                self._vocabulary = None
+        del self._date_keys[entry_id]
+        self._by_date = None
+
+    def clear(self):
+        """Drop all entries."""
+        self._postings.clear()
+        self._tokens.clear()
+        self._date_keys.clear()
+        self._vocabulary = None
+        self._by_date = None
+
+    def prefix_matches(self, prefix: str) -> set[int]:
+        """IDs of the entries with a word starting with `prefix`."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        matches: set[int] = set()
+        for index in range(bisect.bisect_left(vocabulary, prefix), len(vocabulary)):
+            token = vocabulary[index]
+            if not token.startswith(prefix):
+                break
+            matches |= self._postings[token]
+        return matches
+
+    def search(self, query: Query) -> list[int]:
+        """IDs of the entries matching the query, in its order."""
+        candidates: set[int] | None = None
+        # Narrowest filters first; each one only intersects
+        for word in sorted(query.words, key=len, reverse=True):
+            matches = self.prefix_matches(word)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+        if query.date_from is not None or query.date_until is not None:
+            matches = set(self._in_date_range(query.date_from, query.date_until))
+            candidates = matches if candidates is None else candidates & matches
+        if query.status is not None:
+            matches = {entry.id for entry in self.entries.with_status(query.status)}
+            candidates = matches if candidates is None else candidates & matches
+        return self._ordered(candidates, query.sort, query.descending)
+
+    def matches(self, entry_id: int, query: Query) -> bool:
+        """Whether a single entry matches the filters of the query."""
+        tokens = self._tokens.get(entry_id)
+        if tokens is None:
+            return False
+        for word in query.words:
+            if not any(token.startswith(word) for token in tokens):
+                return False
+        if query.date_from is not None or query.date_until is not None:
+            key = self._date_keys[entry_id]
+            if key is None:
+                return False
+            if query.date_from is not None and key < query.date_from:
+                return False
+            if query.date_until is not None and key >= query.date_until:
+                return False
+        if query.status is not None:
+            entry = self.entries.get(entry_id)
+            return entry is not None and entry.status == query.status
+        return True
+
+    def facets(self, query: Query = Query()) -> dict[str, int]:
+        """Number of entries per status among the matches, ignoring `query.status`."""
+        query = replace(query, status=None)
+        if not query.filtered:
+            return self.entries.status_counts()
+        counts: dict[str, int] = {}
+        for entry_id in self.search(query):
+            status = self.entries.get(entry_id).status
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    def _in_date_range(self, date_from: int | None, date_until: int | None) -> list[int]:
+        by_date = self._sorted_by_date()
+        start = 0 if date_from is None else bisect.bisect_left(by_date, (date_from,))
+        end = len(by_date) if date_until is None else bisect.bisect_left(by_date, (date_until,))
+        return [entry_id for _, entry_id in by_date[start:end]]
+
+    def _sorted_by_date(self) -> list[tuple[int, int]]:
+        if self._by_date is None:
+            self._by_date = sorted(
+                (key, entry_id) for entry_id, key in self._date_keys.items() if key is not None
+            )
+        return self._by_date
+
+    def _ordered(self, ids: set[int] | None, sort: str, descending: bool) -> list[int]:
+        """The IDs (None: all) in the requested order; ties keep portal order."""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort}")
+        in_position = [
+            entry_id for entry_id in self.entries.ids() if ids is None or entry_id in ids
+        ]
+        if sort == "position":
+            ordered = in_position
+        elif sort == "id":
+            ordered = sorted(in_position)
+        elif sort == "date":
+            dated = [
+                entry_id
+                for _, entry_id in self._sorted_by_date()
+                if ids is None or entry_id in ids
+            ]
+            if descending:
+                dated.reverse()
+            # Entries without a valid date always come last
+            undated = [entry_id for entry_id in in_position if self._date_keys.get(entry_id) is None]
+            return dated + undated
+        else:
+            get = self.entries.get
+            ordered = sorted(
+                in_position, key=lambda entry_id: getattr(get(entry_id), sort).casefold()
+            )
+        if descending:
+            ordered.reverse()
+        return ordered
@@ -27,11 +27,71 @@ class SessionManager:
         except Exception as e:
             return False, f"Login fehlgeschlagen: {str(e)}"
 
+    async def login_async(self, username: str, password: str) -> tuple[bool, str]:
+        """
+        Attempt to login with credentials on an `AsyncBackend`.
+
+        Returns:
+            (success: bool, message: str)
+        """
+        try:
+            success = await self.backend.login(username, password)
+            if success:
+                self._authenticated = True
+                return True, "Login erfolgreich"
+            else:
+                return False, "Falsche Anmeldedaten"
+        except Exception as e:
+            return False, f"Login fehlgeschlagen: {str(e)}"
+
+    def prefetch_login(self):
+        """Prepare the login while the credentials are typed; best effort."""
+        try:
+            self.backend.prefetch_login()
+        except Exception:
+            pass  # `login` fetches the login page itself
+
+    async def prefetch_login_async(self):
+        """Prepare the login on an `AsyncBackend`; best effort."""
+        try:
+            await self.backend.prefetch_login()
+        except Exception:
+            pass
+
+    def restore(self, username: str, cookies: list[dict[str, Any]]) -> bool:
+        """
+        Continue a stored session instead of logging in.
+
+        Returns:
+            False if the portal rejects the session; connection errors are
+            raised, since the session may still be valid
+        """
+        self._authenticated = self.backend.restore_session(username, cookies)
+        return self._authenticated
+
+    async def restore_async(self, username: str, cookies: list[dict[str, Any]]) -> bool:
+        """Continue a stored session on an `AsyncBackend` (see `restore`)."""
+        self._authenticated = await self.backend.restore_session(username, cookies)
+        return self._authenticated
+
+    def export_cookies(self) -> list[dict[str, Any]]:
+        """Cookies of the current session."""
+        return self.backend.export_cookies()
+
+    async def export_cookies_async(self) -> list[dict[str, Any]]:
+        """Cookies of the current session on an `AsyncBackend`."""
+        return await self.backend.export_cookies()
+
     def logout(self):
         """Logout the current session."""
         self.backend.logout()
         self._authenticated = False
 
+    async def logout_async(self):
+        """Logout the current session on an `AsyncBackend`."""
+        self._authenticated = False
+        await self.backend.logout()
+
     @property
     def is_authenticated(self) -> bool:
         """Check if user is authenticated."""
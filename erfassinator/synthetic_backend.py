@@ -0,0 +1,259 @@
+"""Synthetic backend with any number of generated reports, for load tests.
+
+Unlike `DummyBackend` (five fixed rows) the `SyntheticBackend` serves `entries`
+reports from a seeded generator, answers after a log-normally distributed
+latency and injects throttling errors, session expiries and failing
+re-logins at configurable rates. It needs neither a network nor the mock portal, so GUI and core can
+be measured at 100k rows.
+"""
+
+import math
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Iterator, Optional
+
+from erfassinator.backend import (
+    DEFAULT_PAGE_SIZE,
+    RELOGIN_RESET_TIMEOUT,
+    Backend,
+    SessionExpiredError,
+    TransientBackendError,
+)
+from erfassinator.circuit_breaker import CircuitBreaker
+from erfassinator.entries import CAPTURED_STATUS, DataEntry, EntryCollection
+from erfassinator.instrumentation import RequestMetrics
+
+_KEYWORDS = [
+    "Einsatz Brand", "Technische Hilfe", "Einsatz Rettung", "Fehlalarm", "Unwetter",
+    "Ölspur", "Tierrettung", "Türöffnung", "Wasserschaden", "Verkehrsunfall",
+]
+_DESCRIPTIONS = [
+    "Kleinbrand im Keller", "Ölspur auf Fahrbahn", "Person eingeklemmt", "BMA ausgelöst",
+    "Baum auf Straße", "Mülltonnenbrand", "Keller unter Wasser", "Katze auf Baum",
+    "Rauchentwicklung aus Wohnung", "Tragehilfe Rettungsdienst",
+]
+_STREETS = [
+    "Hauptstraße", "Bahnhofstraße", "Gartenweg", "Lindenallee", "Schulstraße",
+    "Mühlenweg", "Kirchplatz", "Am Sportplatz", "Industriestraße", "Feldweg",
+]
+
+
+def _default_status_mix() -> dict[str, float]:
+    return {"Berichte erfassen": 0.3, CAPTURED_STATUS: 0.5, "Bericht freigegeben": 0.2}
+
+
+@dataclass
+class SyntheticConfig:
+    """Behaviour of the synthetic backend."""
+
+    entries: int = 1000
+    # Median seconds per call; latencies are log-normal around it
+    latency: float = 0.0
+    # Shape of the log-normal latency (0: always `latency`)
+    latency_sigma: float = 0.5
+    # Share of actions failing with `TransientBackendError` (HTTP 503)
+    error_rate: float = 0.0
+    # Share of calls finding the session expired; each costs a re-login
+    expiry_rate: float = 0.0
+    # Share of re-logins the portal rejects (SessionExpiredError)
+    relogin_failure_rate: float = 0.0
+    # Relative weights of the generated statuses
+    status_mix: dict[str, float] = field(default_factory=_default_status_mix)
+    seed: int = 0
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "SyntheticConfig":
+        """Parse "entries=100000,latency=0.05,..." (all fields but `status_mix`)."""
+        config = cls()
+        types = {item.name: item.type for item in fields(cls) if item.name != "status_mix"}
+        for part in filter(None, (part.strip() for part in spec.split(","))):
+            name, _, value = part.partition("=")
+            name = name.strip().replace("-", "_")
+            if name not in types:
+                raise ValueError(f"Unbekannte Einstellung {name!r} (möglich: {', '.join(types)})")
+            setattr(config, name, types[name](value))
+        return config
+
+
+def synthetic_entries(config: SyntheticConfig) -> list[DataEntry]:
+    """The reports of a configuration; the same seed gives the same reports."""
+    generator = random.Random(config.seed)
+    statuses = [sys.intern(status) for status in config.status_mix]
+    weights = list(config.status_mix.values())
+    chosen = generator.choices(statuses, weights, k=config.entries)
+    entries = []
+    for index in range(config.entries):
+        description = (
+            f"{generator.choice(_DESCRIPTIONS)}, "
+            f"{generator.choice(_STREETS)} {generator.randint(1, 120)}"
+        )
+        entries.append(
+            DataEntry(
+                id=100000 + index,
+                title=sys.intern(generator.choice(_KEYWORDS)),
+                date=f"{generator.randint(1, 28):02d}.{generator.randint(1, 12):02d}."
+                f"{generator.randint(2015, 2025)} "
+                f"{generator.randint(0, 23):02d}:{generator.randint(0, 59):02d}",
+                status=chosen[index],
+                description=description,
+            )
+        )
+    return entries
+
+
+class SyntheticBackend(Backend):
+    """Backend serving generated reports with injected latency and failures.
+
+    Any non-empty username is accepted. An injected expiry ends the session
+    for every worker; like `FWPortalBackend` they share one re-login (counted
+    in `relogins`) and retry their call. A rejected re-login opens
+    `relogin_breaker` and surfaces as `SessionExpiredError`. Throttling
+    errors surface from `apply_action` as `TransientBackendError`, so the
+    adaptive limiter reacts to them.
+    """
+
+    url = "synthetic://"
+
+    def __init__(self, config: Optional[SyntheticConfig] = None):
+        self.config = config or SyntheticConfig()
+        self.authenticated = False
+        self.username: Optional[str] = None
+        self.metrics = RequestMetrics()
+        self.relogins = 0
+        self.relogin_breaker = CircuitBreaker(reset_timeout=RELOGIN_RESET_TIMEOUT)
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._relogin_lock = threading.Lock()
+        self._entries: Optional[dict[int, DataEntry]] = None
+        self._credentials: Optional[tuple[str, str]] = None
+        # Changes with every login; `_expired` refers to the current session
+        self._session_key = 0
+        self._expired = False
+
+    def login(self, username: str, password: str) -> bool:
+        """Accept any non-empty username after one latency."""
+        if not self._login(username):
+            return False
+        self.authenticated = True
+        self.username = username
+        self._credentials = (username, password)
+        self.relogin_breaker.record_success()
+        return True
+
+    def logout(self):
+        """Logout the current user."""
+        self.authenticated = False
+        self.username = None
+        self._credentials = None
+
+    def fetch_data(self) -> EntryCollection:
+        """All reports, fetched like the pages of the portal grid."""
+        return EntryCollection(entry for page in self.fetch_pages() for entry in page)
+
+    def fetch_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[DataEntry]]:
+        """Yield copies of the reports, one latency per page."""
+        entries = list(self._reports().values())
+        for start in range(0, len(entries), page_size):
+            self._call("POST /Einsatz/EinsatzGridAjax")
+            with self._lock:
+                page = [
+                    DataEntry(entry.id, entry.title, entry.date, entry.status, entry.description)
+                    for entry in entries[start:start + page_size]
+                ]
+            yield page
+
+    def apply_action(self, entry_id: int) -> bool:
+        """Capture a report; raises `TransientBackendError` at `error_rate`."""
+        self._call("POST /einsatz/saveupdateeinsatzberichtstatus/{id}")
+        reports = self._reports()
+        with self._lock:
+            if self._random.random() < self.config.error_rate:
+                raise TransientBackendError(503)
+            entry = reports.get(entry_id)
+            if entry is None:
+                return False
+            entry.status = CAPTURED_STATUS
+            return True
+
+    def _reports(self) -> dict[int, DataEntry]:
+        """The generated reports, created on first use."""
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = {entry.id: entry for entry in synthetic_entries(self.config)}
+        return self._entries
+
+    def _login(self, username: str) -> bool:
+        """Start a new session after one latency."""
+        self._wait()
+        if not username:
+            return False
+        with self._lock:
+            self._session_key += 1
+            self._expired = False
+        return True
+
+    def _call(self, endpoint: str):
+        """Wait like a request to `endpoint`; once more after renewing an expiry.
+
+        Raises:
+            SessionExpiredError: The session expired and re-login failed
+        """
+        if not self.authenticated:
+            raise PermissionError("Not authenticated")
+        start = time.perf_counter()
+        session_key = self._session_key
+        self._wait()
+        if self._session_expired(session_key):
+            self._recover_session(session_key)
+            self._wait()
+        self.metrics.record(endpoint, time.perf_counter() - start)
+
+    def _session_expired(self, session_key: int) -> bool:
+        """Whether a call of session `session_key` found it expired."""
+        with self._lock:
+            if session_key != self._session_key:
+                return True
+            if not self._expired and self._random.random() < self.config.expiry_rate:
+                self._expired = True
+            return self._expired
+
+    def _recover_session(self, session_key: int):
+        """Log in again after the session `session_key` has expired.
+
+        Mirrors `FWPortalBackend._recover_session`: one shared re-login for
+        all workers, fast failures while `relogin_breaker` is open.
+
+        Raises:
+            SessionExpiredError: No credentials, or re-login failed
+        """
+        with self._relogin_lock:
+            if self._session_key != session_key:
+                return  # Already logged in again by another worker
+            if self._credentials is None:
+                raise SessionExpiredError("Session expired")
+            if not self.relogin_breaker.allow():
+                raise SessionExpiredError("Session expired, re-login failed recently")
+            with self._lock:
+                rejected = self._random.random() < self.config.relogin_failure_rate
+            if rejected:
+                self._wait()
+            if rejected or not self._login(self._credentials[0]):
+                self.relogin_breaker.record_failure()
+                raise SessionExpiredError("Session expired, re-login rejected")
+            self.relogin_breaker.record_success()
+            self.relogins += 1
+
+    def _wait(self):
+        """Sleep for one sampled latency."""
+        config = self.config
+        if config.latency <= 0:
+            return
+        with self._lock:
+            latency = config.latency * math.exp(self._random.gauss(0.0, config.latency_sigma))
+        time.sleep(latency)
@@ -0,0 +1,124 @@
+"""HTTP transport of `FWPortalBackend`: connection pool, retries and timeouts.
+
+`create_session` builds a `requests.Session` whose adapter keeps up to
+`pool_maxsize` keep-alive connections per host, retries idempotent requests
+on connection errors and transient 5xx with exponential backoff and jitter,
+and applies a default timeout to every call. `TransportStats` counts the
+connections opened versus reused and the retries taken.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+Timeout = Union[float, tuple[float, float]]
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool, retry and timeout settings."""
+
+    # Keep-alive connections kept per host; match the number of workers
+    pool_maxsize: int = 10
+    # Retries of idempotent requests (GET/HEAD); POSTs are never retried
+    max_retries: int = 3
+    # Sleep between retries: backoff_factor * 2 ** (retry - 1) + jitter
+    backoff_factor: float = 0.2
+    backoff_jitter: float = 0.1
+    retry_statuses: tuple[int, ...] = (500, 502, 503, 504)
+    # Seconds to connect and to wait for the response
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+
+    @classmethod
+    def for_workers(cls, workers: int, **kwargs: Any) -> "TransportConfig":
+        """Configuration with one pooled connection per worker."""
+        return cls(pool_maxsize=max(1, workers), **kwargs)
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+    def retry(self) -> Retry:
+        """urllib3 retry policy of this configuration."""
+        return Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            backoff_jitter=self.backoff_jitter,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            # Hand the last response back instead of raising
+            raise_on_status=False,
+        )
+
+
+class TransportStats:
+    """Counters of a session's connection reuse and retries."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._pool_managers: list[Any] = []
+
+    def add_retries(self, count: int):
+        with self._lock:
+            self._retries += count
+
+    def watch(self, pool_manager: Any):
+        """Include the connection pools of a urllib3 `PoolManager`."""
+        with self._lock:
+            self._pool_managers.append(pool_manager)
+
+    def snapshot(self) -> dict[str, int]:
+        """Requests sent, connections opened and reused, retries taken."""
+        with self._lock:
+            # urllib3 counts both per host pool
+            pools = [
+                pool
+                for manager in self._pool_managers
+                for pool in map(manager.pools.get, manager.pools.keys())
+                if pool is not None
+            ]
+            opened = sum(pool.num_connections for pool in pools)
+            sent = sum(pool.num_requests for pool in pools)
+            return {
+                "requests": sent,
+                "connections_opened": opened,
+                "connections_reused": max(0, sent - opened),
+                "retries": self._retries,
+            }
+
+
+class PortalAdapter(HTTPAdapter):
+    """HTTPAdapter applying a default timeout and recording pool usage."""
+
+    def __init__(self, config: TransportConfig, stats: TransportStats):
+        self.transport_config = config
+        self.stats = stats
+        super().__init__(pool_maxsize=config.pool_maxsize, max_retries=config.retry())
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any):
+        super().init_poolmanager(*args, **kwargs)
+        self.stats.watch(self.poolmanager)
+
+    def send(self, request: requests.PreparedRequest, timeout: Optional[Timeout] = None, **kwargs: Any) -> requests.Response:
+        if timeout is None:
+            timeout = self.transport_config.timeout
+        response = super().send(request, timeout=timeout, **kwargs)
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None and retries.history:
+            self.stats.add_retries(len(retries.history))
+        return response
+
+
+def create_session(config: Optional[TransportConfig] = None, stats: Optional[TransportStats] = None) -> requests.Session:
+    """Session using a `PortalAdapter` for http and https."""
+    adapter = PortalAdapter(config or TransportConfig(), stats or TransportStats())
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,10 @@
+import pytest
+
+from erfassinator.mock_portal import MockPortalConfig, MockPortalServer
+
+
+@pytest.fixture
+def server():
+    """A mock portal with 50 open reports on a free port."""
+    with MockPortalServer(MockPortalConfig(entries=50)) as server:
+        yield server
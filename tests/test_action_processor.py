@@ -0,0 +1,41 @@
+import threading
+import time
+
+from erfassinator.action_processor import ActionProcessor
+
+
+class _CountingBackend:
+    """Backend recording the peak of concurrent `apply_action` calls."""
+
+    url = "http://counting.invalid"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def apply_action(self, entry_id: int) -> bool:
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return True
+
+
+def test_processors_share_one_cap_per_host():
+    backend = _CountingBackend()
+    processors = [
+        ActionProcessor(backend, max_workers=8, max_per_host=limit) for limit in (3, 5)
+    ]
+    threads = [
+        threading.Thread(target=processor.process_ids, args=(list(range(40)),))
+        for processor in processors
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert backend.peak == 3
@@ -0,0 +1,38 @@
+import asyncio
+
+from erfassinator.async_backend import AsyncFWPortalBackend
+from erfassinator.backend import FWPortalBackend
+
+FIRST_ID = 100000
+
+
+def test_cached_token_recovers_after_rotation(server):
+    backend = FWPortalBackend(url=server.url)
+    assert backend.login("admin", "admin")
+    assert backend.apply_action(FIRST_ID)
+    stale = backend.verification_cache.get(backend._session_key)
+
+    server.portal.rotate_tokens()
+
+    assert backend.apply_action(FIRST_ID + 1)
+    assert backend.apply_action(FIRST_ID + 2)
+    assert backend.verification_cache.get(backend._session_key) not in (None, stale)
+
+
+def test_cached_token_recovers_after_rotation_async(server):
+    async def run():
+        backend = AsyncFWPortalBackend(url=server.url)
+        try:
+            assert await backend.login("admin", "admin")
+            assert await backend.apply_action(FIRST_ID)
+            stale = backend.verification_cache.get(backend._session_key)
+
+            server.portal.rotate_tokens()
+
+            assert await backend.apply_action(FIRST_ID + 1)
+            assert await backend.apply_action(FIRST_ID + 2)
+            assert backend.verification_cache.get(backend._session_key) not in (None, stale)
+        finally:
+            await backend.logout()
+
+    asyncio.run(run())
@@ -0,0 +1,59 @@
+import threading
+
+from erfassinator.concurrency import AdaptiveLimiter
+
+
+def _complete_window(limiter: AdaptiveLimiter, latency: float, success: bool = True):
+    """Run one evaluation window of actions, as many at once as allowed."""
+    remaining = max(limiter.limit, limiter.min_window)
+    while remaining:
+        tickets = []
+        while remaining and (ticket := limiter.try_acquire()) is not None:
+            tickets.append(ticket)
+            remaining -= 1
+        for ticket in tickets:
+            limiter.release(ticket, latency, success)
+
+
+def test_window_bounds_slots():
+    limiter = AdaptiveLimiter(initial=2)
+    first, second = limiter.try_acquire(), limiter.try_acquire()
+    assert None not in (first, second)
+    assert limiter.try_acquire() is None
+
+    limiter.cancel(first)
+    assert limiter.try_acquire() is not None
+
+
+def test_healthy_windows_grow_and_throttling_halves():
+    limiter = AdaptiveLimiter(initial=2, maximum=8, min_window=4)
+    for _ in range(4):
+        _complete_window(limiter, 0.01)
+    assert limiter.limit == 6
+
+    ticket = limiter.acquire()
+    limiter.release(ticket, 0.01, False, throttled=True)
+    assert limiter.limit == 3
+    assert limiter.decisions()[-1].reason.startswith("Portal überlastet")
+
+
+def test_throttling_of_earlier_actions_decreases_once():
+    limiter = AdaptiveLimiter(initial=8, maximum=8)
+    tickets = [limiter.acquire() for _ in range(4)]
+    for ticket in tickets:
+        limiter.release(ticket, 0.01, False, throttled=True)
+    assert limiter.limit == 4
+
+
+def test_cancel_wakes_a_waiting_acquire():
+    limiter = AdaptiveLimiter(initial=1)
+    ticket = limiter.acquire()
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    waiter.start()
+    assert not acquired.wait(0.05)
+
+    limiter.cancel(ticket)
+
+    assert acquired.wait(1)
+    waiter.join()
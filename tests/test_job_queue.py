@@ -0,0 +1,134 @@
+import threading
+import time
+
+from erfassinator.action_processor import ActionProcessor
+from erfassinator.async_backend import AsyncFWPortalBackend
+from erfassinator.background import BackgroundLoop
+from erfassinator.job_queue import CANCELLED, PRIORITY_SELECTION, JobQueue
+from erfassinator.synthetic_backend import SyntheticBackend, SyntheticConfig
+
+FIRST_ID = 100000
+
+
+def _synthetic_queue(workers: int = 2, **config) -> tuple[SyntheticBackend, JobQueue]:
+    """A queue on a logged in synthetic backend."""
+    backend = SyntheticBackend(SyntheticConfig(entries=100, latency=0.002, **config))
+    assert backend.login("test", "")
+    processor = ActionProcessor(backend, max_workers=2, needs_action=lambda entry: True)
+    return backend, JobQueue(processor, workers)
+
+
+def _ids(count: int, offset: int = 0) -> list[int]:
+    return list(range(FIRST_ID + offset, FIRST_ID + offset + count))
+
+
+def test_paused_queue_starts_nothing_until_resumed():
+    _, queue = _synthetic_queue()
+    queue.pause()
+    job = queue.submit(_ids(10))
+    time.sleep(0.05)
+    assert job.completed == 0
+    assert len(job.pending) == 10
+
+    queue.resume()
+
+    assert job.finished.wait(5)
+    assert job.completed == 10
+    assert not queue.busy
+
+
+def test_entries_are_queued_once():
+    # One worker, so entries start in the order they are taken
+    _, queue = _synthetic_queue(workers=1)
+    queue.pause()
+    first = queue.submit(_ids(10))
+    again = queue.submit(_ids(10))
+    urgent = queue.submit(_ids(3, offset=5), PRIORITY_SELECTION)
+
+    # Already queued at the same priority: ignored
+    assert again.total == 0 and again.finished.is_set()
+    # A more urgent job takes the entries over
+    assert urgent.total == 3
+    assert first.total == 7
+    assert list(first.pending) == _ids(5) + _ids(2, offset=8)
+
+    started = []
+    run_entry = queue.run_entry
+    queue.run_entry = lambda entry_id, ticket: started.append(entry_id) or run_entry(entry_id, ticket)
+    queue.resume()
+    assert first.finished.wait(5) and urgent.finished.wait(5)
+    assert sorted(started) == _ids(10)
+    assert started[:3] == _ids(3, offset=5)
+
+
+def test_cancel_drops_waiting_entries():
+    _, queue = _synthetic_queue()
+    queue.pause()
+    job = queue.submit(_ids(10))
+
+    queue.cancel(job)
+
+    assert job.finished.wait(1)
+    assert job.state == CANCELLED
+    assert job.completed == 0
+    assert not queue.busy
+
+
+def test_expired_session_pauses_and_keeps_the_entry():
+    backend, queue = _synthetic_queue(expiry_rate=1.0, relogin_failure_rate=1.0)
+    expired = []
+    queue.expired_callback = lambda: expired.append(True)
+    job = queue.submit(_ids(5))
+
+    deadline = time.monotonic() + 5
+    while not queue.paused and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    assert queue.session_expired and expired == [True]
+    assert job.completed == 0
+    assert sorted(job.pending) == _ids(5)
+
+    # A new login renews the session; the queue continues where it stopped
+    backend.config.expiry_rate = 0.0
+    assert backend.login("test", "")
+    queue.resume()
+
+    assert job.finished.wait(5)
+    assert all(success for success, _ in job.results.values())
+    assert job.completed == 5
+
+
+def _queue_threads() -> int:
+    return sum(1 for thread in threading.enumerate() if thread.name == "erfassinator-jobs")
+
+
+def test_started_entries_run_without_a_thread_each(server):
+    server.portal.configure(latency=0.05)
+    background = BackgroundLoop()
+    backend = AsyncFWPortalBackend(url=server.url)
+    try:
+        assert background.submit(backend.login, "admin", "admin").result()
+        processor = ActionProcessor(backend, max_workers=16, needs_action=lambda entry: True)
+        peak = []
+        queue = JobQueue(
+            processor,
+            start_entry=lambda entry_id, ticket: background.submit(
+                processor.process_entry_async, entry_id, ticket
+            ),
+            progress_callback=lambda done, total: peak.append(_queue_threads()),
+        )
+
+        start = time.perf_counter()
+        job = queue.submit(range(FIRST_ID, FIRST_ID + 40))
+        assert job.finished.wait(10)
+        elapsed = time.perf_counter() - start
+
+        assert job.completed == 40
+        assert all(success for success, _ in job.results.values())
+        assert max(peak) == 1
+        # One after another the 40 requests would take at least 2 s
+        assert elapsed < 1.0
+    finally:
+        background.submit(backend.logout).result()
+        background.stop()
@@ -0,0 +1,32 @@
+from erfassinator.journal import ActionJournal
+
+
+def test_interrupted_run_resumes_failed_and_open_entries(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = ActionJournal(path, account="wehr")
+    journal.start_run([1, 2, 3, 4])
+    journal.record(1, (True, "ok"))
+    journal.record(2, (False, "Error: HTTP 503"))
+    # Interrupted: no finish marker
+
+    reopened = ActionJournal(path, account="wehr")
+    run = reopened.interrupted_run()
+
+    assert run is not None
+    assert run.remaining == [2, 3, 4]
+    assert reopened.pending([1, 2, 3, 4]) == [2, 3, 4]
+    assert ActionJournal(path, account="andere").interrupted_run() is None
+
+
+def test_finished_run_is_not_offered_again(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = ActionJournal(path)
+    journal.start_run([1, 2])
+    journal.extend_run([3])
+    for entry_id in (1, 2, 3):
+        journal.record(entry_id, (True, "ok"))
+    journal.finish_run()
+
+    reopened = ActionJournal(path)
+    assert reopened.interrupted_run() is None
+    assert reopened.completed_ids() == {1, 2, 3}
@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from erfassinator.async_backend import AsyncFWPortalBackend
+from erfassinator.backend import FWPortalBackend, SessionExpiredError
+
+FIRST_ID = 100000
+WORKERS = 8
+
+
+def _outcome(call):
+    try:
+        return call()
+    except SessionExpiredError as e:
+        return str(e)
+
+
+def test_workers_share_one_relogin(server):
+    backend = FWPortalBackend(url=server.url)
+    assert backend.login("admin", "admin")
+    server.portal.configure(latency=0.02)
+    server.portal.expire_sessions()
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        results = list(pool.map(backend.apply_action, range(FIRST_ID, FIRST_ID + WORKERS)))
+
+    assert results == [True] * WORKERS
+    assert backend.relogins == 1
+
+
+def test_failed_relogin_opens_breaker_for_waiting_workers(server):
+    backend = FWPortalBackend(url=server.url)
+    assert backend.login("admin", "admin")
+    server.portal.configure(latency=0.02, password="changed")
+    server.portal.expire_sessions()
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        messages = list(
+            pool.map(
+                lambda entry_id: _outcome(lambda: backend.apply_action(entry_id)),
+                range(FIRST_ID, FIRST_ID + WORKERS),
+            )
+        )
+
+    assert messages.count("Session expired, re-login rejected") == 1
+    assert messages.count("Session expired, re-login failed recently") == WORKERS - 1
+    assert server.portal.request_counts["POST /account/logon"] == 2
+    assert backend.relogin_breaker.state == "open"
+
+
+@pytest.mark.parametrize("password, relogins", [("admin", 1), ("changed", 0)])
+def test_async_relogin(server, password, relogins):
+    async def run():
+        backend = AsyncFWPortalBackend(url=server.url)
+        try:
+            assert await backend.login("admin", "admin")
+            server.portal.configure(latency=0.02, password=password)
+            server.portal.expire_sessions()
+
+            async def attempt(entry_id):
+                try:
+                    return await backend.apply_action(entry_id)
+                except SessionExpiredError as e:
+                    return str(e)
+
+            results = await asyncio.gather(
+                *(attempt(entry_id) for entry_id in range(FIRST_ID, FIRST_ID + WORKERS))
+            )
+            return results, backend.relogins
+        finally:
+            await backend.logout()
+
+    results, count = asyncio.run(run())
+    assert count == relogins
+    if relogins:
+        assert results == [True] * WORKERS
+    else:
+        assert results.count("Session expired, re-login rejected") == 1
+        assert results.count("Session expired, re-login failed recently") == WORKERS - 1
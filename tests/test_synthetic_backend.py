@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from erfassinator.action_processor import ActionProcessor
+from erfassinator.backend import SessionExpiredError
+from erfassinator.synthetic_backend import SyntheticBackend, SyntheticConfig
+
+FIRST_ID = 100000
+
+
+def _backend(**config) -> SyntheticBackend:
+    backend = SyntheticBackend(SyntheticConfig(entries=200, latency=0.001, **config))
+    assert backend.login("test", "")
+    return backend
+
+
+def test_expiries_are_recovered_by_shared_relogins():
+    backend = _backend(expiry_rate=0.05)
+    processor = ActionProcessor(backend, max_workers=8, needs_action=lambda entry: True)
+
+    results = processor.process_ids(list(range(FIRST_ID, FIRST_ID + 200)))
+
+    assert all(success for success, _ in results.values())
+    # One per expiry, not one per worker that noticed it
+    assert 0 < backend.relogins < 40
+
+
+def test_failed_relogin_opens_breaker():
+    backend = _backend(expiry_rate=1.0, relogin_failure_rate=1.0)
+
+    def attempt(entry_id: int) -> str:
+        try:
+            backend.apply_action(entry_id)
+        except SessionExpiredError as e:
+            return str(e)
+        return "applied"
+
+    with ThreadPoolExecutor(8) as pool:
+        messages = list(pool.map(attempt, range(FIRST_ID, FIRST_ID + 8)))
+
+    assert messages.count("Session expired, re-login rejected") == 1
+    assert messages.count("Session expired, re-login failed recently") == 7
+    assert backend.relogin_breaker.state == "open"
+    assert backend.relogins == 0
+
+
+def test_login_closes_breaker_again():
+    backend = _backend(expiry_rate=1.0, relogin_failure_rate=1.0)
+    try:
+        backend.apply_action(FIRST_ID)
+    except SessionExpiredError:
+        pass
+    backend.config.expiry_rate = 0.0
+
+    assert backend.login("test", "")
+    assert backend.relogin_breaker.state == "closed"
+    assert backend.apply_action(FIRST_ID)